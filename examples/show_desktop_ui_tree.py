@@ -1,9 +1,5 @@
 #!/usr/bin/env python3
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 
 from open_alo_core import UnifiedRemoteDesktop, WindowManager
 
@@ -17,6 +13,8 @@ with UnifiedRemoteDesktop() as remote:
     print(f"Screen Size: {remote.get_screen_size()}")
     print(f"\nTotal Windows: {len(windows)}\n")
 
+    # Build the whole listing and write it once instead of print() per line
+    out = []
     for i, win in enumerate(windows, 1):
         frame = wm.get_frame_rect(win.id) or {}
         x = frame.get("x", win.x)
@@ -24,10 +22,13 @@ with UnifiedRemoteDesktop() as remote:
         width = frame.get("width", win.width)
         height = frame.get("height", win.height)
 
-        print(f"{i}. {win.title}")
-        print(f"   ID: {win.id}")
-        print(f"   App: {win.wm_class}")
-        print(f"   Position: ({x}, {y})")
-        print(f"   Size: {width}x{height}")
-        print(f"   Workspace: {win.workspace}")
-        print()
+        out.append(
+            f"{i}. {win.title}\n"
+            f"   ID: {win.id}\n"
+            f"   App: {win.wm_class}\n"
+            f"   Position: ({x}, {y})\n"
+            f"   Size: {width}x{height}\n"
+            f"   Workspace: {win.workspace}\n"
+            f"\n"
+        )
+    sys.stdout.write("".join(out))
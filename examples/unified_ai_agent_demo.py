@@ -23,9 +23,6 @@ import sys
 import time
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from open_alo_core import UnifiedRemoteDesktop, WindowManager, Point
 
 
@@ -55,16 +52,25 @@ def main():
         print(f"✅ Screen size: {width}x{height}")
         print()
 
+        # One capture buffer for the whole session, reused by every frame
+        frame_buf = bytearray(width * height * 4)
+
         # Step 3: Take a screenshot
         print("Step 3: Capturing screenshot...")
-        screenshot_data = remote.capture_screenshot()
-        if screenshot_data:
-            output_path = Path("/tmp/unified_screenshot.png")
-            output_path.write_bytes(screenshot_data)
-            print(f"✅ Screenshot saved to: {output_path}")
-            print(f"   Size: {len(screenshot_data):,} bytes")
-        else:
-            print("❌ Failed to capture screenshot")
+        output_path = Path("/tmp/unified_screenshot.jpg")
+        remote.capture_screenshot_to_file(output_path)
+        print(f"✅ Screenshot saved to: {output_path}")
+        print(f"   Size: {output_path.stat().st_size:,} bytes")
+
+        # The PipeWire stream and pipeline stay up for the whole session,
+        # so repeated captures only pay for pulling + encoding a frame
+        frame_count = 30
+        start = time.perf_counter()
+        for _ in range(frame_count):
+            remote.capture_screenshot_into(frame_buf)
+        elapsed = time.perf_counter() - start
+        print(f"   Capture rate: {frame_count / elapsed:.1f} FPS "
+              f"({frame_count} frames in {elapsed:.2f}s)")
         print()
 
         # Step 4: Window management
@@ -88,9 +94,10 @@ def main():
         if editor:
             print(f"✅ Found: {editor.title}")
             print(f"   Activating window...")
-            wm.activate(editor.id)
-            time.sleep(0.5)
-            print("✅ Window activated")
+            if wm.activate(editor.id, wait=True):
+                print("✅ Window activated")
+            else:
+                print("⚠️  Window did not take focus in time")
             print()
 
             # Step 6: Type text
@@ -126,12 +133,12 @@ def main():
 
         # Step 9: Real-time frame capture
         print("Step 9: Capturing real-time frame...")
-        frame_data = remote.get_frame()
-        if frame_data:
-            frame_path = Path("/tmp/unified_frame.png")
-            frame_path.write_bytes(frame_data)
+        frame_size = remote.get_frame_into(frame_buf)
+        if frame_size:
+            frame_path = Path("/tmp/unified_frame.jpg")
+            frame_path.write_bytes(memoryview(frame_buf)[:frame_size])
             print(f"✅ Frame captured: {frame_path}")
-            print(f"   Size: {len(frame_data):,} bytes")
+            print(f"   Size: {frame_size:,} bytes")
         else:
             print("❌ Failed to capture frame")
         print()
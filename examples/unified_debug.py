@@ -7,8 +7,6 @@ import sys
 import traceback
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "open_alo_core" / "src"))
-
 from open_alo_core import UnifiedRemoteDesktop, Point
 
 
@@ -48,7 +46,7 @@ def main():
             try:
                 screenshot = remote.capture_screenshot()
                 if screenshot:
-                    path = Path("/tmp/test_screenshot.png")
+                    path = Path("/tmp/test_screenshot.jpg")
                     path.write_bytes(screenshot)
                     print(f"Screenshot: {path}")
             except Exception as e:
@@ -10,8 +10,6 @@ Shows basic screenshot + input in ~20 lines.
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from open_alo_core import UnifiedRemoteDesktop, Point
 
 
@@ -30,12 +28,10 @@ def main():
             width, height = remote.get_screen_size()
             print(f"Screen: {width}x{height}")
 
-            # Take screenshot
-            screenshot = remote.capture_screenshot()
-            if screenshot:
-                path = Path("/tmp/test_screenshot.png")
-                path.write_bytes(screenshot)
-                print(f"Screenshot: {path}")
+            # Take screenshot, encoded straight into the file
+            path = Path("/tmp/test_screenshot.jpg")
+            remote.capture_screenshot_to_file(path)
+            print(f"Screenshot: {path}")
 
             # Type some text
             remote.type_text("Hello from unified demo!\n")
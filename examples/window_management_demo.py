@@ -10,12 +10,8 @@ Demonstrates all window management capabilities:
 - Workspace management
 """
 import sys
-import os
 import time
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'open_alo_core', 'src'))
-
 from open_alo_core import WindowManager, WindowInfo, activate_window, get_focused_window
 
 def main():
@@ -59,13 +55,10 @@ def main():
 
     # Try to find common applications
     search_terms = ["text-editor", "nautilus", "terminal", "code", "brave"]
-    found_windows = []
+    found_windows = wm.find_any(search_terms)
 
-    for term in search_terms:
-        win = wm.find_window(term)
-        if win:
-            found_windows.append(win)
-            print(f"   ✓ Found: {win.wm_class} - {win.title[:40]}")
+    for win in found_windows:
+        print(f"   ✓ Found: {win.wm_class} - {win.title[:40]}")
 
     if not found_windows:
         print("   No common apps found. Using first window...")
@@ -118,6 +111,13 @@ def main():
 
         # print("   Resizing to 800x600...")
         # wm.resize(demo_window.id, 800, 600)
+
+        # Independent operations can be dispatched together in one batch
+        # (uncomment to tile the found windows side by side)
+        # with wm.batch() as results:
+        #     for i, win in enumerate(found_windows[:2]):
+        #         wm.move_resize(win.id, i * 960, 0, 960, 1080)
+        # print(f"   Tiled {sum(results)} windows")
         print()
 
     # 8. Convenience functions
@@ -142,6 +142,7 @@ def main():
         "Listing & Search:",
         "  • list_windows(current_workspace_only=False)",
         "  • find_window(query, match_title=True)",
+        "  • find_any(terms, match_title=True)",
         "  • find_all_windows(query, match_title=True)",
         "  • get_focused_window()",
         "  • get_details(window_id)",
@@ -164,6 +165,9 @@ def main():
         "",
         "Workspace:",
         "  • move_to_workspace(window_id, workspace_num)",
+        "",
+        "Batching:",
+        "  • with batch() as results: ...",
     ]
     for line in methods:
         print(f"   {line}")
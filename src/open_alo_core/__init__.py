@@ -15,10 +15,12 @@ __all__ = [
     "WaylandInput",
     "WaylandCapture",
     "UnifiedRemoteDesktop",  # Recommended for AI agents
+    "PortalSession",
     "find_window",
 
     # Window management (new)
     "WindowManager",
+    "AsyncWindowManager",
     "WindowInfo",
     "WindowType",
     "FrameType",
@@ -28,6 +30,7 @@ __all__ = [
     "Point",
     "Size",
     "Rect",
+    "InputEvent",
 
     # Constants
     "BUTTON_LEFT",
@@ -52,11 +55,6 @@ __all__ = [
     "normalize_key",
 ]
 
-# Core classes
-from .wayland.input import WaylandInput
-from .wayland.capture import WaylandCapture
-from .wayland.unified import UnifiedRemoteDesktop
-
 # Window management (legacy from old window.py)
 from .window import activate_window as _old_activate_window
 from .window import list_windows as _old_list_windows
@@ -65,6 +63,7 @@ from .window import find_window as _old_find_window
 # Window management (new comprehensive API)
 from .window_manager import (
     WindowManager,
+    AsyncWindowManager,
     WindowInfo,
     WindowType,
     FrameType,
@@ -75,7 +74,7 @@ from .window_manager import (
 )
 
 # Types
-from .types import Point, Size, Rect, BUTTON_LEFT, BUTTON_MIDDLE, BUTTON_RIGHT, normalize_key
+from .types import Point, Size, Rect, InputEvent, BUTTON_LEFT, BUTTON_MIDDLE, BUTTON_RIGHT, normalize_key
 
 # Exceptions
 from .exceptions import (
@@ -87,5 +86,30 @@ from .exceptions import (
     BackendNotAvailable,
 )
 
-# Utilities
-from .utils import detect_session_type, is_wayland, is_portal_available, is_pipewire_available
+# Core classes and utilities are imported on first access (PEP 562), so
+# "from open_alo_core import Point" does not load gi/GStreamer typelibs
+_LAZY_ATTRS = {
+    "WaylandInput": ".wayland.input",
+    "WaylandCapture": ".wayland.capture",
+    "UnifiedRemoteDesktop": ".wayland.unified",
+    "PortalSession": ".wayland.portal",
+    "detect_session_type": ".utils",
+    "is_wayland": ".utils",
+    "is_portal_available": ".utils",
+    "is_pipewire_available": ".utils",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
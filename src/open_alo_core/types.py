@@ -4,7 +4,9 @@ Simple type definitions for open_alo_core
 Using NamedTuple for zero-overhead immutable types.
 """
 
-from typing import NamedTuple
+import sys
+from functools import lru_cache
+from typing import Iterable, Literal, NamedTuple, Tuple
 
 
 class Point(NamedTuple):
@@ -57,10 +59,68 @@ class Rect(NamedTuple):
             and self.y <= point.y <= self.y + self.height
         )
     
+    def contains_batch(self, points):
+        """
+        Check many points at once (requires numpy)
+
+        Args:
+            points: Array-like of shape (N, 2) with x, y columns
+
+        Returns:
+            Boolean numpy array of shape (N,)
+        """
+        import numpy as np
+
+        pts = np.asarray(points).reshape(-1, 2)
+        xs, ys = pts[:, 0], pts[:, 1]
+        return (
+            (self.x <= xs) & (xs <= self.x + self.width)
+            & (self.y <= ys) & (ys <= self.y + self.height)
+        )
+
     def __repr__(self) -> str:
         return f"Rect({self.x}, {self.y}, {self.width}, {self.height})"
 
 
+def contains_any(rects: Iterable, point: Point):
+    """
+    Hit-test one point against many rectangles (requires numpy)
+
+    Works with anything exposing x, y, width and height (Rect, WindowInfo).
+    Comparisons run vectorized over all rectangles instead of one Python
+    call per rectangle.
+
+    Args:
+        rects: Rectangles to test
+        point: Screen coordinates
+
+    Returns:
+        Boolean numpy array, True where the rectangle contains the point
+
+    Example:
+        >>> hits = contains_any(windows, cursor)
+        >>> under_cursor = [w for w, hit in zip(windows, hits) if hit]
+    """
+    import numpy as np
+
+    rects = list(rects)
+    a = np.fromiter(
+        (v for r in rects for v in (r.x, r.y, r.width, r.height)),
+        dtype=np.int64,
+        count=4 * len(rects),
+    ).reshape(-1, 4)
+    x, y = point.x, point.y
+    return (
+        (a[:, 0] <= x) & (x <= a[:, 0] + a[:, 2])
+        & (a[:, 1] <= y) & (y <= a[:, 1] + a[:, 3])
+    )
+
+
+# Input event for WaylandInput.replay():
+#   ("move", (x, y)), ("btn", (button, pressed)), ("key", (key, pressed)),
+#   ("sleep", (seconds,))
+InputEvent = Tuple[Literal['move', 'btn', 'key', 'sleep'], tuple]
+
 # Mouse button constants
 BUTTON_LEFT = 1
 BUTTON_MIDDLE = 2
@@ -96,7 +156,14 @@ KEY_ALIASES = {
     'command': 'Super',
 }
 
+# Intern canonical names so comparisons downstream are identity checks
+KEY_ALIASES = {alias: sys.intern(name) for alias, name in KEY_ALIASES.items()}
+
+# Already-canonical names skip the lower() + lookup in normalize_key
+_NORMALIZED_KEYS = frozenset(KEY_ALIASES.values())
+
 
+@lru_cache(maxsize=512)
 def normalize_key(key: str) -> str:
     """
     Normalize key name to standard form.
@@ -109,4 +176,6 @@ def normalize_key(key: str) -> str:
         >>> normalize_key("Return")  # Already normalized
         'Return'
     """
+    if key in _NORMALIZED_KEYS:
+        return key
     return KEY_ALIASES.get(key.lower(), key)
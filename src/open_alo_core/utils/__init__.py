@@ -3,6 +3,8 @@ Utility functions for open_alo_core
 """
 
 import os
+import stat
+from functools import lru_cache
 from typing import Literal, Optional
 
 
@@ -44,11 +46,14 @@ def is_wayland() -> bool:
     return os.environ.get("WAYLAND_DISPLAY") is not None
 
 
+@lru_cache(maxsize=1)
 def is_portal_available() -> bool:
     """
     Check if XDG Desktop Portal is available.
     
-    This checks if the portal service is running.
+    This checks if the portal service is running, or can be started
+    on demand by D-Bus activation. The result is cached for the
+    lifetime of the process.
     
     Returns:
         True if portal is available
@@ -57,48 +62,57 @@ def is_portal_available() -> bool:
         >>> if not is_portal_available():
         ...     print("Portal not available, cannot initialize")
     """
+    portal_name = 'org.freedesktop.portal.Desktop'
     try:
         import gi
         gi.require_version('Gio', '2.0')
-        from gi.repository import Gio
+        from gi.repository import Gio, GLib
         
         bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-        proxy = Gio.DBusProxy.new_sync(
-            bus,
-            Gio.DBusProxyFlags.NONE,
-            None,
-            'org.freedesktop.portal.Desktop',
-            '/org/freedesktop/portal/desktop',
-            'org.freedesktop.DBus.Introspectable',
-            None
-        )
-        # Try to introspect
-        result = proxy.call_sync(
-            'Introspect',
-            None,
-            Gio.DBusCallFlags.NONE,
-            1000,
-            None
-        )
-        return result is not None
+        
+        def bus_call(method, params, reply_type):
+            return bus.call_sync(
+                'org.freedesktop.DBus',
+                '/org/freedesktop/DBus',
+                'org.freedesktop.DBus',
+                method,
+                params,
+                GLib.VariantType(reply_type),
+                Gio.DBusCallFlags.NONE,
+                1000,
+                None
+            ).unpack()[0]
+        
+        if bus_call('NameHasOwner', GLib.Variant('(s)', (portal_name,)), '(b)'):
+            return True
+        # Not running yet - the portal is usually D-Bus activated
+        return portal_name in bus_call('ListActivatableNames', None, '(as)')
     except Exception:
         return False
 
 
+@lru_cache(maxsize=1)
 def is_pipewire_available() -> bool:
     """
     Check if PipeWire is available for screen capture.
     
+    Looks for the PipeWire daemon's socket (no subprocess, no D-Bus).
+    The result is cached for the lifetime of the process.
+    
     Returns:
         True if PipeWire is running
     """
+    remote = os.environ.get("PIPEWIRE_REMOTE", "pipewire-0")
+    if os.path.isabs(remote):
+        socket_path = remote
+    else:
+        runtime_dir = (os.environ.get("PIPEWIRE_RUNTIME_DIR")
+                       or os.environ.get("XDG_RUNTIME_DIR"))
+        if not runtime_dir:
+            return False
+        socket_path = os.path.join(runtime_dir, remote)
+
     try:
-        import subprocess
-        result = subprocess.run(
-            ['pw-cli', 'info'],
-            capture_output=True,
-            timeout=2
-        )
-        return result.returncode == 0
-    except Exception:
+        return stat.S_ISSOCK(os.stat(socket_path).st_mode)
+    except OSError:
         return False
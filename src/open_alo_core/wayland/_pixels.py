@@ -0,0 +1,215 @@
+"""
+Raw frame helpers shared by the capture backends
+
+Frames come out of the GStreamer pipelines as packed rows, either RGB
+(possibly padded to a 4-byte row stride) or BGRx, the layout PipeWire
+produces natively. These helpers read the frame geometry, expose the
+pixels as a numpy view, swap channels when RGB is really needed and
+encode them when an image file is actually needed. numpy and GdkPixbuf
+are only imported on use, and GStreamer only for type checking, so the
+pixel helpers run without PyGObject.
+"""
+
+from typing import TYPE_CHECKING, List, Tuple
+
+from ..exceptions import CaptureError
+
+if TYPE_CHECKING:
+    from gi.repository import Gst
+
+def sample_geometry(sample: "Gst.Sample") -> Tuple[int, int, str]:
+    """
+    Read the frame size and pixel format from a sample's caps
+
+    Returns:
+        (width, height, format) e.g. (1920, 1080, 'RGB')
+    """
+    caps = sample.get_caps()
+    if caps is None:
+        raise CaptureError("Sample has no caps")
+
+    struct = caps.get_structure(0)
+    width = struct.get_int("width")[1]
+    height = struct.get_int("height")[1]
+    return width, height, struct.get_string("format")
+
+
+def as_array(data, width: int, height: int, stride: int, channels: int = 3,
+             owner=None):
+    """
+    View raw frame memory as a (height, width, channels) uint8 array
+
+    No pixels are copied; row padding is skipped with a strided view.
+
+    Args:
+        owner: Object the array keeps alive (e.g. whatever keeps ``data``
+            mapped); None = only ``data`` itself
+
+    Raises:
+        ImportError: numpy is not installed (pip install open-alo-core[numpy])
+    """
+    import numpy as np
+
+    rows = np.frombuffer(data, dtype=np.uint8, count=stride * height)
+    if owner is not None:
+        rows = np.asarray(_Pinned(rows, owner))
+    rows = rows.reshape(height, stride)
+    return rows[:, :width * channels].reshape(height, width, channels)
+
+
+class _Pinned:
+    """Array interface of ``array`` that also holds a reference to ``owner``"""
+
+    def __init__(self, array, owner):
+        self.__array_interface__ = array.__array_interface__
+        self.base = array
+        self.owner = owner
+
+
+def bgrx_to_rgb(data, width: int, height: int, stride: int) -> bytearray:
+    """
+    Repack BGRx (or BGRA) rows as tightly packed RGB
+
+    Returns:
+        RGB pixels with a row stride of ``width * 3``
+    """
+    row = width * 4
+    if stride != row:
+        data = b"".join(data[y * stride:y * stride + row] for y in range(height))
+    elif not isinstance(data, bytes) or len(data) != row * height:
+        data = bytes(data[:row * height])
+
+    # Extended-slice assignment runs in C, one pass per channel
+    rgb = bytearray(width * height * 3)
+    rgb[0::3] = data[2::4]
+    rgb[1::3] = data[1::4]
+    rgb[2::3] = data[0::4]
+    return rgb
+
+
+def bgrx_to_rgb_array(data, width: int, height: int, stride: int):
+    """
+    BGRx (or BGRA) rows as a new (height, width, 3) RGB numpy array
+
+    Uses a parallel numba kernel when numba is installed
+    (pip install open-alo-core[jit]), else bgrx_to_rgb().
+    """
+    import numpy as np
+
+    kernel = _numba_kernel()
+    if kernel is None:
+        rgb = bgrx_to_rgb(data, width, height, stride)
+        return as_array(rgb, width, height, width * 3, 3)
+
+    dst = np.empty((height, width, 3), dtype=np.uint8)
+    kernel(as_array(data, width, height, stride, 4), dst)
+    return dst
+
+
+_kernel = None
+
+
+def _numba_kernel():
+    """Compile the BGRx -> RGB kernel on first use; None without numba"""
+    global _kernel
+    if _kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _kernel = False
+        else:
+            def bgrx_to_rgb_kernel(src, dst):
+                # Rows in parallel; the inner loop is left to LLVM to vectorize
+                for y in prange(dst.shape[0]):
+                    for x in range(dst.shape[1]):
+                        dst[y, x, 0] = src[y, x, 2]
+                        dst[y, x, 1] = src[y, x, 1]
+                        dst[y, x, 2] = src[y, x, 0]
+
+            try:
+                _kernel = njit(parallel=True, cache=True)(bgrx_to_rgb_kernel)
+            except RuntimeError:
+                # No writable cache location; compile per process instead
+                _kernel = njit(parallel=True)(bgrx_to_rgb_kernel)
+    return _kernel or None
+
+
+def encode_bgrx(data, width: int, height: int, stride: int,
+                format: str, quality: int = 85) -> bytes:
+    """
+    Encode BGRx (or BGRA) rows as PNG or JPEG
+
+    Uses libspng (pyspng) for PNG and libjpeg-turbo (PyTurboJPEG) for
+    JPEG when installed (pip install open-alo-core[encoders]); otherwise
+    GdkPixbuf. libjpeg-turbo reads BGRx directly, skipping the RGB swap.
+
+    Args:
+        format: "png" or "jpeg"
+        quality: JPEG quality (0-100), ignored for PNG
+    """
+    if format == "jpeg":
+        turbo = _turbojpeg()
+        if turbo is not None:
+            import numpy as np
+            from turbojpeg import TJPF_BGRX
+            pixels = np.ascontiguousarray(as_array(data, width, height, stride, 4))
+            return turbo.encode(pixels, quality=int(quality), pixel_format=TJPF_BGRX)
+    elif format == "png":
+        try:
+            import pyspng
+        except ImportError:
+            pass
+        else:
+            rgb = bgrx_to_rgb_array(data, width, height, stride)
+            return pyspng.encode(rgb, compress_level=1)
+    else:
+        raise ValueError(f"Unsupported image format: {format!r} (use 'jpeg' or 'png')")
+
+    rgb = bgrx_to_rgb(data, width, height, stride)
+    if format == "jpeg":
+        return encode_rgb(rgb, width, height, width * 3, "jpeg", ["quality"], [str(int(quality))])
+    return encode_png(rgb, width, height, width * 3)
+
+
+_turbo = None
+
+
+def _turbojpeg():
+    """Shared TurboJPEG instance (loads libturbojpeg once); None if unavailable"""
+    global _turbo
+    if _turbo is None:
+        try:
+            from turbojpeg import TurboJPEG
+            _turbo = TurboJPEG()
+        except (ImportError, OSError, RuntimeError):
+            # Module missing, or the shared library could not be found
+            _turbo = False
+    return _turbo or None
+
+
+def encode_png(data, width: int, height: int, stride: int,
+               compression: int = 1) -> bytes:
+    """
+    Encode packed RGB rows as PNG
+
+    Uses a low zlib level by default: screenshots are mostly consumed once
+    and thrown away, so compression speed matters more than size.
+    """
+    return encode_rgb(data, width, height, stride, "png", ["compression"], [str(compression)])
+
+
+def encode_rgb(data, width: int, height: int, stride: int, format: str,
+               keys: List[str], values: List[str]) -> bytes:
+    """Encode packed RGB rows with GdkPixbuf"""
+    import gi
+    gi.require_version('GdkPixbuf', '2.0')
+    from gi.repository import GdkPixbuf, GLib
+
+    pixbuf = GdkPixbuf.Pixbuf.new_from_bytes(
+        GLib.Bytes.new(data), GdkPixbuf.Colorspace.RGB, False, 8,
+        width, height, stride
+    )
+    success, encoded = pixbuf.save_to_bufferv(format, keys, values)
+    if not success:
+        raise CaptureError(f"Failed to encode {format.upper()}")
+    return encoded
@@ -5,10 +5,8 @@ Provides native Wayland screenshot capability without X11 fallback.
 """
 
 import gi
-import time
 import uuid
-from typing import Optional, Tuple, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, Tuple, Dict, Any, Union
 
 # Require versions
 gi.require_version('Gst', '1.0')
@@ -18,20 +16,109 @@ gi.require_version('Gio', '2.0')
 from gi.repository import Gst, GLib, Gio
 
 from ..exceptions import CaptureError, PermissionDenied
+from . import _pixels
+from .portal import PortalSession
 
-# Initialize GStreamer
-Gst.init(None)
+
+def _ensure_gst() -> None:
+    """Initialize GStreamer on first use (loads the plugin registry)"""
+    if not Gst.is_initialized():
+        Gst.init(None)
 
 
-@dataclass
 class CaptureResult:
-    """Result of screen capture operation"""
-    data: bytes
-    source_type: str  # 'monitor', 'window', 'camera'
-    size: Tuple[int, int]
+    """
+    Result of screen capture operation
+    
+    Raw captures keep the frame's GStreamer buffer mapped: ``view`` and
+    ``pixels`` read it without copying, and ``data`` only copies it into
+    bytes when first accessed. The mapping is released by release() or
+    when the result is garbage collected, so keep the result alive while
+    using views of it.
+    """
+    
+    def __init__(self, data: Union[bytes, memoryview], source_type: str,
+                 size: Tuple[int, int], format: str = "png", width: int = 0,
+                 height: int = 0, stride: int = 0,
+                 mapping: Optional[Tuple[Gst.Buffer, Gst.MapInfo]] = None):
+        self._view: Optional[memoryview] = memoryview(data)
+        self._data: Optional[bytes] = data if isinstance(data, bytes) else None
+        # (buffer, mapinfo) backing ``_view`` for raw captures
+        self._mapping = mapping
+        
+        self.source_type = source_type  # 'monitor', 'window', 'camera'
+        self.size = size
+        self.format = format  # 'png', 'jpeg', 'h264' or 'raw' (BGRx rows, see stride)
+        self.width = width
+        self.height = height
+        self.stride = stride  # bytes per row of raw data (rows may be padded)
+    
+    @property
+    def data(self) -> bytes:
+        """Captured data as bytes (copied out of the frame buffer on first access)"""
+        if self._data is None:
+            self._data = bytes(self.view)
+        return self._data
+    
+    @property
+    def view(self) -> memoryview:
+        """Captured data without copying (valid until release())"""
+        if self._view is None:
+            raise CaptureError("Capture buffer has been released")
+        return self._view
+    
+    def release(self) -> None:
+        """
+        Unmap the frame buffer; ``data`` stays available if already accessed
+        
+        Raises:
+            BufferError: Other objects still export the buffer (e.g. an
+                array made with np.frombuffer(result.view))
+        """
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mapping is not None:
+            buffer, mapinfo = self._mapping
+            self._mapping = None
+            buffer.unmap(mapinfo)
+    
+    def __del__(self) -> None:
+        try:
+            self.release()
+        except Exception:
+            pass
+    
+    @property
+    def pixels(self):
+        """
+        Raw frame as a (height, width, 4) BGRx uint8 numpy array
+        
+        A view on the frame buffer (no copy), in the byte order PipeWire delivers
+        (OpenCV's BGR(A) order); the array keeps the buffer mapped while it
+        is alive. Only available for captures made with ``encode="raw"``;
+        requires numpy.
+        """
+        self._require_raw()
+        return _pixels.as_array(self.view, self.width, self.height, self.stride, 4, owner=self)
+    
+    def as_rgb(self):
+        """
+        Raw frame as a (height, width, 3) RGB uint8 numpy array (a copy)
+        
+        For consumers that need RGB order (PIL, most ML models). Uses a
+        numba kernel when numba is installed.
+        """
+        self._require_raw()
+        return _pixels.bgrx_to_rgb_array(self.view, self.width, self.height, self.stride)
+    
+    def _require_raw(self) -> None:
+        if self.format != "raw":
+            raise CaptureError(f"pixels needs a raw capture, got {self.format!r} (use encode='raw')")
     
     def __repr__(self) -> str:
-        return f"CaptureResult({len(self.data)} bytes, {self.source_type}, {self.size})"
+        size = len(self._data) if self._data is not None else self.view.nbytes
+        return f"CaptureResult({size} bytes, {self.format}, {self.source_type}, {self.size})"
 
 
 class WaylandCapture:
@@ -41,28 +128,65 @@ class WaylandCapture:
     Features:
     - Native Wayland capture (no X11)
     - Monitor/window/camera source selection
-    - PNG output
-    - User approval via portal
+    - PNG, JPEG or raw BGRx/RGB (numpy) output
+    - User approval via portal, once per stream
+    - Stream stays open between captures until close()
     
     Example:
         >>> with WaylandCapture() as capture:
         ...     result = capture.capture_screen()
         ...     Path("/tmp/shot.png").write_bytes(result.data)
+        ...     frames = [capture.capture_screen(encode="raw") for _ in range(10)]
     
     Note:
-        This creates a separate portal session from WaylandInput.
-        In a future version, these may share a session for better UX.
+        By default this creates its own ScreenCast session. Pass a started
+        PortalSession to share one session (and one permission dialog)
+        with WaylandInput.
     """
     
     PORTAL_BUS = "org.freedesktop.portal.Desktop"
     PORTAL_PATH = "/org/freedesktop/portal/desktop"
     PORTAL_IFACE = "org.freedesktop.portal.ScreenCast"
     
-    def __init__(self):
-        """Initialize capture controller"""
+    ENCODINGS = ("png", "jpeg", "h264", "raw")
+    
+    # VA-API H.264 encoders, preferred first: (encoder, postproc, keyframe-interval property)
+    H264_ENCODERS = (
+        ("vah264enc", "vapostproc", "key-int-max"),
+        ("vaapih264enc", "vaapipostproc", "keyframe-period"),
+    )
+    
+    # How long to wait for PipeWire to deliver a frame
+    FRAME_TIMEOUT = 10 * Gst.SECOND
+    
+    def __init__(self, session: Optional[PortalSession] = None):
+        """
+        Initialize capture controller
+        
+        Args:
+            session: Portal connection to use. If it has been start()ed,
+                its screen stream is captured instead of creating a new
+                session. None = the process-wide PortalSession.default()
+        """
+        _ensure_gst()
+        self._portal_session = session if session is not None else PortalSession.default()
+        # Own ScreenCast session (None when using a shared one)
         self._session_handle: Optional[str] = None
         self._bus: Optional[Gio.DBusConnection] = None
         self._portal: Optional[Gio.DBusProxy] = None
+        
+        # Capture stream, kept open between captures (see open())
+        self._pipeline: Optional[Gst.Pipeline] = None
+        self._appsink: Optional[Gst.Element] = None
+        self._stream_metadata: Dict[str, Any] = {}
+        self._node_id: Optional[int] = None
+        # Most recent frame; PipeWire only delivers new frames on damage
+        self._last_sample: Optional[Gst.Sample] = None
+        
+        # GPU encode pipeline for encode="h264", started on first use
+        self._h264_pipeline: Optional[Gst.Pipeline] = None
+        self._h264_appsink: Optional[Gst.Element] = None
+        self._last_h264_sample: Optional[Gst.Sample] = None
     
     def __enter__(self) -> "WaylandCapture":
         """Context manager entry"""
@@ -74,30 +198,64 @@ class WaylandCapture:
         return False
     
     def _ensure_dbus(self) -> None:
-        """Lazy initialization of D-Bus"""
+        """Lazy initialization of D-Bus (shared through the PortalSession)"""
         if self._bus is None:
-            self._bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-            self._portal = Gio.DBusProxy.new_sync(
-                self._bus,
-                Gio.DBusProxyFlags.NONE,
-                None,
-                self.PORTAL_BUS,
-                self.PORTAL_PATH,
-                self.PORTAL_IFACE,
-                None
-            )
+            self._bus = self._portal_session.bus
+            self._portal = self._portal_session.screencast
+    
+    def open(self) -> None:
+        """
+        Start the capture stream
+        
+        Creates the portal session (showing the permission dialog) and a
+        GStreamer pipeline on the PipeWire stream. Both stay open until
+        close(), so later captures only pull a frame. Called automatically
+        by the first capture_screen().
+        
+        Raises:
+            CaptureError: Stream could not be started
+            PermissionDenied: User denied permission
+        """
+        if self._pipeline is not None:
+            return
+        
+        self._ensure_dbus()
+        
+        shared = self._portal_session
+        if shared.active and shared.streams:
+            node_id, self._stream_metadata = shared.streams[0]
+            self._start_pipeline(node_id)
+            return
+        
+        try:
+            self._create_session()
+            self._select_sources()
+            node_id, self._stream_metadata = self._start_capture()
+            self._start_pipeline(node_id)
+        except Exception:
+            self.close()
+            raise
     
-    def capture_screen(self) -> CaptureResult:
+    def capture_screen(self, encode: str = "png", quality: int = 85) -> CaptureResult:
         """
         Capture the screen
         
-        This will show a permission dialog asking which screen/window
-        to capture. The user must approve for the capture to proceed.
+        The first capture shows a permission dialog asking which
+        screen/window to capture; the stream then stays open and later
+        captures reuse it until close().
+        
+        Args:
+            encode: "png" or "jpeg" for an encoded image, "raw" to skip
+                encoding and get the BGRx pixels (OCR, ML, hashing, ...),
+                or "h264" for a self-contained H.264 keyframe encoded on
+                the GPU (VA-API) straight from DMA-BUF memory
+            quality: JPEG quality (0-100), ignored otherwise
         
         Returns:
-            CaptureResult with PNG data and metadata
+            CaptureResult with PNG/JPEG/H.264 (or raw BGRx) data and metadata
         
         Raises:
+            ValueError: Unknown encode value
             CaptureError: Capture failed
             PermissionDenied: User denied permission
         
@@ -105,23 +263,32 @@ class WaylandCapture:
             >>> result = capture.capture_screen()
             >>> print(f"Captured {result.source_type}: {len(result.data)} bytes")
             >>> Path("/tmp/shot.png").write_bytes(result.data)
+            >>> pixels = capture.capture_screen(encode="raw").pixels
         """
-        self._ensure_dbus()
+        if encode not in self.ENCODINGS:
+            raise ValueError(f"Unsupported encoding: {encode!r} "
+                             f"(use 'png', 'jpeg', 'h264' or 'raw')")
         
         try:
-            # Step 1: Create session
-            self._create_session()
-            
-            # Step 2: Select sources
-            self._select_sources()
-            
-            # Step 3: Start capture and get PipeWire node
-            node_id, metadata = self._start_capture()
+            self.open()
             
-            # Step 4: Capture frame via GStreamer
-            frame_data = self._capture_frame(node_id)
+            mapping = None
+            if encode == "h264":
+                frame_data, width, height, stride = self._capture_h264_frame()
+            else:
+                frame_data, width, height, stride, mapping = self._capture_frame()
+            if encode in ("png", "jpeg"):
+                # Encode straight from the mapped buffer, then unmap
+                buffer, mapinfo = mapping
+                mapping = None
+                try:
+                    frame_data = _pixels.encode_bgrx(frame_data, width, height, stride,
+                                                     encode, quality)
+                finally:
+                    buffer.unmap(mapinfo)
             
             # Determine source type and size
+            metadata = self._stream_metadata
             source_type_id = metadata.get('source_type', 0)
             source_type = {1: 'monitor', 2: 'window', 3: 'camera'}.get(source_type_id, 'unknown')
             size = metadata.get('size', (0, 0))
@@ -129,16 +296,39 @@ class WaylandCapture:
             return CaptureResult(
                 data=frame_data,
                 source_type=source_type,
-                size=size
+                size=size,
+                format=encode,
+                width=width,
+                height=height,
+                stride=stride,
+                mapping=mapping
             )
             
         except Exception as e:
             raise CaptureError(f"Screen capture failed: {e}") from e
-        finally:
-            self.close()
+    
+    @classmethod
+    def h264_available(cls) -> bool:
+        """True if a VA-API H.264 encoder is installed (capture_screen(encode="h264"))"""
+        _ensure_gst()
+        return cls._h264_elements() is not None
     
     def close(self) -> None:
         """Release resources and close session"""
+        if self._h264_pipeline:
+            self._h264_pipeline.set_state(Gst.State.NULL)
+            self._h264_pipeline = None
+            self._h264_appsink = None
+        self._last_h264_sample = None
+        
+        if self._pipeline:
+            self._pipeline.set_state(Gst.State.NULL)
+            self._pipeline = None
+            self._appsink = None
+        self._last_sample = None
+        self._stream_metadata = {}
+        self._node_id = None
+        
         if self._session_handle and self._portal:
             try:
                 self._portal.call_sync(
@@ -155,147 +345,45 @@ class WaylandCapture:
     
     def _create_session(self) -> None:
         """Create ScreenCast portal session"""
-        loop = GLib.MainLoop()
-        session_handle: Optional[str] = None
-        error_code: int = -1
-        
-        token = uuid.uuid4().hex[:8]
-        options = {
-            'session_handle_token': GLib.Variant('s', f'cap_{token}'),
-            'handle_token': GLib.Variant('s', f'req_{token}')
-        }
-        
-        result = self._portal.call_sync(
-            'CreateSession',
-            GLib.Variant('(a{sv})', (options,)),
-            Gio.DBusCallFlags.NONE,
-            10000,
-            None
-        )
-        
-        request_path = result[0]
-        
-        def on_response(conn, sender, path, iface, signal, params):
-            nonlocal session_handle, error_code
-            error_code, results = params
-            if error_code == 0:
-                session_handle = str(results['session_handle'])
-            loop.quit()
-        
-        sub_id = self._bus.signal_subscribe(
-            self.PORTAL_BUS,
-            'org.freedesktop.portal.Request',
-            'Response',
-            request_path,
-            None,
-            Gio.DBusSignalFlags.NONE,
-            on_response
+        error_code, results = self._portal_session.request(
+            self._portal, 'CreateSession', '(a{sv})', (), {
+                'session_handle_token': GLib.Variant('s', f'cap_{uuid.uuid4().hex[:8]}')
+            },
+            timeout=15
         )
         
-        GLib.timeout_add_seconds(15, loop.quit)
-        loop.run()
-        self._bus.signal_unsubscribe(sub_id)
-        
-        if session_handle is None:
+        if error_code != 0:
             if error_code == 1:
                 raise PermissionDenied("User denied screen capture permission")
             else:
                 raise CaptureError(f"Failed to create session (code: {error_code})")
         
-        self._session_handle = session_handle
+        self._session_handle = str(results['session_handle'])
     
     def _select_sources(self) -> None:
         """Select capture sources"""
-        loop = GLib.MainLoop()
-        success = False
-        
-        token = uuid.uuid4().hex[:8]
-        options = {
-            'types': GLib.Variant('u', 1),  # MONITOR
-            'multiple': GLib.Variant('b', False),
-            'cursor_mode': GLib.Variant('u', 2),  # embedded
-            'handle_token': GLib.Variant('s', f'src_{token}')
-        }
-        
-        result = self._portal.call_sync(
-            'SelectSources',
-            GLib.Variant('(oa{sv})', (self._session_handle, options)),
-            Gio.DBusCallFlags.NONE,
-            10000,
-            None
-        )
-        
-        request_path = result[0]
-        
-        def on_response(conn, sender, path, iface, signal, params):
-            nonlocal success
-            error_code, _ = params
-            if error_code == 0:
-                success = True
-            loop.quit()
-        
-        sub_id = self._bus.signal_subscribe(
-            self.PORTAL_BUS,
-            'org.freedesktop.portal.Request',
-            'Response',
-            request_path,
-            None,
-            Gio.DBusSignalFlags.NONE,
-            on_response
+        error_code, _ = self._portal_session.request(
+            self._portal, 'SelectSources', '(oa{sv})', (self._session_handle,), {
+                'types': GLib.Variant('u', 1),  # MONITOR
+                'multiple': GLib.Variant('b', False),
+                'cursor_mode': GLib.Variant('u', 2),  # embedded
+            },
+            timeout=15
         )
         
-        GLib.timeout_add_seconds(15, loop.quit)
-        loop.run()
-        self._bus.signal_unsubscribe(sub_id)
-        
-        if not success:
+        if error_code != 0:
             raise PermissionDenied("User denied source selection")
     
     def _start_capture(self) -> Tuple[int, Dict[str, Any]]:
         """Start capture and get PipeWire node"""
-        loop = GLib.MainLoop()
-        stream_info = None
-        
-        token = uuid.uuid4().hex[:8]
-        options = {
-            'handle_token': GLib.Variant('s', f'start_{token}')
-        }
-        
-        result = self._portal.call_sync(
-            'Start',
-            GLib.Variant('(osa{sv})', (self._session_handle, '', options)),
-            Gio.DBusCallFlags.NONE,
-            30000,
-            None
-        )
-        
-        request_path = result[0]
-        
-        def on_response(conn, sender, path, iface, signal, params):
-            nonlocal stream_info
-            error_code, results = params
-            if error_code == 0:
-                streams = results.get('streams', [])
-                if streams:
-                    stream_info = streams[0]
-            loop.quit()
-        
-        sub_id = self._bus.signal_subscribe(
-            self.PORTAL_BUS,
-            'org.freedesktop.portal.Request',
-            'Response',
-            request_path,
-            None,
-            Gio.DBusSignalFlags.NONE,
-            on_response
+        error_code, results = self._portal_session.request(
+            self._portal, 'Start', '(osa{sv})', (self._session_handle, ''), {}
         )
         
-        GLib.timeout_add_seconds(30, loop.quit)
-        loop.run()
-        self._bus.signal_unsubscribe(sub_id)
-        
-        if stream_info is None:
+        streams = results.get('streams', []) if error_code == 0 else []
+        if not streams:
             raise CaptureError("Failed to start capture - no stream info")
+        stream_info = streams[0]
         
         # Extract node ID and metadata
         if isinstance(stream_info, tuple) and len(stream_info) >= 2:
@@ -305,41 +393,154 @@ class WaylandCapture:
         else:
             raise CaptureError(f"Unexpected stream format: {stream_info}")
     
-    def _capture_frame(self, node_id: int) -> bytes:
-        """Capture single frame via GStreamer"""
-        pipeline_str = (
-            f'pipewiresrc path={node_id} num-buffers=1 ! '
-            f'videoconvert ! '
-            f'video/x-raw,format=RGB ! '
-            f'pngenc ! '
-            f'appsink name=sink'
+    def _start_pipeline(self, node_id: int) -> None:
+        """Build the capture pipeline on the PipeWire node and start it"""
+        # BGRx is what PipeWire produces on most compositors; videoconvert
+        # is then in passthrough and only converts for other sources
+        try:
+            self._pipeline = self._build_pipeline(
+                self._make_element('pipewiresrc', path=str(node_id)),
+                self._make_element('videoconvert'),
+                Gst.Caps.from_string('video/x-raw,format=BGRx'),
+                self._make_element('appsink', max_buffers=1, drop=True, sync=False),
+            )
+            self._appsink = self._pipeline.get_by_name('sink')
+            self._pipeline.set_state(Gst.State.PLAYING)
+        except CaptureError:
+            raise
+        except Exception as e:
+            raise CaptureError(f"GStreamer error: {e}") from e
+        self._node_id = node_id
+    
+    @staticmethod
+    def _make_element(factory: str, **props) -> Gst.Element:
+        """
+        Create an element and set its properties (``max_buffers`` -> ``max-buffers``)
+        
+        Raises:
+            CaptureError: The element's plugin is not installed
+        """
+        element = Gst.ElementFactory.make(factory, None)
+        if element is None:
+            raise CaptureError(f"GStreamer element '{factory}' not available")
+        for name, value in props.items():
+            element.set_property(name.replace('_', '-'), value)
+        return element
+    
+    @staticmethod
+    def _build_pipeline(*chain) -> Gst.Pipeline:
+        """
+        Add and link elements into a new pipeline
+        
+        ``chain`` lists the elements in order; a Gst.Caps between two
+        elements filters that link. The last element is named "sink".
+        
+        Raises:
+            CaptureError: Two elements could not be linked
+        """
+        pipeline = Gst.Pipeline.new(None)
+        chain[-1].set_property('name', 'sink')
+        
+        previous, caps = None, None
+        for item in chain:
+            if isinstance(item, Gst.Caps):
+                caps = item
+                continue
+            pipeline.add(item)
+            if previous is not None and not previous.link_filtered(item, caps):
+                raise CaptureError(f"Failed to link {previous.get_name()} to {item.get_name()}")
+            previous, caps = item, None
+        return pipeline
+    
+    @classmethod
+    def _h264_elements(cls) -> Optional[Tuple[str, str, str]]:
+        """First installed (encoder, postproc, keyframe property), or None"""
+        for encoder, postproc, keyframe_prop in cls.H264_ENCODERS:
+            if Gst.ElementFactory.find(encoder) and Gst.ElementFactory.find(postproc):
+                return encoder, postproc, keyframe_prop
+        return None
+    
+    def _start_h264_pipeline(self) -> None:
+        """Build the DMA-BUF -> VA-API H.264 pipeline on the open stream"""
+        elements = self._h264_elements()
+        if elements is None:
+            raise CaptureError("No VA-API H.264 encoder found (install gstreamer1.0-vaapi "
+                               "or the GStreamer 'va' plugin)")
+        encoder, postproc, keyframe_prop = elements
+        
+        # always-copy=false keeps the compositor's DMA-BUFs on the GPU; every
+        # frame is a keyframe with SPS/PPS so each sample decodes on its own
+        pipeline = self._build_pipeline(
+            self._make_element('pipewiresrc', path=str(self._node_id), always_copy=False),
+            Gst.Caps.from_string('video/x-raw(memory:DMABuf)'),
+            self._make_element(postproc),
+            self._make_element(encoder, **{keyframe_prop: 1}),
+            self._make_element('h264parse', config_interval=-1),
+            Gst.Caps.from_string('video/x-h264,stream-format=byte-stream,alignment=au'),
+            self._make_element('appsink', max_buffers=1, drop=True, sync=False),
         )
         
-        try:
-            pipeline = Gst.parse_launch(pipeline_str)
-            appsink = pipeline.get_by_name('sink')
-            pipeline.set_state(Gst.State.PLAYING)
-            
-            frame_data = None
-            start_time = time.time()
-            
-            while time.time() - start_time < 10:
-                sample = appsink.emit('pull-sample')
-                if sample:
-                    buffer = sample.get_buffer()
-                    success, mapinfo = buffer.map(Gst.MapFlags.READ)
-                    if success:
-                        frame_data = bytes(mapinfo.data)
-                        buffer.unmap(mapinfo)
-                        break
-                time.sleep(0.05)
-            
+        if pipeline.set_state(Gst.State.PLAYING) == Gst.StateChangeReturn.FAILURE:
             pipeline.set_state(Gst.State.NULL)
-            
-            if frame_data is None:
+            raise CaptureError("Failed to start H.264 pipeline")
+        self._h264_pipeline = pipeline
+        self._h264_appsink = pipeline.get_by_name('sink')
+    
+    def _capture_h264_frame(self) -> Tuple[bytes, int, int, int]:
+        """
+        Capture a single H.264 keyframe (Annex B byte-stream)
+        
+        Returns:
+            (data, width, height, 0)
+        """
+        if self._h264_pipeline is None:
+            self._start_h264_pipeline()
+        
+        sample = self._h264_appsink.emit('try-pull-sample', 0)
+        if sample is None:
+            sample = self._last_h264_sample
+        if sample is None:
+            sample = self._h264_appsink.emit('try-pull-sample', self.FRAME_TIMEOUT)
+            if sample is None:
+                raise CaptureError("Failed to encode frame within timeout")
+        self._last_h264_sample = sample
+        
+        struct = sample.get_caps().get_structure(0)
+        buffer = sample.get_buffer()
+        return (buffer.extract_dup(0, buffer.get_size()),
+                struct.get_int("width")[1], struct.get_int("height")[1], 0)
+    
+    def _capture_frame(self) -> Tuple[memoryview, int, int, int, Tuple[Gst.Buffer, Gst.MapInfo]]:
+        """
+        Capture single raw BGRx frame from the running pipeline
+        
+        The frame is not copied: its buffer is returned still mapped and
+        the caller unmaps it (``buffer.unmap(mapinfo)``) when done.
+        
+        Returns:
+            (view, width, height, stride, (buffer, mapinfo)) - BGRx rows
+            of ``stride`` bytes
+        """
+        # Newest buffered frame; on an idle screen nothing new arrives and
+        # the previous frame is still current. Only block for the first one.
+        sample = self._appsink.emit('try-pull-sample', 0)
+        if sample is None:
+            sample = self._last_sample
+        if sample is None:
+            sample = self._appsink.emit('try-pull-sample', self.FRAME_TIMEOUT)
+            if sample is None:
                 raise CaptureError("Failed to capture frame within timeout")
-            
-            return frame_data
-            
-        except Exception as e:
-            raise CaptureError(f"GStreamer error: {e}") from e
+        self._last_sample = sample
+        
+        buffer = sample.get_buffer()
+        success, mapinfo = buffer.map(Gst.MapFlags.READ)
+        if not success:
+            raise CaptureError("Failed to map buffer")
+        
+        try:
+            width, height, _ = _pixels.sample_geometry(sample)
+            view = memoryview(mapinfo.data).cast('B')
+        except Exception:
+            buffer.unmap(mapinfo)
+            raise
+        return view, width, height, len(view) // height, (buffer, mapinfo)
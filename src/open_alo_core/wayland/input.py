@@ -6,11 +6,10 @@ Uses persistent permissions so user only approves once.
 """
 
 import gi
-import json
 import time
 import uuid
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, Optional, List, Dict, Tuple
 
 # Require Gio version
 gi.require_version('Gio', '2.0')
@@ -18,8 +17,56 @@ gi.require_version('GLib', '2.0')
 
 from gi.repository import Gio, GLib
 
-from ..types import Point, normalize_key
+from ..types import InputEvent, Point, normalize_key
 from ..exceptions import PermissionDenied, SessionError, InputError
+from .portal import PortalSession, _load_restore_token, _save_restore_token
+
+
+# Linux evdev key codes (linux/input-event-codes.h), as expected by
+# NotifyKeyboardKeycode. Character keys assume a US layout.
+_KEY_LEFTSHIFT = 42
+
+_EVDEV_KEYCODES: Dict[str, int] = {
+    # Named keys (canonical names from normalize_key)
+    'Escape': 1, 'BackSpace': 14, 'Tab': 15, 'Return': 28,
+    'Control': 29, 'Shift': _KEY_LEFTSHIFT, 'Alt': 56, 'space': 57,
+    'Super': 125, 'Insert': 110, 'Delete': 111,
+    'Home': 102, 'End': 107, 'Page_Up': 104, 'Page_Down': 109,
+    'Up': 103, 'Left': 105, 'Right': 106, 'Down': 108,
+    'F1': 59, 'F2': 60, 'F3': 61, 'F4': 62, 'F5': 63, 'F6': 64,
+    'F7': 65, 'F8': 66, 'F9': 67, 'F10': 68, 'F11': 87, 'F12': 88,
+    # Characters typed without modifiers
+    '\n': 28, '\t': 15, ' ': 57,
+    '1': 2, '2': 3, '3': 4, '4': 5, '5': 6, '6': 7, '7': 8, '8': 9, '9': 10, '0': 11,
+    '-': 12, '=': 13, '[': 26, ']': 27, ';': 39, "'": 40, '`': 41, '\\': 43,
+    ',': 51, '.': 52, '/': 53,
+    **{c: code for code, c in enumerate('qwertyuiop', 16)},
+    **{c: code for code, c in enumerate('asdfghjkl', 30)},
+    **{c: code for code, c in enumerate('zxcvbnm', 44)},
+}
+
+# Characters typed with Shift held, by the key that produces them
+_SHIFTED_CHARS: Dict[str, str] = {
+    '!': '1', '@': '2', '#': '3', '$': '4', '%': '5',
+    '^': '6', '&': '7', '*': '8', '(': '9', ')': '0',
+    '_': '-', '+': '=', '{': '[', '}': ']', ':': ';', '"': "'",
+    '~': '`', '|': '\\', '<': ',', '>': '.', '?': '/',
+    **{c.upper(): c for c in 'abcdefghijklmnopqrstuvwxyz'},
+}
+
+# key -> (evdev keycode, needs Shift), built once so typing is a dict lookup
+_KEY_TO_EVDEV: Dict[str, Tuple[int, bool]] = {
+    **{key: (code, False) for key, code in _EVDEV_KEYCODES.items()},
+    **{char: (_EVDEV_KEYCODES[base], True) for char, base in _SHIFTED_CHARS.items()},
+}
+
+
+def _evdev_key(key: str) -> Tuple[int, bool]:
+    """(evdev keycode, needs Shift) of a key name or character"""
+    try:
+        return _KEY_TO_EVDEV[key]
+    except KeyError:
+        raise InputError(f"No keycode for key {key!r}") from None
 
 
 class WaylandInput:
@@ -41,21 +88,38 @@ class WaylandInput:
     Args:
         token_path: Custom path for storing restore tokens.
                    If None, uses ~/.config/open_alo_core/tokens.json
+        session: Portal connection to use; a start()ed PortalSession is
+                 shared with WaylandCapture (one permission dialog)
     """
     
     PORTAL_BUS = "org.freedesktop.portal.Desktop"
     PORTAL_PATH = "/org/freedesktop/portal/desktop"
     PORTAL_IFACE = "org.freedesktop.portal.RemoteDesktop"
     
-    def __init__(self, token_path: Optional[Path] = None):
+    # Notify* calls take no options; build the empty a{sv} once
+    _EMPTY_OPTS = GLib.Variant('a{sv}', {})
+    
+    def __init__(self, token_path: Optional[Path] = None, press_delay: float = 0.005,
+                 session: Optional[PortalSession] = None):
         """
         Initialize input controller
         
         Args:
             token_path: Path to store permission tokens.
                        None = no persistence (ephemeral session)
+            press_delay: Pause (seconds) between press and release in
+                click(), press_key() and key_combo()
+            session: Portal connection to use. If it has been start()ed,
+                initialize() adopts its session instead of creating one.
+                None = the process-wide PortalSession.default()
         """
+        self._press_delay = press_delay
+        self._portal_session = session if session is not None else PortalSession.default()
+        # False when the session belongs to a shared PortalSession
+        self._owns_session = True
         self._session_handle: Optional[str] = None
+        # Session handle as an 'o' Variant, reused by every input event
+        self._session_variant: Optional[GLib.Variant] = None
         self._initialized = False
         
         # Token storage
@@ -78,18 +142,10 @@ class WaylandInput:
         return False
     
     def _ensure_dbus(self) -> None:
-        """Lazy initialization of D-Bus connection"""
+        """Lazy initialization of D-Bus connection (shared through the PortalSession)"""
         if self._bus is None:
-            self._bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-            self._portal = Gio.DBusProxy.new_sync(
-                self._bus,
-                Gio.DBusProxyFlags.NONE,
-                None,
-                self.PORTAL_BUS,
-                self.PORTAL_PATH,
-                self.PORTAL_IFACE,
-                None
-            )
+            self._bus = self._portal_session.bus
+            self._portal = self._portal_session.remotedesktop
     
     def initialize(self, persist_mode: int = 0) -> None:
         """
@@ -116,6 +172,15 @@ class WaylandInput:
         
         self._ensure_dbus()
         
+        # Use the shared session when one has been started
+        shared = self._portal_session
+        if shared.active:
+            self._session_handle = shared.session_handle
+            self._session_variant = GLib.Variant('o', shared.session_handle)
+            self._owns_session = False
+            self._initialized = True
+            return
+        
         # Try to restore from token
         if persist_mode > 0:
             if self._restore_session():
@@ -127,8 +192,8 @@ class WaylandInput:
         self._initialized = True
     
     def close(self) -> None:
-        """Release resources and close session"""
-        if self._session_handle and self._portal:
+        """Release resources and close session (a shared session stays open)"""
+        if self._session_handle and self._portal and self._owns_session:
             try:
                 self._portal.call_sync(
                     'Close',
@@ -141,6 +206,8 @@ class WaylandInput:
                 pass  # Ignore errors during cleanup
         
         self._session_handle = None
+        self._session_variant = None
+        self._owns_session = True
         self._initialized = False
     
     # === Input Methods ===
@@ -166,9 +233,9 @@ class WaylandInput:
         
         try:
             self._notify_pointer_motion(point.x, point.y)
-            time.sleep(0.05)  # Small delay between move and click
+            time.sleep(self._press_delay)  # Small delay between move and click
             self._notify_pointer_button(button, pressed=True)
-            time.sleep(0.05)
+            time.sleep(self._press_delay)
             self._notify_pointer_button(button, pressed=False)
         except Exception as e:
             raise InputError(f"Click failed: {e}") from e
@@ -196,13 +263,17 @@ class WaylandInput:
         """
         Type text string
         
+        Keys are sent as evdev keycodes for a US keyboard layout; use
+        UnifiedRemoteDesktop.type_text() for characters outside it.
+        
         Args:
-            text: Unicode text to type
+            text: Text to type
             interval: Delay between characters (seconds)
         
         Raises:
             RuntimeError: Not initialized
-            InputError: Typing failed
+            InputError: Typing failed, or a character has no keycode (then
+                nothing is typed)
         
         Example:
             >>> ctrl.type_text("Hello World!")
@@ -211,13 +282,24 @@ class WaylandInput:
         if not self._initialized:
             raise RuntimeError("Not initialized")
         
+        # Resolve every character before the first event, so one without
+        # a keycode cannot leave the text half typed
         for char in text:
+            _evdev_key(char)
+        
+        # Events are queued as one-way calls, so the only wait per
+        # character is the requested interval, not two portal round-trips
+        try:
             try:
-                self._notify_keyboard_key(char, pressed=True)
-                time.sleep(interval)
-                self._notify_keyboard_key(char, pressed=False)
-            except Exception as e:
-                raise InputError(f"Typing failed at char '{char}': {e}") from e
+                for char in text:
+                    self._notify_keyboard_key(char, pressed=True, no_reply=True)
+                    time.sleep(interval)
+                    self._notify_keyboard_key(char, pressed=False, no_reply=True)
+            finally:
+                # Push out whatever was queued, even after a failure
+                self._bus.flush_sync(None)
+        except Exception as e:
+            raise InputError(f"Typing failed: {e}") from e
     
     def press_key(self, key: str) -> None:
         """
@@ -241,7 +323,7 @@ class WaylandInput:
         
         try:
             self._notify_keyboard_key(key, pressed=True)
-            time.sleep(0.05)
+            time.sleep(self._press_delay)
             self._notify_keyboard_key(key, pressed=False)
         except Exception as e:
             raise InputError(f"Key press failed: {e}") from e
@@ -267,67 +349,100 @@ class WaylandInput:
             raise RuntimeError("Not initialized")
         
         keys = [normalize_key(k) for k in keys]
+        # Resolve every key before any goes down
+        for key in keys:
+            _evdev_key(key)
         
         try:
-            # Press all keys
-            for key in keys:
-                self._notify_keyboard_key(key, pressed=True)
-                time.sleep(0.05)
-            
-            # Release in reverse order
-            for key in reversed(keys):
-                self._notify_keyboard_key(key, pressed=False)
-                time.sleep(0.05)
+            try:
+                # Queue the presses as one-way calls and push them out in
+                # one write; the portal applies them in order
+                for key in keys:
+                    self._notify_keyboard_key(key, pressed=True, no_reply=True)
+                self._bus.flush_sync(None)
+                
+                if self._press_delay > 0:
+                    time.sleep(self._press_delay)
+                
+                # Release in reverse order
+                for key in reversed(keys):
+                    self._notify_keyboard_key(key, pressed=False, no_reply=True)
+            finally:
+                self._bus.flush_sync(None)
                 
         except Exception as e:
             raise InputError(f"Key combo failed: {e}") from e
     
+    def replay(self, events: Iterable[InputEvent], delay: float = 0.0) -> None:
+        """
+        Send a sequence of input events (macro)
+        
+        Events are queued as one-way portal calls and flushed together, so
+        a long sequence costs about one write instead of a round-trip per
+        event. With a delay (or a "sleep" event) the queue is flushed
+        before each pause so the pause is seen by the compositor.
+        
+        Args:
+            events: (type, args) tuples:
+                ("move", (x, y)) - pointer motion to x, y
+                ("btn", (button, pressed)) - button 1=left, 2=middle, 3=right
+                ("key", (key, pressed)) - key name, as for press_key()
+                ("sleep", (seconds,)) - pause
+            delay: Pause (seconds) after every event; 0 = back-to-back
+        
+        Raises:
+            RuntimeError: Not initialized
+            InputError: Unknown event type or sending failed
+        
+        Example:
+            >>> ctrl.replay([
+            ...     ("move", (100, 100)),
+            ...     ("btn", (1, True)), ("btn", (1, False)),
+            ...     ("key", ("Control", True)), ("key", ("a", True)),
+            ...     ("key", ("a", False)), ("key", ("Control", False)),
+            ... ])
+        """
+        if not self._initialized:
+            raise RuntimeError("Not initialized")
+        
+        try:
+            try:
+                for kind, args in events:
+                    if kind == 'move':
+                        self._notify_pointer_motion(args[0], args[1], no_reply=True)
+                    elif kind == 'btn':
+                        self._notify_pointer_button(args[0], args[1], no_reply=True)
+                    elif kind == 'key':
+                        self._notify_keyboard_key(normalize_key(args[0]), args[1], no_reply=True)
+                    elif kind == 'sleep':
+                        self._bus.flush_sync(None)
+                        time.sleep(args[0])
+                        continue
+                    else:
+                        raise InputError(f"Unknown input event type: {kind!r}")
+                    
+                    if delay > 0:
+                        self._bus.flush_sync(None)
+                        time.sleep(delay)
+            finally:
+                # Events queued before a failure are still sent
+                self._bus.flush_sync(None)
+        except InputError:
+            raise
+        except Exception as e:
+            raise InputError(f"Replay failed: {e}") from e
+    
     # === Private Portal Methods ===
     
     def _create_session(self, persist_mode: int) -> None:
         """Create new portal session"""
-        loop = GLib.MainLoop()
-        session_handle: Optional[str] = None
-        error_code: int = -1
-        
-        token = uuid.uuid4().hex[:8]
-        options = {
-            'session_handle_token': GLib.Variant('s', f'open_alo_{token}'),
-            'handle_token': GLib.Variant('s', f'req_{token}')
-        }
-        
-        result = self._portal.call_sync(
-            'CreateSession',
-            GLib.Variant('(a{sv})', (options,)),
-            Gio.DBusCallFlags.NONE,
-            10000,
-            None
-        )
-        
-        request_path = result[0]
-        
-        def on_response(conn, sender, path, iface, signal, params):
-            nonlocal session_handle, error_code
-            error_code, results = params
-            if error_code == 0:
-                session_handle = str(results['session_handle'])
-            loop.quit()
-        
-        sub_id = self._bus.signal_subscribe(
-            self.PORTAL_BUS,
-            'org.freedesktop.portal.Request',
-            'Response',
-            request_path,
-            None,
-            Gio.DBusSignalFlags.NONE,
-            on_response
+        error_code, results = self._portal_session.request(
+            self._portal, 'CreateSession', '(a{sv})', (), {
+                'session_handle_token': GLib.Variant('s', f'open_alo_{uuid.uuid4().hex[:8]}')
+            }
         )
         
-        GLib.timeout_add_seconds(30, loop.quit)
-        loop.run()
-        self._bus.signal_unsubscribe(sub_id)
-        
-        if session_handle is None:
+        if error_code != 0:
             if error_code == 1:
                 raise PermissionDenied("User denied permission")
             elif error_code == 2:
@@ -335,20 +450,17 @@ class WaylandInput:
             else:
                 raise SessionError(f"Failed to create session (code: {error_code})")
         
+        session_handle = str(results['session_handle'])
         self._session_handle = session_handle
+        self._session_variant = GLib.Variant('o', session_handle)
         
         # Select input devices
         self._select_devices(persist_mode)
     
     def _select_devices(self, persist_mode: int) -> None:
         """Select input devices (keyboard, mouse)"""
-        loop = GLib.MainLoop()
-        success = False
-        
-        dev_token = uuid.uuid4().hex[:8]
         options = {
             'types': GLib.Variant('u', 7),  # Keyboard | Pointer | Touchscreen
-            'handle_token': GLib.Variant('s', f'dev_{dev_token}'),
         }
         
         if persist_mode > 0:
@@ -359,94 +471,30 @@ class WaylandInput:
             if token:
                 options['restore_token'] = GLib.Variant('s', token)
         
-        result = self._portal.call_sync(
-            'SelectDevices',
-            GLib.Variant('(oa{sv})', (self._session_handle, options)),
-            Gio.DBusCallFlags.NONE,
-            10000,
-            None
-        )
-        
-        request_path = result[0]
-        
-        def on_response(conn, sender, path, iface, signal, params):
-            nonlocal success
-            error_code, results = params
-            if error_code == 0:
-                success = True
-                # Save token for future sessions
-                if persist_mode > 0:
-                    # Extract restore_token from results if present
-                    if isinstance(results, dict) and 'restore_token' in results:
-                        restore_token = results['restore_token']
-                        if isinstance(restore_token, GLib.Variant):
-                            restore_token = restore_token.get_string()
-                        self._save_token(restore_token)
-            loop.quit()
-        
-        sub_id = self._bus.signal_subscribe(
-            self.PORTAL_BUS,
-            'org.freedesktop.portal.Request',
-            'Response',
-            request_path,
-            None,
-            Gio.DBusSignalFlags.NONE,
-            on_response
+        error_code, _ = self._portal_session.request(
+            self._portal, 'SelectDevices', '(oa{sv})', (self._session_handle,), options
         )
         
-        GLib.timeout_add_seconds(30, loop.quit)
-        loop.run()
-        self._bus.signal_unsubscribe(sub_id)
-        
-        if not success:
+        if error_code != 0:
             raise PermissionDenied("User denied device access")
         
         # Start the remote desktop session
-        self._start_session()
+        self._start_session(persist_mode)
     
-    def _start_session(self) -> None:
+    def _start_session(self, persist_mode: int = 0) -> None:
         """Start the remote desktop session"""
-        loop = GLib.MainLoop()
-        success = False
-        
-        start_token = uuid.uuid4().hex[:8]
-        options = {
-            'handle_token': GLib.Variant('s', f'start_{start_token}'),
-        }
-        
-        result = self._portal.call_sync(
-            'Start',
-            GLib.Variant('(osa{sv})', (self._session_handle, '', options)),
-            Gio.DBusCallFlags.NONE,
-            10000,
-            None
-        )
-        
-        request_path = result[0]
-        
-        def on_response(conn, sender, path, iface, signal, params):
-            nonlocal success
-            error_code, results = params
-            if error_code == 0:
-                success = True
-            loop.quit()
-        
-        sub_id = self._bus.signal_subscribe(
-            self.PORTAL_BUS,
-            'org.freedesktop.portal.Request',
-            'Response',
-            request_path,
-            None,
-            Gio.DBusSignalFlags.NONE,
-            on_response
+        error_code, results = self._portal_session.request(
+            self._portal, 'Start', '(osa{sv})', (self._session_handle, ''), {}
         )
         
-        GLib.timeout_add_seconds(30, loop.quit)
-        loop.run()
-        self._bus.signal_unsubscribe(sub_id)
-        
-        if not success:
+        if error_code != 0:
             raise SessionError("Failed to start remote desktop session")
+        
+        # The portal hands out the restore token in the Start response;
+        # save it for future sessions
+        restore_token = results.get('restore_token')
+        if persist_mode > 0 and restore_token:
+            self._save_token(str(restore_token))
     
     def _restore_session(self) -> bool:
         """Try to restore from saved token"""
@@ -465,60 +513,67 @@ class WaylandInput:
     
     def _load_token(self) -> Optional[str]:
         """Load restore token from disk"""
-        try:
-            if self._token_path.exists():
-                data = json.loads(self._token_path.read_text())
-                return data.get('restore_token')
-        except Exception:
-            pass
-        return None
+        return _load_restore_token(self._token_path)
     
     def _save_token(self, token: str) -> None:
-        """Save restore token to disk"""
-        try:
-            self._token_path.parent.mkdir(parents=True, exist_ok=True)
-            data = {
-                'restore_token': token,
-                'timestamp': time.time(),
-                'version': 1
-            }
-            self._token_path.write_text(json.dumps(data))
-        except Exception:
-            pass  # Token save failure is not fatal
+        """Save restore token to disk (atomically, see _save_restore_token)"""
+        _save_restore_token(self._token_path, token)
     
-    def _notify_pointer_motion(self, x: int, y: int) -> None:
+    def _notify(self, method: str, params: GLib.Variant, no_reply: bool = False) -> None:
+        """
+        Call a RemoteDesktop notify method
+        
+        With no_reply=True the call is only queued on the connection (the
+        Notify* methods return nothing); flush the bus afterwards.
+        """
+        if no_reply:
+            # Without a callback Gio sends the message as NO_REPLY_EXPECTED;
+            # the portal is already running, so skip activation checks too
+            self._portal.call(method, params, Gio.DBusCallFlags.NO_AUTO_START, -1, None, None)
+            return
+        
+        self._portal.call_sync(method, params, Gio.DBusCallFlags.NONE, -1, None)
+    
+    def _notify_pointer_motion(self, x: int, y: int, no_reply: bool = False) -> None:
         """Send pointer motion event to portal"""
-        options = {}
-        self._portal.call_sync(
+        self._notify(
             'NotifyPointerMotion',
-            GLib.Variant('(oa{sv}dd)', (self._session_handle, options, float(x), float(y))),
-            Gio.DBusCallFlags.NONE,
-            -1,
-            None
+            GLib.Variant.new_tuple(self._session_variant, self._EMPTY_OPTS,
+                                   GLib.Variant.new_double(x), GLib.Variant.new_double(y)),
+            no_reply
         )
     
-    def _notify_pointer_button(self, button: int, pressed: bool) -> None:
+    def _notify_pointer_button(self, button: int, pressed: bool, no_reply: bool = False) -> None:
         """Send pointer button event"""
-        options = {}
-        state = 1 if pressed else 0
-        self._portal.call_sync(
+        self._notify(
             'NotifyPointerButton',
-            GLib.Variant('(oa{sv}iu)', (self._session_handle, options, int(button), int(state))),
-            Gio.DBusCallFlags.NONE,
-            -1,
-            None
+            GLib.Variant.new_tuple(self._session_variant, self._EMPTY_OPTS,
+                                   GLib.Variant.new_int32(button),
+                                   GLib.Variant.new_uint32(1 if pressed else 0)),
+            no_reply
         )
     
-    def _notify_keyboard_key(self, key: str, pressed: bool) -> None:
-        """Send keyboard key event"""
-        options = {}
-        state = 1 if pressed else 0
-        # Convert key name to keycode (simplified)
-        # In production, you'd use a proper keycode mapping
-        self._portal.call_sync(
+    def _notify_keyboard_key(self, key: str, pressed: bool, no_reply: bool = False) -> None:
+        """
+        Send keyboard key event
+        
+        Shifted characters ("A", "!", ...) are sent as Shift + base key:
+        Shift goes down before the key press and up after the release.
+        """
+        keycode, shift = _evdev_key(key)
+        
+        if shift and pressed:
+            self._notify_keycode(_KEY_LEFTSHIFT, True, no_reply)
+        self._notify_keycode(keycode, pressed, no_reply)
+        if shift and not pressed:
+            self._notify_keycode(_KEY_LEFTSHIFT, False, no_reply)
+    
+    def _notify_keycode(self, keycode: int, pressed: bool, no_reply: bool = False) -> None:
+        """Send a raw evdev keycode event"""
+        self._notify(
             'NotifyKeyboardKeycode',
-            GLib.Variant('(oa{sv}iu)', (self._session_handle, options, 0, state)),
-            Gio.DBusCallFlags.NONE,
-            -1,
-            None
+            GLib.Variant.new_tuple(self._session_variant, self._EMPTY_OPTS,
+                                   GLib.Variant.new_int32(keycode),
+                                   GLib.Variant.new_uint32(1 if pressed else 0)),
+            no_reply
         )
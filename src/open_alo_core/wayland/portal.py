@@ -0,0 +1,386 @@
+"""
+Shared XDG Desktop Portal connection
+
+WaylandInput and WaylandCapture talk to the same portal service. A
+PortalSession holds the session bus connection and the RemoteDesktop /
+ScreenCast proxies so they are set up once per process instead of once
+per controller.
+
+It can also start a single RemoteDesktop session with screen capture
+attached (SelectDevices + SelectSources, then one Start), which both
+controllers then use - one permission dialog for input and capture.
+"""
+
+import gi
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    # Optional: open-alo-core[fast]
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    from json import dumps as _json_dumps, loads as _loads
+
+    def _dumps(obj) -> bytes:
+        return _json_dumps(obj).encode()
+
+gi.require_version('Gio', '2.0')
+gi.require_version('GLib', '2.0')
+
+from gi.repository import Gio, GLib
+
+from ..exceptions import PermissionDenied, SessionError
+
+
+def _load_restore_token(path: Path) -> Optional[str]:
+    """Restore token saved at ``path``, or None if missing or unreadable"""
+    try:
+        if path.exists():
+            return _loads(path.read_bytes()).get('restore_token')
+    except Exception:
+        pass
+    return None
+
+
+def _save_restore_token(path: Path, token: str) -> bool:
+    """
+    Save a restore token to ``path``
+
+    Written to a temporary file and renamed over the old one, so a crash
+    never leaves a truncated token file behind.
+
+    Returns:
+        True if saved (a failed save is not fatal; the next run shows the
+        permission dialog again)
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'restore_token': token,
+            'timestamp': time.time(),
+            'version': 1
+        }
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_bytes(_dumps(data))
+        os.replace(tmp_path, path)
+        return True
+    except Exception:
+        return False
+
+
+class PortalSession:
+    """
+    Portal connection (and optional combined session) shared by controllers
+
+    Example:
+        >>> # Shared connection only (what controllers use by default)
+        >>> ctrl = WaylandInput()  # uses PortalSession.default()
+
+        >>> # One session, one dialog, for both input and capture
+        >>> session = PortalSession()
+        >>> session.start(persist_mode=2, capture=True)
+        >>> ctrl = WaylandInput(session=session)
+        >>> capture = WaylandCapture(session=session)
+    """
+
+    PORTAL_BUS = "org.freedesktop.portal.Desktop"
+    PORTAL_PATH = "/org/freedesktop/portal/desktop"
+    REMOTE_DESKTOP_IFACE = "org.freedesktop.portal.RemoteDesktop"
+    SCREENCAST_IFACE = "org.freedesktop.portal.ScreenCast"
+
+    DEVICE_ALL = 7  # Keyboard | Pointer | Touchscreen
+    SOURCE_MONITOR = 1
+
+    _default: Optional["PortalSession"] = None
+
+    def __init__(self, token_path: Optional[Path] = None):
+        """
+        Create a portal connection (nothing is contacted until first use)
+
+        Args:
+            token_path: Where start() keeps its restore token.
+                       If None, uses ~/.config/open_alo_core/session_token.json
+        """
+        if token_path is None:
+            token_path = Path.home() / ".config" / "open_alo_core" / "session_token.json"
+        self._token_path = Path(token_path)
+
+        self._bus: Optional[Gio.DBusConnection] = None
+        self._remotedesktop_proxy: Optional[Gio.DBusProxy] = None
+        self._screencast_proxy: Optional[Gio.DBusProxy] = None
+
+        # One Response subscription for every request (see request());
+        # request path -> (code, results), None while still waiting
+        self._response_sub: Optional[int] = None
+        # Main context the subscription delivers Response signals on (the
+        # thread-default one when it was made); requests iterate this one
+        self._response_context: Optional[GLib.MainContext] = None
+        self._pending: Dict[str, Optional[Tuple[int, Dict[str, Any]]]] = {}
+
+        # Combined session created by start()
+        self.session_handle: Optional[str] = None
+        self.streams: List[Tuple[int, Dict[str, Any]]] = []
+
+    @classmethod
+    def default(cls) -> "PortalSession":
+        """Process-wide shared instance, used by controllers created without a session"""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def __enter__(self) -> "PortalSession":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+    @property
+    def bus(self) -> Gio.DBusConnection:
+        """Session bus connection"""
+        if self._bus is None:
+            self._bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+        return self._bus
+
+    @property
+    def remotedesktop(self) -> Gio.DBusProxy:
+        """RemoteDesktop portal proxy"""
+        if self._remotedesktop_proxy is None:
+            self._remotedesktop_proxy = self._new_proxy(self.REMOTE_DESKTOP_IFACE)
+        return self._remotedesktop_proxy
+
+    @property
+    def screencast(self) -> Gio.DBusProxy:
+        """ScreenCast portal proxy"""
+        if self._screencast_proxy is None:
+            self._screencast_proxy = self._new_proxy(self.SCREENCAST_IFACE)
+        return self._screencast_proxy
+
+    @property
+    def active(self) -> bool:
+        """True while a session started by start() is open"""
+        return self.session_handle is not None
+
+    def start(self, persist_mode: int = 2, capture: bool = True) -> None:
+        """
+        Start one RemoteDesktop session, optionally with screen capture
+
+        Shows ONE permission dialog covering input and (with capture=True)
+        the screen. Controllers given this session use it instead of
+        creating their own.
+
+        Args:
+            persist_mode: Permission persistence (0 = never, 1 = while
+                running, 2 = until revoked)
+            capture: Also select a monitor for screen capture
+
+        Raises:
+            PermissionDenied: User denied permission
+            SessionError: Session could not be started
+        """
+        if self.active:
+            return
+
+        code, results = self.request(
+            self.remotedesktop, 'CreateSession', '(a{sv})', (),
+            {'session_handle_token': GLib.Variant('s', f'shared_{uuid.uuid4().hex[:8]}')}
+        )
+        if code != 0:
+            self._raise_for(code, "create session")
+        self.session_handle = str(results['session_handle'])
+
+        try:
+            options = {'types': GLib.Variant('u', self.DEVICE_ALL)}
+            if persist_mode > 0:
+                options['persist_mode'] = GLib.Variant('u', persist_mode)
+                token = self._load_token()
+                if token:
+                    options['restore_token'] = GLib.Variant('s', token)
+            code, _ = self.request(
+                self.remotedesktop, 'SelectDevices', '(oa{sv})', (self.session_handle,), options
+            )
+            if code != 0:
+                self._raise_for(code, "select devices")
+
+            if capture:
+                # Sources are selected through the ScreenCast interface on
+                # the same RemoteDesktop session
+                code, _ = self.request(
+                    self.screencast, 'SelectSources', '(oa{sv})', (self.session_handle,), {
+                        'types': GLib.Variant('u', self.SOURCE_MONITOR),
+                        'multiple': GLib.Variant('b', False),
+                        'cursor_mode': GLib.Variant('u', 2),  # Embedded
+                    }
+                )
+                if code != 0:
+                    self._raise_for(code, "select sources")
+
+            code, results = self.request(
+                self.remotedesktop, 'Start', '(osa{sv})', (self.session_handle, ''), {},
+                timeout=60
+            )
+            if code != 0:
+                self._raise_for(code, "start session")
+
+            self.streams = [(int(node), dict(props)) for node, props in results.get('streams', [])]
+            if capture and not self.streams:
+                raise SessionError("Session started without a screen stream")
+
+            restore_token = results.get('restore_token')
+            if persist_mode > 0 and restore_token:
+                self._save_token(str(restore_token))
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Close the session started by start() (the connection stays usable)"""
+        if self.session_handle and self._bus is not None:
+            try:
+                self._bus.call_sync(
+                    self.PORTAL_BUS,
+                    self.session_handle,
+                    'org.freedesktop.portal.Session',
+                    'Close',
+                    None,
+                    None,
+                    Gio.DBusCallFlags.NONE,
+                    5000,
+                    None
+                )
+            except Exception:
+                pass
+
+        self.session_handle = None
+        self.streams = []
+
+    def request(self, proxy: Gio.DBusProxy, method: str, signature: str,
+                args: tuple, options: Dict[str, GLib.Variant],
+                timeout: int = 30) -> Tuple[int, Dict[str, Any]]:
+        """
+        Call a portal method that answers through a Request object
+
+        Adds a handle_token to ``options`` (the trailing a{sv} argument),
+        calls the method and iterates the main context until the Request's
+        Response signal arrives. Responses for all requests go through one
+        bus-wide subscription, set up on the first request; they are
+        delivered on that thread's default main context, which is the one
+        iterated here (from any thread).
+
+        Returns:
+            (response code, results) - code 0 = success, 1 = denied,
+            2 = cancelled, -1 = no response within ``timeout`` seconds
+        """
+        return self.requests([(proxy, method, signature, args, options)], timeout)[0]
+
+    def requests(self, calls: List[Tuple[Gio.DBusProxy, str, str, tuple, Dict[str, GLib.Variant]]],
+                 timeout: int = 30) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Issue several portal requests, then wait for all their responses
+
+        Each call is (proxy, method, signature, args, options) as for
+        request(). Waiting on all of them at once overlaps the round-trips
+        of independent requests (e.g. SelectDevices and SelectSources on
+        the same session).
+
+        Returns:
+            (response code, results) per call, in order (see request())
+        """
+        self._subscribe_responses()
+
+        paths: List[str] = []
+        try:
+            for proxy, method, signature, args, options in calls:
+                options = dict(options)
+                options['handle_token'] = GLib.Variant('s', f'req_{uuid.uuid4().hex[:8]}')
+
+                result = proxy.call_sync(
+                    method,
+                    GLib.Variant(signature, args + (options,)),
+                    Gio.DBusCallFlags.NONE,
+                    timeout * 1000,
+                    None
+                )
+                # Signals are only dispatched while the context is iterated
+                # below, so registering after the call cannot miss the response
+                paths.append(result[0])
+                self._pending[result[0]] = None
+
+            timed_out = False
+
+            def on_timeout(*_):
+                nonlocal timed_out
+                timed_out = True
+                return False
+
+            # The timeout must fire on the context being iterated, which is
+            # not necessarily the global default one
+            context = self._response_context
+            timeout_source = GLib.timeout_source_new_seconds(timeout)
+            timeout_source.set_callback(on_timeout)
+            timeout_source.attach(context)
+            try:
+                while not timed_out and any(self._pending[path] is None for path in paths):
+                    context.iteration(True)
+            finally:
+                timeout_source.destroy()
+        finally:
+            responses = [self._pending.pop(path) for path in paths]
+
+        return [response if response is not None else (-1, {}) for response in responses]
+
+    def _subscribe_responses(self) -> None:
+        """Subscribe once to Request.Response for every request path"""
+        if self._response_sub is not None:
+            return
+
+        def on_response(conn, sender, path, iface, signal, params):
+            # Responses to requests nobody is waiting for are dropped
+            if path in self._pending:
+                code, results = params
+                self._pending[path] = (code, results)
+
+        # signal_subscribe dispatches to the caller's thread-default context
+        self._response_context = GLib.MainContext.ref_thread_default()
+        self._response_sub = self.bus.signal_subscribe(
+            self.PORTAL_BUS,
+            'org.freedesktop.portal.Request',
+            'Response',
+            None,
+            None,
+            Gio.DBusSignalFlags.NONE,
+            on_response
+        )
+
+    def _new_proxy(self, interface: str) -> Gio.DBusProxy:
+        # The portal interfaces have no properties or signals we use
+        # (responses arrive on Request objects), so skip the GetAll and
+        # AddMatch round-trips a default proxy makes on creation
+        return Gio.DBusProxy.new_sync(
+            self.bus,
+            Gio.DBusProxyFlags.DO_NOT_LOAD_PROPERTIES | Gio.DBusProxyFlags.DO_NOT_CONNECT_SIGNALS,
+            None,
+            self.PORTAL_BUS,
+            self.PORTAL_PATH,
+            interface,
+            None
+        )
+
+    @staticmethod
+    def _raise_for(code: int, action: str) -> None:
+        if code == 1:
+            raise PermissionDenied(f"User denied permission ({action})")
+        if code == 2:
+            raise SessionError(f"Portal request canceled ({action})")
+        raise SessionError(f"Failed to {action} (code: {code})")
+
+    def _load_token(self) -> Optional[str]:
+        """Load restore token from disk"""
+        return _load_restore_token(self._token_path)
+
+    def _save_token(self, token: str) -> None:
+        """Save restore token to disk (atomically, see _save_restore_token)"""
+        _save_restore_token(self._token_path, token)
@@ -7,32 +7,177 @@ This is the modern approach used by RustDesk and other remote desktop solutions.
 Key features:
 - Single permission dialog for everything
 - Real-time screen streaming via PipeWire
-- Screenshot capability
+- Screenshot capability (JPEG or PNG)
 - Full keyboard and mouse control
 - Persistent permission tokens
 """
 
 import gi
-import json
+import threading
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Tuple, Union
 from io import BytesIO
 
 # Require versions
 gi.require_version('Gst', '1.0')
+gi.require_version('GstApp', '1.0')
 gi.require_version('GLib', '2.0')
 gi.require_version('Gio', '2.0')
+gi.require_version('GdkPixbuf', '2.0')
 
-from gi.repository import Gst, GLib, Gio
+from gi.repository import Gst, GLib, Gio, GdkPixbuf
+# Loading GstApp types appsinks as GstApp.AppSink, whose try_pull_sample()
+# is a direct C call instead of a "try-pull-sample" signal emission
+from gi.repository import GstApp  # noqa: F401
 
 from ..types import Point, normalize_key
 from ..exceptions import PermissionDenied, SessionError, InputError, CaptureError
+from . import _pixels
+from .portal import PortalSession, _load_restore_token, _save_restore_token
 
 # Initialize GStreamer
 Gst.init(None)
 
+# GStreamer raw formats → DRM fourcc codes (used when caps carry no drm-format)
+_GST_TO_DRM_FOURCC = {
+    'BGRx': 'XR24',
+    'BGRA': 'AR24',
+    'RGBx': 'XB24',
+    'RGBA': 'AB24',
+    'xRGB': 'BX24',
+    'ARGB': 'BA24',
+}
+
+# DRM_FORMAT_MOD_LINEAR: implied when the stream does not advertise a modifier
+_DRM_FORMAT_MOD_LINEAR = 0
+
+# X11 keysyms of named keys; other single characters map to their code point
+_KEYSYM_MAP = {
+    'Return': 0xFF0D,
+    'Escape': 0xFF1B,
+    'Tab': 0xFF09,
+    'BackSpace': 0xFF08,
+    'Delete': 0xFFFF,
+    'Left': 0xFF51,
+    'Up': 0xFF52,
+    'Right': 0xFF53,
+    'Down': 0xFF54,
+    'Control': 0xFFE3,
+    'Alt': 0xFFE9,
+    'Shift': 0xFFE1,
+    'Super': 0xFFEB,
+    ' ': 0x0020,
+}
+
+
+@dataclass
+class DmaBufFrame:
+    """
+    Screen frame exported as a DMA-BUF (GPU memory, no CPU copy)
+
+    The file descriptor is owned by the underlying GStreamer buffer and
+    stays valid only while this object is alive. ``os.dup()`` it if the
+    consumer needs it longer.
+    """
+    fd: int
+    stride: int
+    fourcc: int
+    modifier: int
+    width: int
+    height: int
+    offset: int = 0
+    _sample: Any = field(default=None, repr=False)
+
+    def __iter__(self):
+        """Unpack as (fd, stride, fourcc, modifier, width, height)"""
+        return iter((self.fd, self.stride, self.fourcc, self.modifier, self.width, self.height))
+
+
+class Frame:
+    """
+    Raw screen frame, mapped in place (no copy)
+
+    Rows are BGRx (4 bytes per pixel, ``stride`` bytes per row). The frame
+    holds its GStreamer sample mapped until close(), or until it is garbage
+    collected. Memoryviews taken from ``view`` must not be used after that,
+    like mss's ScreenShot.raw. ``pixels`` arrays keep the frame alive by
+    themselves.
+
+    Example:
+        >>> with desktop.get_frame(format="raw") as frame:
+        ...     hash_frame(frame.view)
+        ...     small = frame.pixels[::4, ::4]
+        ...     png = frame.to_png()
+    """
+
+    def __init__(self, sample: Gst.Sample):
+        self.width, self.height, self.format = _pixels.sample_geometry(sample)
+
+        self._sample = sample
+        self._buffer = sample.get_buffer()
+        success, self._map_info = self._buffer.map(Gst.MapFlags.READ)
+        if not success:
+            raise CaptureError("Failed to map buffer")
+
+        self._view: Optional[memoryview] = memoryview(self._map_info.data).cast('B')
+        self.stride = len(self._view) // self.height
+
+    def __enter__(self) -> "Frame":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """memoryview(frame) / np.frombuffer(frame) on Python 3.12+"""
+        return self.view
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    @property
+    def view(self) -> memoryview:
+        """The mapped BGRx rows, valid until close()"""
+        if self._view is None:
+            raise CaptureError("Frame has been closed")
+        return self._view
+
+    @property
+    def pixels(self):
+        """(height, width, 4) BGRx uint8 numpy view of the frame (requires numpy)"""
+        return _pixels.as_array(self.view, self.width, self.height, self.stride, 4, owner=self)
+
+    def to_png(self) -> bytes:
+        """Encode the frame as PNG"""
+        return _pixels.encode_bgrx(self.view, self.width, self.height, self.stride, "png")
+
+    def to_jpeg(self, quality: int = 85) -> bytes:
+        """Encode the frame as JPEG"""
+        return _pixels.encode_bgrx(self.view, self.width, self.height, self.stride,
+                                   "jpeg", quality)
+
+    def close(self) -> None:
+        """
+        Unmap the frame
+
+        Raises:
+            BufferError: Objects made from ``view`` (e.g. np.frombuffer) are still alive
+        """
+        if self._view is None:
+            return
+        self._view.release()
+        self._view = None
+        self._buffer.unmap(self._map_info)
+        self._sample = None
+
 
 class UnifiedRemoteDesktop:
     """
@@ -80,6 +225,21 @@ class UnifiedRemoteDesktop:
     SOURCE_WINDOW = 2
     SOURCE_VIRTUAL = 4
 
+    # Encodings supported by capture_screenshot()/get_frame()
+    IMAGE_FORMATS = ("jpeg", "png")
+
+    # How long capture_screenshot() waits for the first frame (ns)
+    CAPTURE_TIMEOUT = 5 * Gst.SECOND
+
+    # How long a pipeline started on demand is waited on to preroll (ns)
+    PIPELINE_START_TIMEOUT = 5 * Gst.SECOND
+
+    # Most Notify* calls type_text() keeps awaiting a reply at once
+    MAX_IN_FLIGHT = 32
+
+    # Notify* calls take no options; build the empty a{sv} once
+    _EMPTY_OPTS = GLib.Variant('a{sv}', {})
+
     def __init__(self, token_path: Optional[Path] = None):
         """
         Initialize unified remote desktop controller
@@ -89,6 +249,8 @@ class UnifiedRemoteDesktop:
                        None = ~/.config/open_alo_core/unified_token.json
         """
         self._session_handle: Optional[str] = None
+        # Session handle as an 'o' Variant, reused by every input event
+        self._session_variant: Optional[GLib.Variant] = None
         self._pipewire_node: Optional[int] = None
         self._initialized = False
 
@@ -96,15 +258,50 @@ class UnifiedRemoteDesktop:
         if token_path is None:
             token_path = Path.home() / ".config" / "open_alo_core" / "unified_token.json"
         self._token_path = Path(token_path)
+        # Token last read from / written to _token_path (see _load_token)
+        self._cached_token: Optional[str] = None
+        self._token_loaded = False
 
-        # D-Bus connection (lazy initialization)
+        # D-Bus connection (lazy initialization, shared through the
+        # process-wide PortalSession)
+        self._portal_session: Optional[PortalSession] = None
         self._bus: Optional[Gio.DBusConnection] = None
         self._portal: Optional[Gio.DBusProxy] = None  # RemoteDesktop portal
         self._screencast_portal: Optional[Gio.DBusProxy] = None  # ScreenCast portal
+        # Asynchronous Notify* calls awaiting a reply, and the first error
+        self._in_flight = 0
+        self._notify_error: Optional[InputError] = None
+        # Worker thread of type_text_async(), created on first use
+        self._input_executor: Optional[ThreadPoolExecutor] = None
 
         # GStreamer pipeline for capture
         self._pipeline: Optional[Gst.Pipeline] = None
         self._appsink: Optional[Gst.Element] = None
+        # Builds the pipeline in the background after Start (see
+        # _start_pipeline_thread), and the error it failed with, if any
+        self._pipeline_thread: Optional[threading.Thread] = None
+        self._pipeline_error: Optional[Exception] = None
+        # Set once _ensure_pipeline() has seen the pipeline started
+        self._pipeline_playing = False
+        # Most recent frame; PipeWire only delivers new frames on damage
+        self._last_sample: Optional[Gst.Sample] = None
+        # Frames skipped by _pull_sample() to stay on the newest one (debug)
+        self._dropped_frames = 0
+        # (buffer PTS or sample, format, quality, encoded) of the last
+        # encoded frame, reused while the screen is idle
+        self._last_frame: Optional[Tuple[Any, str, int, bytes]] = None
+
+        # pipewiresrc of _pipeline, and the stopped pipeline close() keeps
+        # for the next session as (pipeline, pipewiresrc, appsink)
+        self._pipewiresrc: Optional[Gst.Element] = None
+        self._idle_pipeline: Optional[Tuple[Gst.Pipeline, Gst.Element, Gst.Element]] = None
+
+        # Optional DMA-BUF pipeline (GPU memory, see get_frame_dmabuf)
+        self._enable_dmabuf = False
+        self._dmabuf_pipeline: Optional[Gst.Pipeline] = None
+        self._dmabuf_appsink: Optional[Gst.Element] = None
+        # Most recent DMA-BUF frame, returned again while the screen is idle
+        self._last_dmabuf_sample: Optional[Gst.Sample] = None
 
     def __enter__(self) -> "UnifiedRemoteDesktop":
         """Context manager entry"""
@@ -116,36 +313,20 @@ class UnifiedRemoteDesktop:
         return False
 
     def _ensure_dbus(self) -> None:
-        """Lazy initialization of D-Bus connection"""
+        """Lazy initialization of D-Bus connection (shared through the PortalSession)"""
         if self._bus is None:
-            self._bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-
+            self._portal_session = PortalSession.default()
+            self._bus = self._portal_session.bus
             # RemoteDesktop portal for input + session management
-            self._portal = Gio.DBusProxy.new_sync(
-                self._bus,
-                Gio.DBusProxyFlags.NONE,
-                None,
-                self.PORTAL_BUS,
-                self.PORTAL_PATH,
-                self.REMOTEDESKTOP_IFACE,
-                None
-            )
-
+            self._portal = self._portal_session.remotedesktop
             # ScreenCast portal for source selection
             # (RemoteDesktop inherits ScreenCast but we call SelectSources on ScreenCast interface)
-            self._screencast_portal = Gio.DBusProxy.new_sync(
-                self._bus,
-                Gio.DBusProxyFlags.NONE,
-                None,
-                self.PORTAL_BUS,
-                self.PORTAL_PATH,
-                self.SCREENCAST_IFACE,
-                None
-            )
+            self._screencast_portal = self._portal_session.screencast
 
     # ==================== Session Management ====================
 
-    def initialize(self, persist_mode: int = 2, enable_capture: bool = True) -> bool:
+    def initialize(self, persist_mode: int = 2, enable_capture: bool = True,
+                   enable_dmabuf: bool = False) -> bool:
         """
         Initialize unified remote desktop session
 
@@ -157,9 +338,12 @@ class UnifiedRemoteDesktop:
                 1 = Persist while app running
                 2 = Persist until revoked (recommended)
             enable_capture: Enable screen capture (True for agents)
+            enable_dmabuf: Also allow zero-copy DMA-BUF frames via
+                get_frame_dmabuf() (for GPU consumers)
 
         Returns:
-            True if initialization succeeded
+            True if initialization succeeded (the capture pipeline may
+            still be starting in the background)
 
         Raises:
             PermissionDenied: User denied permission
@@ -171,6 +355,7 @@ class UnifiedRemoteDesktop:
         if self._initialized:
             return True
 
+        self._enable_dmabuf = enable_dmabuf
         self._ensure_dbus()
 
         # Try to restore from token
@@ -186,38 +371,74 @@ class UnifiedRemoteDesktop:
 
     def close(self) -> None:
         """Release resources and close session"""
-        # Stop GStreamer pipeline
+        # Let queued type_text_async() calls finish while the session is up
+        if self._input_executor is not None:
+            self._input_executor.shutdown(wait=True)
+            self._input_executor = None
+
+        if self._pipeline_thread is not None:
+            self._pipeline_thread.join()
+            self._pipeline_thread = None
+            self._pipeline_error = None
+
+        # Stop GStreamer pipeline; it is rebound to the next session's node
         if self._pipeline:
             self._pipeline.set_state(Gst.State.NULL)
+            self._idle_pipeline = (self._pipeline, self._pipewiresrc, self._appsink)
             self._pipeline = None
+            self._pipewiresrc = None
             self._appsink = None
-
-        # Close portal session
-        if self._session_handle and self._portal:
+        self._pipeline_playing = False
+        self._last_sample = None
+        self._last_frame = None
+
+        if self._dmabuf_pipeline:
+            self._dmabuf_pipeline.set_state(Gst.State.NULL)
+            self._dmabuf_pipeline = None
+            self._dmabuf_appsink = None
+        self._last_dmabuf_sample = None
+
+        # Close portal session. Close lives on the Session object itself;
+        # without a callback Gio sends it as NO_REPLY_EXPECTED, so only the
+        # flush (not a portal round-trip) is waited for.
+        if self._session_handle and self._bus:
             try:
-                self._portal.call_sync(
+                self._bus.call(
+                    self.PORTAL_BUS,
+                    self._session_handle,
+                    'org.freedesktop.portal.Session',
                     'Close',
-                    GLib.Variant('(o)', (self._session_handle,)),
+                    None,
+                    None,
                     Gio.DBusCallFlags.NONE,
-                    5000,
+                    -1,
+                    None,
                     None
                 )
+                self._bus.flush_sync(None)
             except Exception:
                 pass
 
         self._session_handle = None
+        self._session_variant = None
         self._pipewire_node = None
         self._initialized = False
 
     # ==================== Input Control ====================
 
-    def click(self, point: Point, button: int = 1) -> None:
+    def click(self, point: Point, button: int = 1, dwell_ms: int = 0) -> None:
         """
         Click at screen coordinates
 
+        Motion, press and release are submitted back-to-back as
+        asynchronous portal calls and only their replies are awaited, so a
+        click costs about one round-trip.
+
         Args:
             point: Screen coordinates (x, y)
             button: Mouse button (1=left, 2=middle, 3=right)
+            dwell_ms: Time to hold the button down, for apps that miss
+                instant clicks (0 = release immediately)
 
         Raises:
             RuntimeError: Not initialized
@@ -230,14 +451,18 @@ class UnifiedRemoteDesktop:
         if not self._initialized:
             raise RuntimeError("Not initialized - call initialize() first")
 
+        self._notify_error = None
         try:
-            self._notify_pointer_motion(point.x, point.y)
-            time.sleep(0.05)
-            self._notify_pointer_button(button, pressed=True)
-            time.sleep(0.05)
-            self._notify_pointer_button(button, pressed=False)
+            self._notify_async(*self._pointer_motion_call(point.x, point.y), "Click failed")
+            self._notify_async('NotifyPointerButton',
+                               self._pointer_button_params(button, True), "Click failed")
+            self._dwell(dwell_ms)
+            self._notify_async('NotifyPointerButton',
+                               self._pointer_button_params(button, False), "Click failed")
         except Exception as e:
+            self._wait_in_flight(0, raise_error=False)
             raise InputError(f"Click failed: {e}") from e
+        self._wait_in_flight(0)
 
     def move_mouse(self, point: Point) -> None:
         """
@@ -257,35 +482,164 @@ class UnifiedRemoteDesktop:
         except Exception as e:
             raise InputError(f"Mouse move failed: {e}") from e
 
-    def type_text(self, text: str, interval: float = 0.01) -> None:
+    def type_text(self, text: str, interval: float = 0.0) -> None:
         """
         Type text string
 
+        Keystrokes are submitted as asynchronous portal calls: up to
+        MAX_IN_FLIGHT are on the wire at once and their replies are only
+        collected at the end, so typing costs about one round-trip in
+        total instead of two per character. With an interval, keystrokes
+        are scheduled on a fixed timeline from the GLib main context.
+
         Args:
             text: Unicode text to type
-            interval: Delay between characters (seconds)
+            interval: Delay between characters (seconds); 0 = as fast
+                as the portal accepts them
+
+        Raises:
+            RuntimeError: Not initialized
+            InputError: Typing failed
 
         Example:
             >>> desktop.type_text("Hello World!")
-            >>> desktop.type_text("Fast", interval=0.001)
+            >>> desktop.type_text("Slow", interval=0.05)
         """
         if not self._initialized:
             raise RuntimeError("Not initialized")
 
-        for char in text:
+        self._notify_error = None
+
+        if interval <= 0:
+            for char in text:
+                # Each character is two calls
+                self._wait_in_flight(self.MAX_IN_FLIGHT - 2)
+                self._type_char(char)
+            self._wait_in_flight(0)
+            return
+
+        fired = 0
+        error: Optional[InputError] = None
+
+        def on_timeout(char: str) -> bool:
+            nonlocal fired, error
+            fired += 1
             try:
-                self._notify_keyboard_keysym(char, pressed=True)
-                time.sleep(interval)
-                self._notify_keyboard_keysym(char, pressed=False)
-            except Exception as e:
-                raise InputError(f"Typing failed at char '{char}': {e}") from e
+                self._type_char(char)
+            except InputError as e:
+                error = e
+            return False  # one-shot
+
+        # Attached to the thread's context, which is the default one
+        # unless called from type_text_async()
+        context = GLib.MainContext.ref_thread_default()
+        interval_ms = interval * 1000
+        sources = []
+        for i, char in enumerate(text):
+            source = GLib.timeout_source_new(int(i * interval_ms))
+            source.set_callback(on_timeout, char)
+            source.attach(context)
+            sources.append(source)
+
+        while fired < len(sources) and error is None and self._notify_error is None:
+            context.iteration(True)
+
+        if fired < len(sources):
+            # Timeouts fire in order; drop the ones not yet dispatched
+            for source in sources[fired:]:
+                source.destroy()
+        if error is not None:
+            self._wait_in_flight(0, raise_error=False)
+            raise error
+        self._wait_in_flight(0)
+
+    def type_text_async(self, text: str, interval: float = 0.0) -> "Future[None]":
+        """
+        Type text in the background
+
+        Runs type_text() on a worker thread with its own GLib main context
+        and returns at once, so the caller can keep capturing frames while
+        the text is typed. Calls are queued: a second type_text_async()
+        starts typing when the first one is done.
+
+        Do not call the other input methods until the future is done;
+        they share the same in-flight bookkeeping.
 
-    def press_key(self, key: str) -> None:
+        Args:
+            text: Unicode text to type
+            interval: Delay between characters (seconds)
+
+        Returns:
+            Future that resolves to None, or raises InputError
+
+        Raises:
+            RuntimeError: Not initialized
+
+        Example:
+            >>> typing = desktop.type_text_async("Hello World!", interval=0.05)
+            >>> while not typing.done():
+            ...     frames.append(desktop.get_frame())
+            >>> typing.result()  # re-raises InputError
+        """
+        if not self._initialized:
+            raise RuntimeError("Not initialized")
+
+        if self._input_executor is None:
+            self._input_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="open-alo-input"
+            )
+        return self._input_executor.submit(self._type_text_in_context, text, interval)
+
+    def _type_text_in_context(self, text: str, interval: float) -> None:
+        """type_text() with a private main context (worker thread of type_text_async)"""
+        context = GLib.MainContext.new()
+        context.push_thread_default()
+        try:
+            self.type_text(text, interval)
+        finally:
+            context.pop_thread_default()
+
+    def _type_char(self, char: str) -> None:
+        """Submit press and release of one character without waiting for replies"""
+        try:
+            what = f"Typing failed at char '{char}'"
+            self._notify_async('NotifyKeyboardKeysym', self._keysym_params(char, True), what)
+            self._notify_async('NotifyKeyboardKeysym', self._keysym_params(char, False), what)
+        except Exception as e:
+            raise InputError(f"Typing failed at char '{char}': {e}") from e
+
+    def _dwell(self, dwell_ms: int) -> None:
+        """Send the queued calls, then pause for ``dwell_ms`` milliseconds"""
+        if dwell_ms > 0:
+            self._bus.flush_sync(None)
+            time.sleep(dwell_ms / 1000)
+
+    def _wait_in_flight(self, limit: int, raise_error: bool = True) -> None:
+        """Iterate the main context until at most ``limit`` asynchronous calls are pending"""
+        # Replies are dispatched to the context that was thread-default
+        # when the calls were made
+        context = GLib.MainContext.ref_thread_default()
+        while self._in_flight > limit:
+            context.iteration(True)
+
+        if raise_error and self._notify_error is not None:
+            error, self._notify_error = self._notify_error, None
+            raise error
+
+    def press_key(self, key: str, dwell_ms: int = 0) -> None:
         """
         Press and release a single key
 
+        Press and release are submitted back-to-back as asynchronous
+        portal calls; only their replies are awaited.
+
         Args:
             key: Key name (e.g., "Return", "Escape", "a")
+            dwell_ms: Time to hold the key down (0 = release immediately)
+
+        Raises:
+            RuntimeError: Not initialized
+            InputError: Key press failed
 
         Example:
             >>> desktop.press_key("Return")  # Enter
@@ -296,12 +650,17 @@ class UnifiedRemoteDesktop:
 
         key = normalize_key(key)
 
+        self._notify_error = None
         try:
-            self._notify_keyboard_keysym(key, pressed=True)
-            time.sleep(0.05)
-            self._notify_keyboard_keysym(key, pressed=False)
+            self._notify_async('NotifyKeyboardKeysym',
+                               self._keysym_params(key, True), "Key press failed")
+            self._dwell(dwell_ms)
+            self._notify_async('NotifyKeyboardKeysym',
+                               self._keysym_params(key, False), "Key press failed")
         except Exception as e:
+            self._wait_in_flight(0, raise_error=False)
             raise InputError(f"Key press failed: {e}") from e
+        self._wait_in_flight(0)
 
     def key_combo(self, keys: List[str]) -> None:
         """
@@ -321,27 +680,42 @@ class UnifiedRemoteDesktop:
         keys = [normalize_key(k) for k in keys]
 
         try:
-            # Press all keys
+            # Queue the whole chain as one-way calls; D-Bus keeps messages
+            # from one connection in order, so the portal sees modifiers
+            # go down before the final key and come up after it
             for key in keys:
-                self._notify_keyboard_keysym(key, pressed=True)
-                time.sleep(0.05)
+                self._notify_keyboard_keysym(key, pressed=True, no_reply=True)
 
             # Release in reverse order
             for key in reversed(keys):
-                self._notify_keyboard_keysym(key, pressed=False)
-                time.sleep(0.05)
+                self._notify_keyboard_keysym(key, pressed=False, no_reply=True)
+
+            self._bus.flush_sync(None)
 
         except Exception as e:
             raise InputError(f"Key combo failed: {e}") from e
 
     # ==================== Screen Capture ====================
 
-    def capture_screenshot(self) -> bytes:
+    def capture_screenshot(self, format: str = "jpeg",
+                           quality: int = 85) -> Union[bytes, Frame]:
         """
-        Capture a single screenshot (PNG)
+        Capture a single screenshot
+
+        JPEG is the default: encoding is several times faster than PNG
+        (no DEFLATE pass over the whole frame) and is what vision models
+        consume anyway. Use format="png" when a lossless image is required,
+        or format="raw" to skip encoding altogether. While the screen is
+        unchanged, repeated calls return the previous image without
+        re-encoding it.
+
+        Args:
+            format: Image format, "jpeg" or "png", or "raw" for the
+                unencoded frame
+            quality: JPEG quality (0-100), ignored for PNG
 
         Returns:
-            PNG image data as bytes
+            Encoded image data as bytes, or a Frame for format="raw"
 
         Raises:
             RuntimeError: Not initialized or capture not enabled
@@ -349,7 +723,8 @@ class UnifiedRemoteDesktop:
 
         Example:
             >>> screenshot = desktop.capture_screenshot()
-            >>> Path("/tmp/shot.png").write_bytes(screenshot)
+            >>> Path("/tmp/shot.jpg").write_bytes(screenshot)
+            >>> lossless = desktop.capture_screenshot(format="png")
         """
         if not self._initialized:
             raise RuntimeError("Not initialized")
@@ -361,39 +736,92 @@ class UnifiedRemoteDesktop:
             # Ensure pipeline is running
             self._ensure_pipeline()
 
-            # Get a frame from the appsink
-            sample = self._appsink.emit("pull-sample")
+            sample = self._pull_sample(self.CAPTURE_TIMEOUT)
             if not sample:
                 raise CaptureError("No sample available")
 
-            buffer = sample.get_buffer()
-            if not buffer:
-                raise CaptureError("No buffer in sample")
+            if format == "raw":
+                return Frame(sample)
+            return self._encode_frame(sample, format, quality)
+
+        except Exception as e:
+            raise CaptureError(f"Screenshot failed: {e}") from e
+
+    def capture_screenshot_to_file(self, path_or_fd, format: Optional[str] = None,
+                                   quality: int = 85) -> None:
+        """
+        Capture a screenshot and write it straight to a file
+
+        The encoder streams into the file, so the encoded image never
+        becomes a Python bytes object.
 
-            # Extract PNG data
-            success, map_info = buffer.map(Gst.MapFlags.READ)
-            if not success:
-                raise CaptureError("Failed to map buffer")
+        Args:
+            path_or_fd: Destination path (str or Path) or an open, writable
+                file descriptor (left open)
+            format: Image format, "jpeg" or "png". Defaults to "png" for
+                paths ending in .png and "jpeg" otherwise
+            quality: JPEG quality (0-100), ignored for PNG
 
+        Raises:
+            RuntimeError: Not initialized or capture not enabled
+            CaptureError: Screenshot failed
+
+        Example:
+            >>> desktop.capture_screenshot_to_file("/tmp/shot.jpg")
+            >>> desktop.capture_screenshot_to_file("/tmp/shot.png")
+        """
+        if not self._initialized:
+            raise RuntimeError("Not initialized")
+
+        if self._pipewire_node is None:
+            raise RuntimeError("Screen capture not enabled - initialize with enable_capture=True")
+
+        if format is None:
+            is_png = (not isinstance(path_or_fd, int)
+                      and str(path_or_fd).lower().endswith(".png"))
+            format = "png" if is_png else "jpeg"
+
+        try:
+            keys, values = self._encode_options(format, quality)
+            self._ensure_pipeline()
+
+            sample = self._pull_sample(self.CAPTURE_TIMEOUT)
+            if not sample:
+                raise CaptureError("No sample available")
+
+            pixbuf = self._sample_to_pixbuf(sample)
+            stream = self._open_output_stream(path_or_fd)
             try:
-                png_data = bytes(map_info.data)
-                return png_data
+                if not pixbuf.save_to_streamv(stream, format, keys, values, None):
+                    raise CaptureError(f"Failed to encode {format.upper()}")
             finally:
-                buffer.unmap(map_info)
+                stream.close(None)
 
+        except CaptureError:
+            raise
         except Exception as e:
             raise CaptureError(f"Screenshot failed: {e}") from e
 
-    def get_frame(self) -> Optional[bytes]:
+    def get_frame(self, format: str = "jpeg",
+                  quality: int = 85) -> Optional[Union[bytes, Frame]]:
         """
         Get the latest frame from live stream (for real-time streaming)
 
+        Args:
+            format: Image format, "jpeg" or "png", or "raw" for the
+                unencoded frame (no copy, see Frame)
+            quality: JPEG quality (0-100), ignored for PNG
+
         Returns:
-            PNG frame data or None if no frame available
+            Encoded frame data (a Frame for format="raw") or None if no
+            frame has arrived yet
 
         Note:
             This method is non-blocking. For continuous streaming, call repeatedly.
-            For a guaranteed frame, use capture_screenshot() instead.
+            When the screen has not changed since the last call, the previous
+            encoded frame is returned again without re-encoding. For a
+            guaranteed frame, use
+            capture_screenshot() instead.
 
         Example:
             >>> while True:
@@ -404,128 +832,229 @@ class UnifiedRemoteDesktop:
         if not self._initialized or self._pipewire_node is None:
             return None
 
+        # Still starting up (see _start_pipeline_thread); don't block
+        if self._pipeline_thread is not None and self._pipeline_thread.is_alive():
+            return None
+
         try:
             self._ensure_pipeline()
 
-            # Try to pull sample (non-blocking)
-            # Uses try-pull-sample which returns immediately if no frame buffered
-            sample = self._appsink.emit("try-pull-sample", 0)
+            # Non-blocking: newest buffered frame, or the last one seen
+            sample = self._pull_sample(0)
             if not sample:
                 return None
 
-            buffer = sample.get_buffer()
-            if not buffer:
-                return None
+            if format == "raw":
+                return Frame(sample)
+            return self._encode_frame(sample, format, quality)
 
-            success, map_info = buffer.map(Gst.MapFlags.READ)
-            if not success:
-                return None
+        except Exception:
+            return None
 
-            try:
-                return bytes(map_info.data)
-            finally:
-                buffer.unmap(map_info)
+    def capture_screenshot_into(self, buf: memoryview, format: str = "jpeg",
+                                quality: int = 85) -> int:
+        """
+        Capture a screenshot into a caller-owned buffer
+
+        Avoids allocating a new ``bytes`` object per capture. Allocate the
+        buffer once (e.g. ``bytearray(width * height * 4)``) and reuse it;
+        a bytearray that is too short is grown in place, so an empty
+        ``bytearray()`` works too. Each call overwrites the previous
+        contents.
+
+        Args:
+            buf: Writable buffer (bytearray, memoryview, ...)
+            format: Image format, "jpeg" or "png", or "raw" for the
+                unencoded BGRx rows (stride = bytes written // height)
+            quality: JPEG quality (0-100), ignored for PNG
+
+        Returns:
+            Number of bytes written to ``buf``
+
+        Raises:
+            RuntimeError: Not initialized or capture not enabled
+            CaptureError: Screenshot failed or buffer too small
+
+        Example:
+            >>> buf = bytearray(width * height * 4)
+            >>> n = desktop.capture_screenshot_into(buf)
+            >>> Path("/tmp/shot.jpg").write_bytes(memoryview(buf)[:n])
+            >>> n = desktop.capture_screenshot_into(buf, format="raw")
+        """
+        if not self._initialized:
+            raise RuntimeError("Not initialized")
+
+        if self._pipewire_node is None:
+            raise RuntimeError("Screen capture not enabled - initialize with enable_capture=True")
+
+        try:
+            self._ensure_pipeline()
+
+            sample = self._pull_sample(self.CAPTURE_TIMEOUT)
+            if not sample:
+                raise CaptureError("No sample available")
+
+            return self._sample_into(sample, format, quality, buf)
+
+        except CaptureError:
+            raise
+        except Exception as e:
+            raise CaptureError(f"Screenshot failed: {e}") from e
+
+    def get_frame_into(self, buf: memoryview, format: str = "jpeg", quality: int = 85) -> int:
+        """
+        Copy the latest live-stream frame into a caller-owned buffer
+
+        Non-blocking counterpart of capture_screenshot_into().
+
+        Args:
+            buf: Writable buffer (bytearray, memoryview, ...)
+            format: Image format, "jpeg" or "png", or "raw"
+            quality: JPEG quality (0-100), ignored for PNG
+
+        Returns:
+            Number of bytes written, or 0 if no frame is available
+        """
+        if not self._initialized or self._pipewire_node is None:
+            return 0
+
+        # Still starting up (see _start_pipeline_thread); don't block
+        if self._pipeline_thread is not None and self._pipeline_thread.is_alive():
+            return 0
+
+        try:
+            self._ensure_pipeline()
+
+            sample = self._pull_sample(0)
+            if not sample:
+                return 0
+
+            return self._sample_into(sample, format, quality, buf)
 
         except Exception:
-            return None
+            return 0
+
+    def get_frame_dmabuf(self) -> Optional[DmaBufFrame]:
+        """
+        Get the latest frame as a DMA-BUF (zero-copy path)
+
+        The frame stays in GPU memory; nothing is mapped or copied by the
+        CPU. Consumers import the fd via EGL (EGL_EXT_image_dma_buf_import),
+        CUDA external memory or Vulkan. capture_screenshot() and get_frame()
+        keep returning encoded images for backwards compatibility.
+
+        PipeWire only delivers frames on damage; while the screen is idle
+        the previous frame is still current and is returned again without
+        waiting. Only the first call waits (up to CAPTURE_TIMEOUT).
+
+        Returns:
+            DmaBufFrame (fd, stride, fourcc, modifier, width, height),
+            or None if no frame is available yet
+
+        Raises:
+            RuntimeError: Not initialized with enable_dmabuf=True
+            CaptureError: Stream did not negotiate DMA-BUF memory
+
+        Example:
+            >>> desktop.initialize(enable_dmabuf=True)
+            >>> frame = desktop.get_frame_dmabuf()
+            >>> fd, stride, fourcc, modifier, width, height = frame
+        """
+        if not self._initialized or self._pipewire_node is None:
+            raise RuntimeError("Screen capture not enabled - initialize with enable_capture=True")
+
+        if not self._enable_dmabuf:
+            raise RuntimeError("DMA-BUF not enabled - initialize with enable_dmabuf=True")
+
+        self._ensure_dmabuf_pipeline()
+
+        # Same policy as _pull_sample(): drain to the newest buffer, fall
+        # back to the last one when nothing new arrived
+        pull = self._dmabuf_appsink.try_pull_sample
+        sample = None
+        newer = pull(0)
+        while newer is not None:
+            sample, newer = newer, pull(0)
+        if sample is None:
+            sample = self._last_dmabuf_sample
+            if sample is None:
+                sample = pull(self.CAPTURE_TIMEOUT)
+                if sample is None:
+                    return None
+
+        self._last_dmabuf_sample = sample
+        return self._sample_to_dmabuf(sample)
 
     def get_screen_size(self) -> Optional[Tuple[int, int]]:
         """
         Get screen resolution
 
+        Waits for the capture pipeline started by initialize() (see
+        _start_pipeline_thread), and for the first frame if the stream has
+        not negotiated its size yet.
+
         Returns:
-            (width, height) or None if not available
+            (width, height) or None if capture is not enabled or no frame
+            arrived within CAPTURE_TIMEOUT
+
+        Raises:
+            CaptureError: The capture pipeline failed to start
         """
-        if not self._pipeline:
+        if not self._initialized or self._pipewire_node is None:
             return None
 
-        # Get caps from pipeline
-        try:
-            pad = self._appsink.get_static_pad("sink")
-            caps = pad.get_current_caps()
-            if caps:
-                struct = caps.get_structure(0)
-                width = struct.get_int("width")[1]
-                height = struct.get_int("height")[1]
-                return (width, height)
-        except Exception:
-            pass
+        self._ensure_pipeline()
 
-        return None
+        caps = self._appsink.get_static_pad("sink").get_current_caps()
+        if caps is None:
+            # Not negotiated yet; the first frame carries the caps
+            sample = self._pull_sample(self.CAPTURE_TIMEOUT)
+            if sample is None:
+                return None
+            caps = sample.get_caps()
+
+        struct = caps.get_structure(0)
+        return (struct.get_int("width")[1], struct.get_int("height")[1])
 
     # ==================== Private Portal Methods ====================
 
     def _create_session(self, persist_mode: int, enable_capture: bool) -> None:
         """Create unified session with both input and capture"""
-        loop = GLib.MainLoop()
-        session_handle: Optional[str] = None
-        error_code: int = -1
-
-        token = uuid.uuid4().hex[:8]
-        options = {
-            'session_handle_token': GLib.Variant('s', f'unified_{token}'),
-            'handle_token': GLib.Variant('s', f'req_{token}')
-        }
-
-        result = self._portal.call_sync(
-            'CreateSession',
-            GLib.Variant('(a{sv})', (options,)),
-            Gio.DBusCallFlags.NONE,
-            10000,
-            None
-        )
-
-        request_path = result[0]
-
-        def on_response(conn, sender, path, iface, signal, params):
-            nonlocal session_handle, error_code
-            error_code, results = params
-            if error_code == 0:
-                session_handle = str(results['session_handle'])
-            loop.quit()
-
-        sub_id = self._bus.signal_subscribe(
-            self.PORTAL_BUS,
-            'org.freedesktop.portal.Request',
-            'Response',
-            request_path,
-            None,
-            Gio.DBusSignalFlags.NONE,
-            on_response
+        error_code, results = self._portal_session.request(
+            self._portal, 'CreateSession', '(a{sv})', (),
+            {'session_handle_token': GLib.Variant('s', f'unified_{uuid.uuid4().hex[:8]}')}
         )
-
-        GLib.timeout_add_seconds(30, loop.quit)
-        loop.run()
-        self._bus.signal_unsubscribe(sub_id)
-
-        if session_handle is None:
+        if error_code != 0:
             if error_code == 1:
                 raise PermissionDenied("User denied permission")
             else:
                 raise SessionError(f"Failed to create session (code: {error_code})")
 
+        session_handle = str(results['session_handle'])
         self._session_handle = session_handle
+        self._session_variant = GLib.Variant.new_object_path(session_handle)
 
-        # Select input devices (keyboard/mouse)
-        self._select_devices(persist_mode)
-
-        # Select capture sources (if enabled)
+        # Input devices (keyboard/mouse) and capture sources are independent
+        # selections on the same session: issue both, then wait once
+        calls = [(self._portal, 'SelectDevices', '(oa{sv})', (session_handle,),
+                  self._select_devices_options(persist_mode))]
         if enable_capture:
-            self._select_sources()
+            # SelectSources is called on ScreenCast interface, not RemoteDesktop
+            calls.append((self._screencast_portal, 'SelectSources', '(oa{sv})', (session_handle,),
+                          self._select_sources_options()))
 
-        # Start the unified session (shows permission dialog)
-        self._start_session(enable_capture=enable_capture)
+        responses = self._portal_session.requests(calls)
+        if responses[0][0] != 0:
+            raise PermissionDenied("User denied device access")
+        if enable_capture and responses[1][0] != 0:
+            raise PermissionDenied("User denied source selection")
 
-    def _select_devices(self, persist_mode: int) -> None:
-        """Select input devices (keyboard, mouse, touchscreen)"""
-        loop = GLib.MainLoop()
-        success = False
+        # Start the unified session (shows permission dialog)
+        self._start_session(enable_capture=enable_capture, persist_mode=persist_mode)
 
-        dev_token = uuid.uuid4().hex[:8]
-        options = {
-            'types': GLib.Variant('u', self.DEVICE_ALL),
-            'handle_token': GLib.Variant('s', f'dev_{dev_token}'),
-        }
+    def _select_devices_options(self, persist_mode: int) -> Dict[str, GLib.Variant]:
+        """SelectDevices options: keyboard, mouse and touchscreen"""
+        options = {'types': GLib.Variant('u', self.DEVICE_ALL)}
 
         if persist_mode > 0:
             options['persist_mode'] = GLib.Variant('u', persist_mode)
@@ -535,135 +1064,34 @@ class UnifiedRemoteDesktop:
             if token:
                 options['restore_token'] = GLib.Variant('s', token)
 
-        result = self._portal.call_sync(
-            'SelectDevices',
-            GLib.Variant('(oa{sv})', (self._session_handle, options)),
-            Gio.DBusCallFlags.NONE,
-            10000,
-            None
-        )
-
-        request_path = result[0]
-
-        def on_response(conn, sender, path, iface, signal, params):
-            nonlocal success
-            error_code, results = params
-            if error_code == 0:
-                success = True
-                # Save restore token
-                if persist_mode > 0 and isinstance(results, dict):
-                    if 'restore_token' in results:
-                        restore_token = results['restore_token']
-                        if isinstance(restore_token, GLib.Variant):
-                            restore_token = restore_token.get_string()
-                        self._save_token(restore_token)
-            loop.quit()
-
-        sub_id = self._bus.signal_subscribe(
-            self.PORTAL_BUS,
-            'org.freedesktop.portal.Request',
-            'Response',
-            request_path,
-            None,
-            Gio.DBusSignalFlags.NONE,
-            on_response
-        )
-
-        GLib.timeout_add_seconds(30, loop.quit)
-        loop.run()
-        self._bus.signal_unsubscribe(sub_id)
+        return options
 
-        if not success:
-            raise PermissionDenied("User denied device access")
-
-    def _select_sources(self) -> None:
-        """Select capture sources (monitor/window)"""
-        loop = GLib.MainLoop()
-        success = False
-
-        src_token = uuid.uuid4().hex[:8]
-        options = {
+    def _select_sources_options(self) -> Dict[str, GLib.Variant]:
+        """SelectSources options: a single monitor"""
+        return {
             'types': GLib.Variant('u', self.SOURCE_MONITOR),
             'multiple': GLib.Variant('b', False),
             'cursor_mode': GLib.Variant('u', 2),  # Embedded
-            'handle_token': GLib.Variant('s', f'src_{src_token}')
         }
 
-        # SelectSources is called on ScreenCast interface, not RemoteDesktop
-        result = self._screencast_portal.call_sync(
-            'SelectSources',
-            GLib.Variant('(oa{sv})', (self._session_handle, options)),
-            Gio.DBusCallFlags.NONE,
-            10000,
-            None
-        )
+    def _start_session(self, enable_capture: bool = True, persist_mode: int = 0) -> None:
+        """
+        Start the unified session - shows permission dialog
 
-        request_path = result[0]
-
-        def on_response(conn, sender, path, iface, signal, params):
-            nonlocal success
-            error_code, _ = params
-            if error_code == 0:
-                success = True
-            loop.quit()
-
-        sub_id = self._bus.signal_subscribe(
-            self.PORTAL_BUS,
-            'org.freedesktop.portal.Request',
-            'Response',
-            request_path,
-            None,
-            Gio.DBusSignalFlags.NONE,
-            on_response
+        The dialog is skipped when SelectDevices carried a valid restore
+        token. Tokens are single-use: the portal hands out a fresh one in
+        the Start response, which is saved for the next run.
+        """
+        error_code, results = self._portal_session.request(
+            self._portal, 'Start', '(osa{sv})', (self._session_handle, ''), {}
         )
 
-        GLib.timeout_add_seconds(30, loop.quit)
-        loop.run()
-        self._bus.signal_unsubscribe(sub_id)
-
-        if not success:
-            raise PermissionDenied("User denied source selection")
-
-    def _start_session(self, enable_capture: bool = True) -> None:
-        """Start the unified session - shows permission dialog"""
-        loop = GLib.MainLoop()
         streams = None
-
-        start_token = uuid.uuid4().hex[:8]
-        options = {
-            'handle_token': GLib.Variant('s', f'start_{start_token}'),
-        }
-
-        result = self._portal.call_sync(
-            'Start',
-            GLib.Variant('(osa{sv})', (self._session_handle, '', options)),
-            Gio.DBusCallFlags.NONE,
-            30000,
-            None
-        )
-
-        request_path = result[0]
-
-        def on_response(conn, sender, path, iface, signal, params):
-            nonlocal streams
-            error_code, results = params
-            if error_code == 0:
-                streams = results.get('streams')
-            loop.quit()
-
-        sub_id = self._bus.signal_subscribe(
-            self.PORTAL_BUS,
-            'org.freedesktop.portal.Request',
-            'Response',
-            request_path,
-            None,
-            Gio.DBusSignalFlags.NONE,
-            on_response
-        )
-
-        GLib.timeout_add_seconds(30, loop.quit)
-        loop.run()
-        self._bus.signal_unsubscribe(sub_id)
+        if error_code == 0:
+            streams = results.get('streams')
+            restore_token = results.get('restore_token')
+            if persist_mode > 0 and restore_token:
+                self._save_token(str(restore_token))
 
         if enable_capture and streams is None:
             raise SessionError("Failed to start session")
@@ -674,7 +1102,7 @@ class UnifiedRemoteDesktop:
             if isinstance(stream_info, tuple) and len(stream_info) >= 1:
                 self._pipewire_node = int(stream_info[0])
                 # Set up GStreamer pipeline for screen capture
-                self._setup_gstreamer_pipeline()
+                self._start_pipeline_thread()
 
     def _restore_session(self) -> bool:
         """Try to restore from saved token"""
@@ -683,158 +1111,496 @@ class UnifiedRemoteDesktop:
         return False
 
     def _load_token(self) -> Optional[str]:
-        """Load restore token from disk"""
-        try:
-            if self._token_path.exists():
-                data = json.loads(self._token_path.read_text())
-                return data.get('restore_token')
-        except Exception:
-            pass
-        return None
+        """Load restore token from disk (read once, then cached)"""
+        if not self._token_loaded:
+            self._cached_token = _load_restore_token(self._token_path)
+            self._token_loaded = True
+        return self._cached_token
 
     def _save_token(self, token: str) -> None:
-        """Save restore token to disk"""
-        try:
-            self._token_path.parent.mkdir(parents=True, exist_ok=True)
-            data = {
-                'restore_token': token,
-                'timestamp': time.time(),
-                'version': 1
-            }
-            self._token_path.write_text(json.dumps(data))
-        except Exception:
-            pass
+        """
+        Save restore token to disk (atomically, see _save_restore_token)
 
-    def _setup_gstreamer_pipeline(self) -> None:
-        """Set up GStreamer pipeline for screen capture"""
-        if not self._pipewire_node:
+        Skipped when the token on disk is already this one.
+        """
+        if token == self._load_token():
             return
 
-        # Create pipeline: PipeWire source → convert → PNG encode → appsink
-        pipeline_str = (
-            f'pipewiresrc path={self._pipewire_node} ! '
-            f'videoconvert ! '
-            f'video/x-raw,format=RGB ! '
-            f'pngenc ! '
-            f'appsink name=sink'
+        if _save_restore_token(self._token_path, token):
+            self._cached_token = token
+
+    def _start_pipeline_thread(self) -> None:
+        """
+        Start the capture pipeline in a background thread
+
+        Reaching PLAYING takes a while; initialize() returns meanwhile and
+        the first capture waits for the thread in _ensure_pipeline(), which
+        re-raises whatever the setup failed with.
+        """
+        def setup():
+            try:
+                self._start_capture_pipeline()
+            except Exception as e:
+                # Not only CaptureError: a GLib.Error from the elements must
+                # reach the waiter instead of dying with the thread
+                self._pipeline_error = e
+
+        self._pipeline_error = None
+        self._pipeline_thread = threading.Thread(
+            target=setup, name="open-alo-pipeline", daemon=True
         )
+        self._pipeline_thread.start()
+
+    def _start_capture_pipeline(self) -> None:
+        """
+        Build the capture pipeline and wait for it to start
+
+        The one place the capture pipeline is started, from the setup
+        thread or on demand from _ensure_pipeline().
+
+        Raises:
+            CaptureError: The pipeline could not be built or failed to start
+        """
+        self._new_capture_pipeline()
+
+        ret = self._pipeline.set_state(Gst.State.PLAYING)
+        if ret == Gst.StateChangeReturn.FAILURE:
+            self._drop_capture_pipeline()
+            raise CaptureError("Failed to start GStreamer pipeline")
+
+        # Wait until the sink has its first frame, or the pipeline fails;
+        # a slow stream is left to the capture's own pull timeout
+        bus = self._pipeline.get_bus()
+        msg = bus.timed_pop_filtered(self.PIPELINE_START_TIMEOUT,
+                                     Gst.MessageType.ASYNC_DONE | Gst.MessageType.ERROR)
+        if msg is not None and msg.type == Gst.MessageType.ERROR:
+            error, _ = msg.parse_error()
+            self._drop_capture_pipeline()
+            raise CaptureError(f"Failed to start GStreamer pipeline: {error.message}")
+
+    def _drop_capture_pipeline(self) -> None:
+        """Stop and forget a pipeline that failed to start"""
+        self._pipeline.set_state(Gst.State.NULL)
+        self._pipeline = None
+        self._pipewiresrc = None
+        self._appsink = None
+
+    def _new_capture_pipeline(self) -> None:
+        """
+        Create the (stopped) capture pipeline on the current PipeWire node
+
+        PipeWire source → raw BGRx → appsink (frames are encoded on demand,
+        see _encode_sample). BGRx is what PipeWire produces on most
+        compositors, so videoconvert is in passthrough.
+
+        The elements are created directly rather than parsed from a
+        pipeline description, and a pipeline stopped by close() is kept:
+        the next session only points its pipewiresrc at the new node.
+
+        Raises:
+            CaptureError: An element is missing or could not be linked
+        """
+        if self._idle_pipeline is not None:
+            self._pipeline, self._pipewiresrc, self._appsink = self._idle_pipeline
+            self._idle_pipeline = None
+            self._pipewiresrc.set_property('path', str(self._pipewire_node))
+            return
+
+        elements = []
+        for factory in ('pipewiresrc', 'videoconvert', 'appsink'):
+            element = Gst.ElementFactory.make(factory, None)
+            if element is None:
+                raise CaptureError(f"GStreamer element '{factory}' not available")
+            elements.append(element)
+        source, convert, sink = elements
+
+        source.set_property('path', str(self._pipewire_node))
+        sink.set_property('max-buffers', 1)
+        sink.set_property('drop', True)
+        # Frames are pulled, never signalled (see _pull_sample)
+        sink.set_property('emit-signals', False)
+
+        pipeline = Gst.Pipeline.new(None)
+        for element in elements:
+            pipeline.add(element)
+        if not (source.link(convert)
+                and convert.link_filtered(sink, Gst.Caps.from_string('video/x-raw,format=BGRx'))):
+            raise CaptureError("Failed to link capture pipeline")
+
+        self._pipeline, self._pipewiresrc, self._appsink = pipeline, source, sink
+
+    # ==================== Private Capture Helpers ====================
+
+    def _pull_sample(self, timeout: int) -> Optional[Gst.Sample]:
+        """
+        Return the newest frame from the appsink
+
+        The appsink keeps only the latest buffer (max-buffers=1 drop=true),
+        but a burst can land while we pull; drain until the queue is empty
+        so the returned frame is never older than one frame period
+        (skipped frames are counted in ``_dropped_frames``). When nothing
+        new arrived since the last pull (idle screen) the previous frame is
+        still current and is returned as-is; only before the first frame do
+        we wait up to ``timeout`` nanoseconds.
+        """
+        pull = self._appsink.try_pull_sample
+        sample = pull(0)
+        if sample is not None:
+            newer = pull(0)
+            while newer is not None:
+                sample = newer
+                self._dropped_frames += 1
+                newer = pull(0)
+        elif self._last_sample is not None:
+            return self._last_sample
+        elif timeout:
+            sample = pull(timeout)
+
+        if sample is not None:
+            self._last_sample = sample
+        return sample
+
+    def _encode_frame(self, sample: Gst.Sample, format: str, quality: int) -> bytes:
+        """
+        Encode a sample, reusing the previous result when idle
+
+        PipeWire only produces a new buffer when the screen is damaged, so
+        getting the same buffer back from _pull_sample() means nothing has
+        changed and the last encoded image is still valid.
+        """
+        # Keyed on the buffer timestamp: a re-delivered buffer has the same
+        # PTS even when it arrives in a new sample
+        pts = sample.get_buffer().pts
+        key = sample if pts == Gst.CLOCK_TIME_NONE else pts
+
+        last = self._last_frame
+        if (last is not None and last[0] == key
+                and last[1] == format and last[2] == quality):
+            return last[3]
+
+        data = self._encode_sample(sample, format, quality)
+        self._last_frame = (key, format, quality, data)
+        return data
+
+    def _encode_sample(self, sample: Gst.Sample, format: str, quality: int) -> bytes:
+        """
+        Encode a raw BGRx sample from the appsink as JPEG or PNG
+
+        Encodes straight from the mapped buffer, with libjpeg-turbo /
+        libspng when installed (see _pixels.encode_bgrx).
+        """
+        self._encode_options(format, quality)  # validate before mapping
+
+        buffer = sample.get_buffer()
+        if not buffer:
+            raise CaptureError("No buffer in sample")
+        width, height, _ = _pixels.sample_geometry(sample)
+
+        success, map_info = buffer.map(Gst.MapFlags.READ)
+        if not success:
+            raise CaptureError("Failed to map buffer")
+
+        try:
+            data = map_info.data
+            return _pixels.encode_bgrx(data, width, height, len(data) // height,
+                                       format, quality)
+        finally:
+            buffer.unmap(map_info)
+
+    def _encode_options(self, format: str, quality: int) -> Tuple[List[str], List[str]]:
+        """Validate the image format and build GdkPixbuf save options"""
+        if format not in self.IMAGE_FORMATS:
+            raise ValueError(f"Unsupported image format: {format!r} (use 'jpeg' or 'png')")
+
+        if format == "jpeg":
+            return ["quality"], [str(int(quality))]
+        return [], []
+
+    def _sample_to_pixbuf(self, sample: Gst.Sample) -> GdkPixbuf.Pixbuf:
+        """Convert a raw BGRx sample from the appsink to an RGB GdkPixbuf"""
+        buffer = sample.get_buffer()
+        if not buffer:
+            raise CaptureError("No buffer in sample")
+
+        width, height, _ = _pixels.sample_geometry(sample)
+
+        success, map_info = buffer.map(Gst.MapFlags.READ)
+        if not success:
+            raise CaptureError("Failed to map buffer")
 
         try:
-            self._pipeline = Gst.parse_launch(pipeline_str)
-            self._appsink = self._pipeline.get_by_name('sink')
+            data = map_info.data
+            rgb = _pixels.bgrx_to_rgb(data, width, height, len(data) // height)
+        finally:
+            buffer.unmap(map_info)
 
-            # Start pipeline
-            self._pipeline.set_state(Gst.State.PLAYING)
+        return GdkPixbuf.Pixbuf.new_from_bytes(
+            GLib.Bytes.new(rgb), GdkPixbuf.Colorspace.RGB, False, 8, width, height, width * 3
+        )
 
-            # Wait for pipeline to reach PLAYING state
-            state_change = self._pipeline.get_state(Gst.CLOCK_TIME_NONE)
-            if state_change[0] != Gst.StateChangeReturn.SUCCESS:
-                raise CaptureError("Failed to start GStreamer pipeline")
+    @staticmethod
+    def _open_output_stream(path_or_fd) -> Gio.OutputStream:
+        """Open a Gio output stream on a path (replaced atomically) or an fd"""
+        if isinstance(path_or_fd, int):
+            try:
+                gi.require_version('GioUnix', '2.0')
+                from gi.repository import GioUnix
+                return GioUnix.OutputStream.new(path_or_fd, False)
+            except (ImportError, ValueError):
+                # GLib < 2.80 keeps the Unix streams in Gio itself
+                return Gio.UnixOutputStream.new(path_or_fd, False)
 
-        except Exception as e:
-            raise CaptureError(f"Failed to setup GStreamer pipeline: {e}")
+        gfile = Gio.File.new_for_path(str(path_or_fd))
+        return gfile.replace(None, False, Gio.FileCreateFlags.REPLACE_DESTINATION, None)
+
+    def _ensure_dmabuf_pipeline(self) -> None:
+        """
+        Build the DMA-BUF pipeline on first use
+
+        pipewiresrc → DMA-BUF caps → appsink, created element by element
+        like the capture pipeline (see _new_capture_pipeline). A pipeline
+        that fails to start is stopped and dropped, so the next call
+        builds a fresh one.
+
+        Raises:
+            CaptureError: An element is missing, or the pipeline could not
+                be linked or started
+        """
+        if self._dmabuf_pipeline is not None:
+            return
+
+        elements = []
+        for factory in ('pipewiresrc', 'capsfilter', 'appsink'):
+            element = Gst.ElementFactory.make(factory, None)
+            if element is None:
+                raise CaptureError(f"GStreamer element '{factory}' not available")
+            elements.append(element)
+        source, caps_filter, sink = elements
+
+        source.set_property('path', str(self._pipewire_node))
+        # always-copy=false lets pipewiresrc hand out the compositor's
+        # DMA-BUFs instead of copying them into system memory
+        source.set_property('always-copy', False)
+        caps_filter.set_property('caps', Gst.Caps.from_string('video/x-raw(memory:DMABuf)'))
+        sink.set_property('max-buffers', 1)
+        sink.set_property('drop', True)
+        sink.set_property('emit-signals', False)
+
+        pipeline = Gst.Pipeline.new(None)
+        for element in elements:
+            pipeline.add(element)
+        if not (source.link(caps_filter) and caps_filter.link(sink)):
+            raise CaptureError("Failed to link DMA-BUF pipeline")
+
+        if pipeline.set_state(Gst.State.PLAYING) == Gst.StateChangeReturn.FAILURE:
+            pipeline.set_state(Gst.State.NULL)
+            raise CaptureError("Failed to start DMA-BUF pipeline")
+
+        self._dmabuf_pipeline, self._dmabuf_appsink = pipeline, sink
+
+    def _sample_to_dmabuf(self, sample: Gst.Sample) -> DmaBufFrame:
+        """Describe a DMA-BUF backed sample without mapping it"""
+        gi.require_version('GstAllocators', '1.0')
+        gi.require_version('GstVideo', '1.0')
+        from gi.repository import GstAllocators, GstVideo
+
+        buffer = sample.get_buffer()
+        memory = buffer.peek_memory(0)
+        if not GstAllocators.is_dmabuf_memory(memory):
+            raise CaptureError("Stream did not negotiate DMA-BUF memory")
+
+        struct = sample.get_caps().get_structure(0)
+        width = struct.get_int("width")[1]
+        height = struct.get_int("height")[1]
+
+        # GStreamer >= 1.24 describes DMA-BUFs as drm-format="XR24:0x<modifier>"
+        drm_format = struct.get_string("drm-format")
+        if drm_format:
+            fourcc_str, _, modifier_str = drm_format.partition(":")
+            modifier = int(modifier_str, 16) if modifier_str else _DRM_FORMAT_MOD_LINEAR
+        else:
+            gst_format = struct.get_string("format")
+            fourcc_str = _GST_TO_DRM_FOURCC.get(gst_format)
+            if fourcc_str is None:
+                raise CaptureError(f"Unsupported DMA-BUF format: {gst_format}")
+            modifier = _DRM_FORMAT_MOD_LINEAR
+
+        fourcc = sum(ord(c) << (8 * i) for i, c in enumerate(fourcc_str[:4]))
+
+        # Plane layout comes from the video meta; assume packed 32bpp otherwise
+        meta = GstVideo.buffer_get_video_meta(buffer)
+        if meta is not None:
+            stride, offset = meta.stride[0], meta.offset[0]
+        else:
+            stride, offset = width * 4, 0
+
+        return DmaBufFrame(
+            fd=GstAllocators.dmabuf_memory_get_fd(memory),
+            stride=stride,
+            fourcc=fourcc,
+            modifier=modifier,
+            width=width,
+            height=height,
+            offset=offset,
+            _sample=sample,
+        )
+
+    @staticmethod
+    def _copy_into(data: bytes, buf: memoryview) -> int:
+        """Copy image data into a caller-owned buffer (growing a short bytearray)"""
+        size = len(data)
+        if isinstance(buf, bytearray) and size > len(buf):
+            # Grown once to the frame size, then reused as-is
+            buf.extend(bytes(size - len(buf)))
+
+        out = memoryview(buf).cast('B')
+        if size > len(out):
+            raise CaptureError(f"Buffer too small: need {size} bytes, got {len(out)}")
+        out[:size] = data
+        return size
+
+    def _sample_into(self, sample: Gst.Sample, format: str, quality: int,
+                     buf: memoryview) -> int:
+        """Write a sample into ``buf``: the encoded image, or the BGRx rows for raw"""
+        if format != "raw":
+            return self._copy_into(self._encode_frame(sample, format, quality), buf)
+
+        buffer = sample.get_buffer()
+        if not buffer:
+            raise CaptureError("No buffer in sample")
+
+        success, map_info = buffer.map(Gst.MapFlags.READ)
+        if not success:
+            raise CaptureError("Failed to map buffer")
+
+        try:
+            return self._copy_into(map_info.data, buf)
+        finally:
+            buffer.unmap(map_info)
 
     # ==================== Private Input Methods ====================
 
     def _notify_pointer_motion(self, x: int, y: int) -> None:
         """Send pointer motion event"""
-        options = {}
+        method, params = self._pointer_motion_call(x, y)
         self._portal.call_sync(
-            'NotifyPointerMotion',
-            GLib.Variant('(oa{sv}dd)', (self._session_handle, options, float(x), float(y))),
+            method,
+            params,
             Gio.DBusCallFlags.NONE,
             -1,
             None
         )
 
-    def _notify_pointer_button(self, button: int, pressed: bool) -> None:
-        """Send pointer button event"""
-        options = {}
-        state = 1 if pressed else 0
-        self._portal.call_sync(
-            'NotifyPointerButton',
-            GLib.Variant('(oa{sv}iu)', (self._session_handle, options, int(button), int(state))),
-            Gio.DBusCallFlags.NONE,
-            -1,
-            None
+    def _pointer_motion_call(self, x: int, y: int) -> Tuple[str, GLib.Variant]:
+        """
+        Portal method and arguments that move the pointer to (x, y)
+
+        NotifyPointerMotion takes a relative delta, so absolute coordinates
+        go through NotifyPointerMotionAbsolute on the screen cast stream.
+        Sessions without capture have no stream; they fall back to the
+        relative call.
+        """
+        if self._pipewire_node is None:
+            return 'NotifyPointerMotion', GLib.Variant.new_tuple(
+                self._session_variant, self._EMPTY_OPTS,
+                GLib.Variant.new_double(x), GLib.Variant.new_double(y)
+            )
+
+        # (oa{sv}udd): session, options, stream, x, y
+        return 'NotifyPointerMotionAbsolute', GLib.Variant.new_tuple(
+            self._session_variant, self._EMPTY_OPTS,
+            GLib.Variant.new_uint32(self._pipewire_node),
+            GLib.Variant.new_double(x), GLib.Variant.new_double(y)
         )
 
-    def _notify_keyboard_keysym(self, key: str, pressed: bool) -> None:
-        """Send keyboard key event using keysym"""
-        options = {}
-        state = 1 if pressed else 0
+    def _pointer_button_params(self, button: int, pressed: bool) -> GLib.Variant:
+        """(oa{sv}iu) arguments of NotifyPointerButton"""
+        return GLib.Variant.new_tuple(self._session_variant, self._EMPTY_OPTS,
+                                      GLib.Variant.new_int32(button),
+                                      GLib.Variant.new_uint32(1 if pressed else 0))
 
-        # Convert character to X11 keysym
-        keysym = self._char_to_keysym(key)
+    def _notify_keyboard_keysym(self, key: str, pressed: bool, no_reply: bool = False) -> None:
+        """
+        Send keyboard key event using keysym
+
+        With no_reply=True the call is only queued on the connection (the
+        portal method returns nothing useful); flush the bus afterwards.
+        """
+        params = self._keysym_params(key, pressed)
+
+        if no_reply:
+            # Without a callback Gio sends the message as NO_REPLY_EXPECTED
+            self._portal.call('NotifyKeyboardKeysym', params,
+                              Gio.DBusCallFlags.NONE, -1, None, None)
+            return
 
         self._portal.call_sync(
             'NotifyKeyboardKeysym',
-            GLib.Variant('(oa{sv}iu)', (self._session_handle, options, keysym, state)),
+            params,
             Gio.DBusCallFlags.NONE,
             -1,
             None
         )
 
-    def _char_to_keysym(self, char: str) -> int:
-        """Convert character to X11 keysym"""
-        # Simple mapping for common keys
-        # In production, use a complete keysym table
-        keysym_map = {
-            'Return': 0xFF0D,
-            'Escape': 0xFF1B,
-            'Tab': 0xFF09,
-            'BackSpace': 0xFF08,
-            'Delete': 0xFFFF,
-            'Left': 0xFF51,
-            'Up': 0xFF52,
-            'Right': 0xFF53,
-            'Down': 0xFF54,
-            'Control': 0xFFE3,
-            'Alt': 0xFFE9,
-            'Shift': 0xFFE1,
-            'Super': 0xFFEB,
-            ' ': 0x0020,
-        }
-
-        if char in keysym_map:
-            return keysym_map[char]
+    def _notify_async(self, method: str, params: GLib.Variant, what: str) -> None:
+        """
+        Submit a Notify* call without waiting for the reply
 
-        # For single characters, use Unicode value
-        if len(char) == 1:
-            return ord(char)
+        The reply is collected by _on_notify_done() while _wait_in_flight()
+        iterates the main context; a failure is raised there as
+        InputError("<what>: <error>").
+        """
+        self._portal.call(method, params, Gio.DBusCallFlags.NONE, -1,
+                          None, self._on_notify_done, what)
+        self._in_flight += 1
 
-        return 0
+    def _on_notify_done(self, proxy: Gio.DBusProxy, result: Gio.AsyncResult, what: str) -> None:
+        """Collect the reply of an asynchronous Notify* call"""
+        self._in_flight -= 1
+        try:
+            proxy.call_finish(result)
+        except GLib.Error as e:
+            if self._notify_error is None:
+                self._notify_error = InputError(f"{what}: {e.message}")
+
+    def _keysym_params(self, key: str, pressed: bool) -> GLib.Variant:
+        """(oa{sv}iu) arguments of NotifyKeyboardKeysym, built without parsing a format string"""
+        return GLib.Variant.new_tuple(self._session_variant, self._EMPTY_OPTS,
+                                      GLib.Variant.new_int32(self._char_to_keysym(key)),
+                                      GLib.Variant.new_uint32(1 if pressed else 0))
+
+    @staticmethod
+    def _char_to_keysym(char: str) -> int:
+        """Convert character to X11 keysym (0 if unknown)"""
+        return _KEYSYM_MAP.get(char) or (ord(char) if len(char) == 1 else 0)
 
     # ==================== Private Capture Methods ====================
 
     def _ensure_pipeline(self) -> None:
         """Ensure GStreamer pipeline is running"""
+        # Hot path: every capture comes through here
+        if self._pipeline_playing:
+            return
+
+        thread = self._pipeline_thread
+        if thread is not None:
+            thread.join()
+            self._pipeline_thread = None
+            error, self._pipeline_error = self._pipeline_error, None
+            if error is not None:
+                raise error
+
+        # The pipeline built in initialize() is kept for the whole session;
+        # it may still be prerolling (ASYNC), which is not a reason to rebuild
         if self._pipeline is not None:
-            state = self._pipeline.get_state(0)[1]
-            if state == Gst.State.PLAYING:
-                return
+            self._pipeline_playing = True
+            return
 
         if self._pipewire_node is None:
             raise CaptureError("No PipeWire node available")
 
-        # Build pipeline: pipewiresrc → videoconvert → pngenc → appsink
-        pipeline_str = (
-            f"pipewiresrc path={self._pipewire_node} ! "
-            "videoconvert ! "
-            "pngenc ! "
-            "appsink name=sink emit-signals=true max-buffers=1 drop=true"
-        )
-
-        self._pipeline = Gst.parse_launch(pipeline_str)
-        self._appsink = self._pipeline.get_by_name("sink")
-
-        # Start pipeline
-        ret = self._pipeline.set_state(Gst.State.PLAYING)
-        if ret == Gst.StateChangeReturn.FAILURE:
-            raise CaptureError("Failed to start GStreamer pipeline")
-
-        # Wait for pipeline to be ready
-        time.sleep(0.5)
+        self._start_capture_pipeline()
+        self._pipeline_playing = True
 
 
 # ==================== Convenience Functions ====================
@@ -4,9 +4,76 @@ Window management utilities for Wayland/GNOME
 Provides window activation and listing via GNOME Shell D-Bus interface.
 """
 
-import subprocess
 from typing import Optional, List, Dict
 
+from .window_manager import _gio
+
+# gdbus call of org.gnome.Shell.Eval; the script is appended as the last argument
+_EVAL_CMD = (
+    'gdbus', 'call', '--session',
+    '--dest', 'org.gnome.Shell',
+    '--object-path', '/org/gnome/Shell',
+    '--method', 'org.gnome.Shell.Eval',
+)
+
+# {title} is substituted as a JSON string literal, so quotes or
+# backslashes in the title cannot break out of the expression
+_ACTIVATE_SCRIPT = (
+    'global.get_window_actors().find(w => w.get_meta_window().get_title().includes({title}))'
+    '?.get_meta_window().activate(0)'
+)
+_LIST_SCRIPT = (
+    'JSON.stringify(global.get_window_actors().map(w => '
+    '({title: w.get_meta_window().get_title(), id: w.get_meta_window().get_id()})))'
+)
+
+
+def _eval(script: str, timeout: int = 5) -> Optional[str]:
+    """
+    Run JavaScript through org.gnome.Shell.Eval
+
+    Over Gio the reply is the native (bool, str) pair; only without
+    PyGObject is gdbus's printed GVariant text parsed.
+
+    Returns:
+        The script's result string, or None if Eval failed or was refused
+    """
+    gio = _gio()
+    if gio is not None:
+        Gio, GLib = gio
+        try:
+            # bus_get_sync hands out the process-wide shared connection
+            success, result = Gio.bus_get_sync(Gio.BusType.SESSION, None).call_sync(
+                'org.gnome.Shell',
+                '/org/gnome/Shell',
+                'org.gnome.Shell',
+                'Eval',
+                GLib.Variant('(s)', (script,)),
+                GLib.VariantType('(bs)'),
+                Gio.DBusCallFlags.NONE,
+                timeout * 1000,
+                None
+            ).unpack()
+        except GLib.Error:
+            return None
+        return result if success else None
+
+    import subprocess
+    try:
+        result = subprocess.run((*_EVAL_CMD, script), capture_output=True, text=True,
+                                timeout=timeout)
+    except Exception:
+        return None
+    # Output format: (true, '...') - the string uses Python-compatible escapes
+    output = result.stdout.strip()
+    if result.returncode != 0 or not output.startswith('(true, ') or not output.endswith(')'):
+        return None
+    import ast
+    try:
+        return ast.literal_eval(output[7:-1])
+    except (ValueError, SyntaxError):
+        return None
+
 
 def activate_window(window_title: str, timeout: int = 5) -> bool:
     """
@@ -23,18 +90,10 @@ def activate_window(window_title: str, timeout: int = 5) -> bool:
         >>> activate_window("Text Editor")
         >>> activate_window("Brave")
     """
-    try:
-        cmd = [
-            'gdbus', 'call', '--session',
-            '--dest', 'org.gnome.Shell',
-            '--object-path', '/org/gnome/Shell',
-            '--method', 'org.gnome.Shell.Eval',
-            f'global.get_window_actors().find(w => w.get_meta_window().get_title().includes("{window_title}"))?.get_meta_window().activate(0)'
-        ]
-        result = subprocess.run(cmd, capture_output=True, timeout=timeout)
-        return result.returncode == 0
-    except Exception:
-        return False
+    import json
+
+    script = _ACTIVATE_SCRIPT.format(title=json.dumps(window_title))
+    return _eval(script, timeout) is not None
 
 
 def list_windows() -> List[Dict[str, str]]:
@@ -49,24 +108,19 @@ def list_windows() -> List[Dict[str, str]]:
         >>> for w in windows:
         ...     print(f"{w['title']} (ID: {w['id']})")
     """
+    import json
+
+    result = _eval(_LIST_SCRIPT)
+    if result is None:
+        return []
     try:
-        cmd = [
-            'gdbus', 'call', '--session',
-            '--dest', 'org.gnome.Shell',
-            '--object-path', '/org/gnome/Shell',
-            '--method', 'org.gnome.Shell.Eval',
-            'JSON.stringify(global.get_window_actors().map(w => ({title: w.get_meta_window().get_title(), id: w.get_meta_window().get_id()})))'
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            # Parse the output (it's wrapped in GNOME Shell response format)
-            import json
-            # Output format: (true, '["..."]')
-            output = result.stdout.strip()
-            if output.startswith('(true,'):
-                json_str = output[7:-1].strip().strip("'")
-                return json.loads(json_str)
-    except Exception:
+        windows = json.loads(result)
+        # Eval JSON-encodes the script's value, here already a JSON string
+        if isinstance(windows, str):
+            windows = json.loads(windows)
+        if isinstance(windows, list):
+            return windows
+    except ValueError:
         pass
     return []
 
@@ -86,8 +140,8 @@ def find_window(window_title: str) -> Optional[Dict[str, str]]:
         >>> if window:
         ...     print(f"Found: {window['title']}")
     """
-    windows = list_windows()
-    for window in windows:
-        if window_title.lower() in window['title'].lower():
+    query = window_title.lower()
+    for window in list_windows():
+        if query in (window.get('title') or '').lower():
             return window
     return None
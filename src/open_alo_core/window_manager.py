@@ -10,14 +10,313 @@ This module provides a clean, Pythonic API for window operations including:
 - Window positioning and resizing
 - Window state management (maximize, minimize, etc.)
 - Workspace management
+
+Calls go over a persistent session bus connection (PyGObject's Gio). When
+PyGObject cannot be imported, calls go through a long-running python3
+helper that has it, and only failing that through the gdbus command line
+tool.
 """
 
-import json
-import subprocess
-from typing import Optional, List, Dict, Tuple
-from dataclasses import dataclass
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache, partial, wraps
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, List, Dict, Tuple
+from dataclasses import dataclass, field, fields
 from enum import IntEnum
 
+# subprocess, json, asyncio and concurrent.futures are imported where
+# used, so importing the package (e.g. only for Point/Rect) stays cheap
+if TYPE_CHECKING:
+    import subprocess
+
+
+def _loads(data):
+    """
+    JSON decoder, bound on first use: orjson (open-alo-core[fast]) or json
+
+    List replies are parsed whole. A reply is already one complete string in
+    memory, and a single orjson/json pass over it is faster than feeding it
+    through a streaming parser (ijson) at any realistic window count. The
+    parsed list also fills the window cache that the find helpers reuse.
+    """
+    global _loads
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    _loads = loads
+    return loads(data)
+
+
+_gi_modules = None
+
+
+def _gio():
+    """(Gio, GLib) from PyGObject, imported on first use; None if unavailable"""
+    global _gi_modules
+    if _gi_modules is None:
+        try:
+            import gi
+            gi.require_version('Gio', '2.0')
+            gi.require_version('GLib', '2.0')
+            from gi.repository import Gio, GLib
+            _gi_modules = (Gio, GLib)
+        except (ImportError, ValueError):
+            _gi_modules = False
+    return _gi_modules or None
+
+
+
+
+# Run by _GDBusWorker in another interpreter: one [id, method, signature,
+# args, timeout_ms, no_reply] JSON line in; one [id, ok, reply values or
+# error name] line out, except for no_reply requests, which get no line
+_WORKER_SCRIPT = r"""
+import json, sys
+from gi.repository import Gio, GLib
+bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+dest, path, iface = sys.argv[1:4]
+print('ready', flush=True)
+for line in sys.stdin:
+    rid, method, signature, args, timeout, no_reply = json.loads(line)
+    try:
+        params = GLib.Variant(signature, tuple(args)) if signature else None
+        if no_reply:
+            # No callback: sent flagged NO_REPLY_EXPECTED, nothing to print
+            bus.call(dest, path, iface, method, params, None,
+                     Gio.DBusCallFlags.NONE, -1, None, None)
+            continue
+        reply = bus.call_sync(dest, path, iface, method, params,
+                              None, Gio.DBusCallFlags.NONE, timeout, None)
+        out = [rid, True, list(reply.unpack()) if reply is not None else []]
+    except GLib.Error as e:
+        out = [rid, False, Gio.DBusError.get_remote_error(e)]
+    except Exception:
+        # Arguments that do not fit the signature
+        out = [rid, False, None]
+    if not no_reply:
+        print(json.dumps(out), flush=True)
+bus.flush_sync(None)
+"""
+
+
+# Single members of a GetFrameRect reply, read without decoding the JSON
+_FRAME_X = re.compile(r'"x"\s*:\s*(-?\d+)')
+_FRAME_Y = re.compile(r'"y"\s*:\s*(-?\d+)')
+
+# D-Bus errors meaning the Window Calls extension is not there
+_MISSING_EXTENSION_ERRORS = frozenset((
+    'org.freedesktop.DBus.Error.ServiceUnknown',
+    'org.freedesktop.DBus.Error.UnknownObject',
+    'org.freedesktop.DBus.Error.UnknownInterface',
+    'org.freedesktop.DBus.Error.UnknownMethod',
+))
+_GDBUS_ERROR = re.compile(rb'GDBus\.Error:([\w.]+)')
+
+# GVariant text-format type annotations for the basic types methods take
+_TYPE_PREFIXES = {'u': 'uint32 ', 'i': 'int32 ', 't': 'uint64 ', 'x': 'int64 '}
+
+
+def _format_arg(value, type_code: str) -> str:
+    """
+    One gdbus call argument in GVariant text format
+
+    Integers get an explicit type (gdbus would otherwise guess int32, and
+    a bare negative number would be read as an option); strings are quoted
+    and escaped so spaces and quotes survive.
+    """
+    if type_code == 's':
+        escaped = value.replace('\\', '\\\\').replace("'", "\\'")
+        return f"'{escaped}'"
+    return f'{_TYPE_PREFIXES[type_code]}{value}'
+
+
+def _parse_gdbus_reply(output: bytes) -> tuple:
+    """
+    Reply values from gdbus's printed output: ('...',) or ("...",) for a
+    string result, () for none
+
+    Stays in bytes until the string itself is decoded, once. Only strings
+    with escapes (GVariant's are Python-compatible) go through
+    ast.literal_eval.
+    """
+    output = output.strip()
+    if len(output) < 5 or output[:1] != b'(' or output[-2:] != b',)':
+        return ()
+    quote = output[1:2]
+    if quote not in (b"'", b'"') or output[-3:-2] != quote:
+        return ()
+    literal = output[1:-2]
+    if b'\\' not in literal:
+        return (literal[1:-1].decode(),)
+    import ast
+    return (ast.literal_eval(literal.decode()),)
+
+
+class _GDBusWorker:
+    """
+    Long-running helper process for the fallback without PyGObject
+
+    The current interpreter cannot import gi, but the one it was created
+    from often can (e.g. a virtualenv without system site packages). The
+    helper keeps one session bus connection open and answers calls over
+    its stdin and stdout pipes, so a call costs a pipe round-trip instead
+    of starting a gdbus process. No-reply calls are sent without a reply
+    and the helper writes nothing back for them; every other request gets
+    exactly one reply line, tagged with its request id.
+
+    The helper runs the interpreter named by $OPEN_ALO_HELPER_PYTHON (or
+    WindowManager's helper_python), else the base interpreter of this
+    environment (sys._base_executable, which is sys.executable outside a
+    virtualenv). If that interpreter is missing or cannot import gi, the
+    helper never reports ready and calls fall back to the gdbus tool.
+    """
+
+    # Seconds allowed for the helper to start and connect
+    START_TIMEOUT = 5
+
+    # Environment variable naming the interpreter that runs the helper
+    PYTHON_ENV = 'OPEN_ALO_HELPER_PYTHON'
+
+    # interpreter -> running helper, or False if it could not start
+    _instances: Dict[str, Any] = {}
+    # Guards starting and replacing the shared instances
+    _instance_lock = threading.Lock()
+
+    def __init__(self, python: str, dest: str, path: str, interface: str):
+        import os
+        import subprocess
+
+        if not os.access(python, os.X_OK):
+            raise OSError(f"{python} not found")
+        self._python = python
+        self._proc = subprocess.Popen(
+            [python, '-c', _WORKER_SCRIPT, dest, path, interface],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+        self._buffer = bytearray()
+        self._next_id = 0
+        # One request/reply exchange at a time: the pipes, the read buffer
+        # and the request ids are shared by every caller
+        self._lock = threading.Lock()
+        if self._readline(time.monotonic() + self.START_TIMEOUT) != b'ready':
+            self.close()
+            raise OSError("D-Bus helper failed to start")
+
+    @classmethod
+    def default_python(cls) -> str:
+        """Interpreter the helper runs unless WindowManager names one"""
+        import os
+
+        return (os.environ.get(cls.PYTHON_ENV)
+                or getattr(sys, '_base_executable', None)
+                or sys.executable)
+
+    @classmethod
+    def get(cls, dest: str, path: str, interface: str,
+            python: Optional[str] = None) -> Optional["_GDBusWorker"]:
+        """
+        Shared helper for ``python`` (None = default_python()), started on
+        first use; None if it cannot run
+        """
+        python = python or cls.default_python()
+        with cls._instance_lock:
+            worker = cls._instances.get(python)
+            if worker is None:
+                try:
+                    worker = cls(python, dest, path, interface)
+                except OSError:
+                    worker = False
+                cls._instances[python] = worker
+            return worker or None
+
+    def call(self, method: str, signature: Optional[str], args: tuple,
+             timeout: float, no_reply: bool = False) -> Tuple[Optional[tuple], Optional[str]]:
+        """
+        Make one call through the helper
+
+        Safe to call from several threads; calls are serialized.
+
+        Returns:
+            (reply values, None) - () as values for no_reply calls once
+            sent - or (None, D-Bus error name or None) on error (a helper
+            that stops answering is dropped)
+        """
+        with self._lock:
+            return self._call(method, signature, args, timeout, no_reply)
+
+    def _call(self, method: str, signature: Optional[str], args: tuple,
+              timeout: float, no_reply: bool) -> Tuple[Optional[tuple], Optional[str]]:
+        import json
+
+        self._next_id += 1
+        request_id = self._next_id
+        try:
+            self._proc.stdin.write(json.dumps(
+                [request_id, method, signature, list(args), int(timeout * 1000), no_reply]
+            ).encode() + b'\n')
+        except OSError:
+            self._drop()
+            return None, None
+        if no_reply:
+            return (), None
+
+        # A little longer than the call's own timeout, which the helper enforces
+        deadline = time.monotonic() + timeout + 1
+        while True:
+            line = self._readline(deadline)
+            if line is None:
+                self._drop()
+                return None, None
+            try:
+                reply_id, ok, values = _loads(line)
+            except ValueError:
+                continue
+            if reply_id == request_id:
+                if not ok:
+                    return None, values
+                return tuple(values), None
+
+    def _readline(self, deadline: float) -> Optional[bytes]:
+        """Next line from the helper without the newline; None on timeout or exit"""
+        import os
+        import select
+
+        fd = self._proc.stdout.fileno()
+        while b'\n' not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                return None
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return None
+            self._buffer += chunk
+        line, _, rest = bytes(self._buffer).partition(b'\n')
+        self._buffer = bytearray(rest)
+        return line
+
+    def _drop(self) -> None:
+        """Stop an unresponsive helper; the next call starts a new one"""
+        self.close()
+        with _GDBusWorker._instance_lock:
+            if _GDBusWorker._instances.get(self._python) is self:
+                del _GDBusWorker._instances[self._python]
+
+    def close(self) -> None:
+        """Terminate the helper process"""
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        self._proc.kill()
+        self._proc.wait()
+
 
 class WindowType(IntEnum):
     """Window type enumeration"""
@@ -38,9 +337,9 @@ class FrameType(IntEnum):
     FRAMELESS = 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WindowInfo:
-    """Window information container"""
+    """Window information container (immutable: a snapshot of one List entry)"""
     id: int
     wm_class: str
     wm_class_instance: str
@@ -57,10 +356,44 @@ class WindowInfo:
     focus: bool = False
     in_current_workspace: bool = False
     maximized: int = 0
+    # Lowercased wm_class / title for case-insensitive search, computed once
+    wm_class_ci: str = field(init=False, repr=False, compare=False)
+    title_ci: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Meta reports null for some untitled windows / class-less clients
+        if self.wm_class is None:
+            object.__setattr__(self, 'wm_class', '')
+        if self.title is None:
+            object.__setattr__(self, 'title', '')
+        object.__setattr__(self, 'wm_class_ci', sys.intern(self.wm_class.lower()))
+        object.__setattr__(self, 'title_ci', self.title.lower())
 
     def __repr__(self):
         return f"WindowInfo(id={self.id}, wm_class='{self.wm_class}', title='{self.title[:30]}...', focus={self.focus})"
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "WindowInfo":
+        """
+        Build from one window's List/Details entry
+
+        Missing keys take the field defaults. Arguments are passed
+        positionally, in declaration order, from the prebuilt _FIELDS.
+        """
+        get = data.get
+        return cls(
+            data['id'],
+            # Many windows share an app class; keep one copy of each
+            sys.intern(get('wm_class') or ''),
+            sys.intern(get('wm_class_instance') or ''),
+            get('title') or '',
+            *[get(name, default) for name, default in _FIELDS]
+        )
+
+
+# (name, default) of the WindowInfo constructor fields after title
+_FIELDS = tuple((f.name, f.default) for f in fields(WindowInfo)[4:] if f.init)
+
 
 class WindowManager:
     """
@@ -81,89 +414,700 @@ class WindowManager:
     DBUS_PATH = "/org/gnome/Shell/Extensions/Windows"
     DBUS_INTERFACE = "org.gnome.Shell.Extensions.Windows"
 
-    def __init__(self, timeout: int = 5):
+    # Argument signatures of the extension's methods (window ids are 'u')
+    METHOD_SIGNATURES = {
+        "List": None,
+        "Details": "(u)",
+        "GetTitle": "(u)",
+        "GetFrameRect": "(u)",
+        "GetFrameBounds": "(u)",
+        "Activate": "(u)",
+        "Maximize": "(u)",
+        "Unmaximize": "(u)",
+        "Minimize": "(u)",
+        "Unminimize": "(u)",
+        "Close": "(u)",
+        "Move": "(uii)",
+        "Resize": "(uuu)",
+        "MoveResize": "(uiiuu)",
+        "MoveToWorkspace": "(uu)",
+    }
+
+    # org.gnome.Shell.Eval, used by the find helpers and apply()/tile()
+    # when it is enabled (unsafe mode); otherwise they fall back to List
+    # and the extension's own methods
+    SHELL_PATH = "/org/gnome/Shell"
+    SHELL_INTERFACE = "org.gnome.Shell"
+
+    # Full entries (the List/Details fields) of the windows {select} picks,
+    # in List order: matches of query {q} (a JSON string literal) on
+    # wm_class, then title, or the focused window
+    _FIND_SCRIPT = (
+        "(() => {{"
+        "const q = {q};"
+        "const ws = global.get_window_actors().map(a => a.get_meta_window());"
+        "const cls = w => (w.get_wm_class() || '').toLowerCase().includes(q);"
+        "const title = w => {match_title} && (w.get_title() || '').toLowerCase().includes(q);"
+        "const active = global.workspace_manager.get_active_workspace();"
+        "const entry = w => {{"
+        "const r = w.get_frame_rect();"
+        "const s = w.get_workspace();"
+        "return {{"
+        "id: w.get_id(), wm_class: w.get_wm_class(), wm_class_instance: w.get_wm_class_instance(),"
+        "title: w.get_title(), pid: w.get_pid(),"
+        "x: r.x, y: r.y, width: r.width, height: r.height,"
+        "workspace: s ? s.index() : -1, monitor: w.get_monitor(),"
+        "frame_type: w.get_frame_type(), window_type: w.get_window_type(),"
+        "focus: w.has_focus(), in_current_workspace: w.located_on_workspace(active),"
+        "maximized: w.get_maximized ? w.get_maximized() : 0,"
+        "}};"
+        "}};"
+        "return JSON.stringify({select}.map(entry));"
+        "}})()"
+    )
+    _SELECT_FIRST = "ws.filter(cls).concat(ws.filter(w => !cls(w) && title(w))).slice(0, 1)"
+    _SELECT_ALL = "ws.filter(w => cls(w) || title(w))"
+    _SELECT_FOCUSED = "ws.filter(w => w.has_focus())"
+
+    # Runs ops {ops} (a JSON array of [method, id, args]) on the Meta
+    # windows in one Eval; mirrors what the extension does for each method
+    _APPLY_SCRIPT = (
+        "(() => {{"
+        "const t = global.get_current_time();"
+        "const ws = new Map(global.get_window_actors()"
+        ".map(a => [a.get_meta_window().get_id(), a.get_meta_window()]));"
+        "const run = {{"
+        "Activate: w => w.activate(t),"
+        "Maximize: w => w.maximize(3),"
+        "Unmaximize: w => w.unmaximize(3),"
+        "Minimize: w => w.minimize(),"
+        "Unminimize: w => w.unminimize(),"
+        "Close: w => w.delete(t),"
+        "Move: (w, x, y) => w.move_frame(true, x, y),"
+        "Resize: (w, width, height) => {{ const r = w.get_frame_rect();"
+        " w.move_resize_frame(true, r.x, r.y, width, height); }},"
+        "MoveResize: (w, x, y, width, height) => w.move_resize_frame(true, x, y, width, height),"
+        "MoveToWorkspace: (w, n) => w.change_workspace_by_index(n, false),"
+        "}};"
+        "return JSON.stringify({ops}.map(([m, id, args]) => {{"
+        "const w = ws.get(id);"
+        "if (!w) return false;"
+        "try {{ run[m](w, ...args); return true; }} catch (e) {{ return false; }}"
+        "}}));"
+        "}})()"
+    )
+    _WORK_AREA_SCRIPT = (
+        "(() => {"
+        "const r = global.workspace_manager.get_active_workspace()"
+        ".get_work_area_for_monitor(global.display.get_primary_monitor());"
+        "return JSON.stringify([r.x, r.y, r.width, r.height]);"
+        "})()"
+    )
+    # Methods apply() accepts (the extension's state-changing ones)
+    APPLY_METHODS = frozenset((
+        "Activate", "Maximize", "Unmaximize", "Minimize", "Unminimize", "Close",
+        "Move", "Resize", "MoveResize", "MoveToWorkspace",
+    ))
+
+    # Delay between focus checks in activate(wait=True)
+    FOCUS_POLL_INTERVAL = 0.01
+
+    def __init__(self, timeout: int = 5, cache_ttl: float = 0.1,
+                 helper_python: Optional[str] = None):
         """
         Initialize WindowManager
 
         Args:
             timeout: Default timeout for D-Bus calls in seconds
+            cache_ttl: How long (seconds) a window list is reused by
+                list_windows() and the find/focus helpers. Queries issued
+                within one "tick" share a single D-Bus List call.
+                0 disables caching.
+            helper_python: Interpreter with PyGObject that makes the D-Bus
+                calls when this one cannot import gi. None =
+                $OPEN_ALO_HELPER_PYTHON, else this environment's base
+                interpreter; without a usable one, calls run the gdbus tool
         """
         self.timeout = timeout
-        self._check_extension()
+        self.helper_python = helper_python
+        self.cache_ttl = cache_ttl
+        # (time.monotonic_ns() of the fetch, windows)
+        self._list_cache: Optional[Tuple[int, List[WindowInfo]]] = None
+        # (window list it was built from, lowercased wm_class -> first
+        # window of that class); rebuilt when the cached list changes
+        self._class_index: Optional[Tuple[List[WindowInfo], Dict[str, WindowInfo]]] = None
+        self._batch: Optional[List[Tuple[str, tuple]]] = None
+        self._batch_results: List[bool] = []
+        # Session bus connection, opened on first call; False = no PyGObject
+        self._bus = None
+        # Set once a call has gone through; until then a failure because
+        # the extension is missing raises instead of returning None
+        self._extension_checked = False
+        # D-Bus error name of the last failed call
+        self._error_name: Optional[str] = None
+        # Whether Shell.Eval works; None until first tried
+        self._eval_available: Optional[bool] = None
+        # gdbus processes of no-reply calls, reaped on later calls
+        self._detached: List["subprocess.Popen"] = []
+
+    def probe(self) -> bool:
+        """
+        Check that the Window Calls extension answers (one List call)
+
+        Not needed before other calls: the first call that fails because
+        the extension is missing raises the same error.
+
+        Returns:
+            True if the extension answered
 
-    def _check_extension(self) -> bool:
-        """Check if Window Calls extension is available"""
+        Raises:
+            RuntimeError: Window Calls extension not available
+        """
+        self._extension_checked = False
+        return self._dbus_call("List") is not None
+
+    def _missing_extension(self) -> RuntimeError:
+        """The error raised when the extension is not installed or enabled"""
+        return RuntimeError(
+            "Window Calls extension not available. "
+            "Install from: https://extensions.gnome.org/extension/4724/window-calls/"
+        )
+
+    def _connection(self):
+        """Session bus connection (Gio.DBusConnection), or None without PyGObject"""
+        if self._bus is None:
+            gio = _gio()
+            try:
+                self._bus = gio[0].bus_get_sync(gio[0].BusType.SESSION, None) if gio else False
+            except Exception:
+                self._bus = False
+        return self._bus or None
+
+    def _params(self, method: str, args: tuple):
+        """
+        Typed GLib.Variant arguments for ``method``
+
+        Returns:
+            The Variant, None if the method takes no arguments, or False if
+            ``args`` do not fit the signature (e.g. a float coordinate or a
+            negative id for a 'u')
+        """
+        signature = self.METHOD_SIGNATURES[method]
+        if signature is None:
+            return None
         try:
-            result = self._dbus_call("List")
-            return result is not None
-        except Exception:
-            raise RuntimeError(
-                "Window Calls extension not available. "
-                "Install from: https://extensions.gnome.org/extension/4724/window-calls/"
-            )
+            return _gio()[1].Variant(signature, args)
+        except (TypeError, ValueError, OverflowError):
+            return False
 
-    def _dbus_call(self, method: str, *args) -> Optional[str]:
+    def _dbus_call(self, method: str, *args, no_reply: bool = False) -> Optional[tuple]:
         """
         Internal D-Bus call helper
 
         Args:
             method: Method name to call
             *args: Arguments to pass to the method
+            no_reply: Send the call without waiting for (or asking for) a
+                reply; returns () once the message is written
 
         Returns:
-            Raw D-Bus response string or None on error
+            The method's return values as native Python values, e.g.
+            ('[...]',) for List or () for Activate; None on error
+
+        Raises:
+            RuntimeError: The extension is not available (only until a
+                call has succeeded)
         """
-        cmd = [
-            'gdbus', 'call', '--session',
-            '--dest', self.DBUS_DEST,
-            '--object-path', self.DBUS_PATH,
-            '--method', f'{self.DBUS_INTERFACE}.{method}'
-        ] + [str(arg) for arg in args]
+        self._error_name = None
+        bus = self._connection()
+        if bus is None:
+            result = self._gdbus_call(method, *args, no_reply=no_reply)
+        else:
+            result = self._gio_call(bus, method, args, no_reply)
+
+        if not self._extension_checked:
+            if result is None and self._error_name in _MISSING_EXTENSION_ERRORS:
+                raise self._missing_extension()
+            if result is not None and not no_reply:
+                self._extension_checked = True
+        return result
+
+    def _gio_call(self, bus, method: str, args: tuple, no_reply: bool) -> Optional[tuple]:
+        """_dbus_call() over the Gio connection"""
+        Gio, GLib = _gio()
+        params = self._params(method, args)
+        if params is False:
+            return None
+        try:
+            if no_reply:
+                # Without a callback the call goes out flagged
+                # NO_REPLY_EXPECTED; flush so it is sent even if the
+                # process exits right after
+                bus.call(
+                    self.DBUS_DEST,
+                    self.DBUS_PATH,
+                    self.DBUS_INTERFACE,
+                    method,
+                    params,
+                    None,
+                    Gio.DBusCallFlags.NONE,
+                    -1,
+                    None,
+                    None
+                )
+                bus.flush_sync(None)
+                return ()
+
+            reply = bus.call_sync(
+                self.DBUS_DEST,
+                self.DBUS_PATH,
+                self.DBUS_INTERFACE,
+                method,
+                params,
+                None,
+                Gio.DBusCallFlags.NONE,
+                int(self.timeout * 1000),
+                None
+            )
+        except GLib.Error as e:
+            self._error_name = Gio.DBusError.get_remote_error(e)
+            return None
+        return reply.unpack() if reply is not None else ()
 
+    def _gdbus_call(self, method: str, *args, no_reply: bool = False) -> Optional[tuple]:
+        """
+        _dbus_call() without PyGObject
+
+        Goes through the persistent _GDBusWorker helper when an interpreter
+        with PyGObject is available, else runs the gdbus tool per call.
+        """
+        worker = _GDBusWorker.get(self.DBUS_DEST, self.DBUS_PATH, self.DBUS_INTERFACE,
+                                  self.helper_python)
+        if worker is not None:
+            result, self._error_name = worker.call(
+                method, self.METHOD_SIGNATURES[method], args, self.timeout, no_reply=no_reply
+            )
+            return result
+
+        cmd = self._dbus_command(method, *args)
+
+        if no_reply:
+            return self._gdbus_detached(cmd)
+
+        import subprocess
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=self.timeout
             )
-            if result.returncode == 0:
-                return result.stdout.strip()
+            if result.returncode != 0:
+                error = _GDBUS_ERROR.search(result.stderr)
+                self._error_name = error.group(1).decode() if error else None
+                return None
+        except Exception:
             return None
+
+        return _parse_gdbus_reply(result.stdout)
+
+    # No-reply gdbus processes left running before the oldest is waited for
+    MAX_DETACHED = 16
+
+    def _gdbus_detached(self, cmd: List[str]) -> Optional[tuple]:
+        """Start a gdbus call without waiting for it; () once started"""
+        import subprocess
+
+        # Reap finished ones so they do not linger as zombies
+        self._detached = [proc for proc in self._detached if proc.poll() is None]
+        if len(self._detached) >= self.MAX_DETACHED:
+            try:
+                self._detached.pop(0).wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                pass
+
+        try:
+            self._detached.append(subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            ))
         except Exception:
             return None
+        return ()
 
-    def _parse_json_response(self, response: str) -> any:
+    def _dbus_command(self, method: str, *args) -> List[str]:
+        """Build the gdbus command line for a method call"""
+        signature = self.METHOD_SIGNATURES[method] or '()'
+        return [
+            'gdbus', 'call', '--session',
+            '--dest', self.DBUS_DEST,
+            '--object-path', self.DBUS_PATH,
+            '--method', f'{self.DBUS_INTERFACE}.{method}'
+        ] + [_format_arg(arg, code) for arg, code in zip(args, signature[1:-1])]
+
+    def _dbus_call_many(self, calls: List[Tuple[str, tuple]]) -> List[bool]:
         """
-        Parse D-Bus JSON response
+        Issue several D-Bus calls concurrently
 
-        D-Bus wraps JSON responses in format: ('[{...}]',)
-        This method extracts and parses the actual JSON.
+        All calls are submitted before any is waited on, so the total cost
+        is roughly one round-trip instead of one per call.
+
+        Returns:
+            Success flag for each call, in submission order
         """
-        if not response:
+        bus = self._connection()
+        if bus is None:
+            return self._gdbus_call_many(calls)
+
+        Gio, GLib = _gio()
+        results = [False] * len(calls)
+        pending = len(calls)
+
+        def on_done(conn, result, index):
+            nonlocal pending
+            pending -= 1
+            try:
+                conn.call_finish(result)
+                results[index] = True
+            except GLib.Error:
+                pass
+
+        for index, (method, args) in enumerate(calls):
+            params = self._params(method, args)
+            if params is False:
+                pending -= 1
+                continue
+            bus.call(
+                self.DBUS_DEST,
+                self.DBUS_PATH,
+                self.DBUS_INTERFACE,
+                method,
+                params,
+                None,
+                Gio.DBusCallFlags.NONE,
+                int(self.timeout * 1000),
+                None,
+                on_done,
+                index
+            )
+
+        # Replies are dispatched to this thread's main context
+        context = GLib.MainContext.ref_thread_default()
+        while pending:
+            context.iteration(True)
+        return results
+
+    def _gdbus_call_many(self, calls: List[Tuple[str, tuple]]) -> List[bool]:
+        """_dbus_call_many() through concurrent gdbus processes (fallback)"""
+        import subprocess
+
+        procs = []
+        for method, args in calls:
+            try:
+                procs.append(subprocess.Popen(
+                    self._dbus_command(method, *args),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                ))
+            except Exception:
+                procs.append(None)
+
+        deadline_ns = time.monotonic_ns() + int(self.timeout * 1_000_000_000)
+        results = []
+        for proc in procs:
+            if proc is None:
+                results.append(False)
+                continue
+            try:
+                proc.wait(timeout=max(0, deadline_ns - time.monotonic_ns()) / 1_000_000_000)
+                results.append(proc.returncode == 0)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                results.append(False)
+        return results
+
+    def _eval(self, script: str) -> Optional[str]:
+        """
+        Run JavaScript in GNOME Shell (org.gnome.Shell.Eval)
+
+        Eval is refused unless the Shell runs in unsafe mode. If the first
+        attempt fails, Eval is treated as unavailable from then on.
+
+        Returns:
+            The script's result (JSON text), or None if Eval is unavailable
+            or failed
+        """
+        if self._eval_available is False:
+            return None
+        bus = self._connection()
+        if bus is None:
             return None
 
-        # Handle format: ('[...]',) or ('...',)
-        if response.startswith("('") and response.endswith("',)"):
-            json_str = response[2:-3]  # Remove (' and ',)
-            # Unescape unicode sequences
-            json_str = json_str.encode().decode('unicode_escape')
-            return json.loads(json_str)
+        Gio, GLib = _gio()
+        try:
+            success, result = bus.call_sync(
+                self.DBUS_DEST,
+                self.SHELL_PATH,
+                self.SHELL_INTERFACE,
+                'Eval',
+                GLib.Variant('(s)', (script,)),
+                GLib.VariantType('(bs)'),
+                Gio.DBusCallFlags.NONE,
+                int(self.timeout * 1000),
+                None
+            ).unpack()
+        except GLib.Error:
+            success, result = False, None
+
+        if not success:
+            if self._eval_available is None:
+                self._eval_available = False
+            return None
+        self._eval_available = True
+        return result
 
-        # Fallback: try direct parsing
+    def _eval_list(self, script: str) -> Optional[list]:
+        """List returned by a JSON.stringify'd script, or None without Eval"""
+        result = self._eval(script)
+        if result is None:
+            return None
+        try:
+            value = _loads(result)
+            # Eval JSON-encodes the script's value, here already a JSON string
+            if isinstance(value, str):
+                value = _loads(value)
+        except ValueError:
+            return None
+        return value if isinstance(value, list) else None
+
+    def _find_server_side(self, select: str, query: str = "",
+                          match_title: bool = False) -> Optional[List[WindowInfo]]:
+        """
+        Windows picked by ``select`` (a _SELECT_* expression), filtered
+        inside the Shell
+
+        One Eval returns the full entries of the matching windows only;
+        neither every window's entry nor a Details call crosses the bus.
+
+        Returns:
+            Matching WindowInfo objects, or None if Eval is unavailable
+        """
+        import json
+
+        entries = self._eval_list(self._FIND_SCRIPT.format(
+            q=json.dumps(query.lower()),
+            match_title='true' if match_title else 'false',
+            select=select,
+        ))
+        if entries is None:
+            return None
+        try:
+            return [WindowInfo.from_dict(entry) for entry in entries]
+        except (KeyError, TypeError):
+            return None
+
+    def _cache_fresh(self) -> bool:
+        """True while the cached window list can still be reused"""
+        return (self._list_cache is not None
+                and time.monotonic_ns() - self._list_cache[0] < self.cache_ttl * 1_000_000_000)
+
+    def _json_call(self, method: str, *args) -> any:
+        """
+        Call a method that returns a JSON string and parse it
+
+        Returns:
+            The decoded JSON value, or None on error
+        """
+        result = self._dbus_call(method, *args)
+        if not result:
+            return None
         try:
-            return json.loads(response)
-        except:
+            return _loads(result[0])
+        except ValueError:
             return None
 
+    def _call_and_invalidate(self, method: str, *args, await_ack: bool = True) -> bool:
+        """
+        Call a state-changing method and drop the cached window list
+
+        With await_ack=False the call is sent without waiting for a reply
+        and True means only that it was sent.
+        """
+        if self._batch is not None:
+            self._batch.append((method, args))
+            return True
+
+        response = self._dbus_call(method, *args, no_reply=not await_ack)
+        self.invalidate()
+        return response is not None
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached window list
+
+        State-changing methods (activate, move, ...) do this automatically;
+        call it after changing windows through other means.
+        """
+        self._list_cache = None
+        self._class_index = None
+
+    @contextmanager
+    def batch(self) -> Iterator[List[bool]]:
+        """
+        Queue state-changing operations and dispatch them together
+
+        Inside the block, methods such as activate(), move() or minimize()
+        are queued and return True immediately. When the block exits, all
+        queued calls are submitted concurrently and the yielded list is
+        filled with one success flag per call, in submission order.
+
+        Queries (list_windows, get_details, ...) are not queued and run
+        immediately. Queued calls complete in no particular order, so batch
+        independent operations (e.g. one per window). If the block raises,
+        nothing is submitted.
+
+        Example:
+            >>> with wm.batch() as results:
+            ...     for win in wm.find_all_windows("terminal"):
+            ...         wm.minimize(win.id)
+            >>> print(f"{sum(results)} of {len(results)} minimized")
+        """
+        if self._batch is not None:
+            # Nested batch joins the outer one
+            yield self._batch_results
+            return
+
+        self._batch = []
+        self._batch_results = []
+        try:
+            yield self._batch_results
+            calls = self._batch
+        finally:
+            self._batch = None
+
+        self._batch_results.extend(self._dbus_call_many(calls))
+        self.invalidate()
+
+    def apply(self, ops: List[Tuple[str, int, tuple]]) -> List[bool]:
+        """
+        Run many window operations in one round-trip
+
+        With Shell.Eval available the whole list is sent as one script and
+        executed inside the Shell; otherwise the operations are dispatched
+        concurrently like a batch(). Operations run in list order (with
+        Eval), so one window can be e.g. unmaximized and then moved.
+
+        Args:
+            ops: (method, window_id, args) tuples, where method is one of
+                APPLY_METHODS and args are the method's remaining arguments,
+                e.g. ("Move", win.id, (0, 0)) or ("Close", win.id, ())
+
+        Returns:
+            Success flag for each operation, in order
+
+        Raises:
+            ValueError: Unknown method
+
+        Example:
+            >>> wm.apply([("Move", w.id, (i * 100, 0)) for i, w in enumerate(windows)])
+        """
+        import json
+
+        calls = []
+        for method, window_id, args in ops:
+            if method not in self.APPLY_METHODS:
+                raise ValueError(f"Unsupported method for apply(): {method!r}")
+            calls.append((method, (window_id, *args)))
+        if not calls:
+            return []
+
+        if self._batch is not None:
+            self._batch.extend(calls)
+            return [True] * len(calls)
+
+        results = self._eval_list(self._APPLY_SCRIPT.format(
+            ops=json.dumps([[method, args[0], list(args[1:])] for method, args in calls])
+        ))
+        if results is None or len(results) != len(calls):
+            results = self._dbus_call_many(calls)
+        self.invalidate()
+        return [bool(r) for r in results]
+
+    def tile(self, window_ids: List[int], layout: str = "grid",
+             area: Optional[Tuple[int, int, int, int]] = None) -> List[bool]:
+        """
+        Tile windows over an area with one apply() call
+
+        Windows are unmaximized first, then placed in list order.
+
+        Args:
+            window_ids: Windows to tile
+            layout: "columns" (side by side), "rows" (stacked) or "grid"
+            area: (x, y, width, height) to fill; None = the primary
+                monitor's work area (needs Shell.Eval)
+
+        Returns:
+            Success flag for each window, in order
+
+        Raises:
+            ValueError: Unknown layout, or no area given and Shell.Eval
+                is unavailable
+
+        Example:
+            >>> wm.tile([w.id for w in wm.find_all_windows("terminal")], "columns")
+        """
+        if not window_ids:
+            return []
+
+        count = len(window_ids)
+        if layout == "columns":
+            cols, rows = count, 1
+        elif layout == "rows":
+            cols, rows = 1, count
+        elif layout == "grid":
+            cols = 1
+            while cols * cols < count:
+                cols += 1
+            rows = -(-count // cols)
+        else:
+            raise ValueError(f"Unknown layout: {layout!r} (use 'columns', 'rows' or 'grid')")
+
+        if area is None:
+            area = self._eval_list(self._WORK_AREA_SCRIPT)
+            if area is None or len(area) != 4:
+                raise ValueError("area is required when Shell.Eval is unavailable")
+        x0, y0, width, height = (int(v) for v in area)
+        cell_w, cell_h = width // cols, height // rows
+
+        ops = []
+        for i, window_id in enumerate(window_ids):
+            row, col = divmod(i, cols)
+            ops.append(("Unmaximize", window_id, ()))
+            ops.append(("MoveResize", window_id,
+                        (x0 + col * cell_w, y0 + row * cell_h, cell_w, cell_h)))
+        return self.apply(ops)[1::2]
+
+    def close_all(self, window_ids: List[int]) -> List[bool]:
+        """
+        Close several windows with one apply() call
+
+        Returns:
+            Success flag for each window, in order
+        """
+        return self.apply([("Close", window_id, ()) for window_id in window_ids])
+
     # ==================== Window Listing and Search ====================
 
-    def list_windows(self, current_workspace_only: bool = False) -> List[WindowInfo]:
+    def list_windows(self, current_workspace_only: bool = False,
+                     force_refresh: bool = False) -> List[WindowInfo]:
         """
         List all open windows
 
         Args:
             current_workspace_only: Only return windows in current workspace
+            force_refresh: Fetch a new list even if the cached one is
+                still within cache_ttl
 
         Returns:
             List of WindowInfo objects
@@ -173,37 +1117,46 @@ class WindowManager:
             >>> for win in wm.list_windows():
             ...     print(f"{win.wm_class}: {win.title}")
         """
-        response = self._dbus_call("List")
-        if not response:
-            return []
+        windows = self._windows(force_refresh)
+        if current_workspace_only:
+            return [w for w in windows if w.in_current_workspace]
+        return list(windows)
+
+    def _windows(self, force_refresh: bool = False) -> List[WindowInfo]:
+        """The cached window list itself (not a copy), fetched if stale"""
+        if not force_refresh and self._cache_fresh():
+            return self._list_cache[1]
+        now_ns = time.monotonic_ns()
+        windows = self._fetch_windows()
+        self._list_cache = (now_ns, windows)
+        return windows
+
+    def _classes(self, windows: List[WindowInfo]) -> Dict[str, WindowInfo]:
+        """
+        First window of each distinct wm_class (lowercased), in list order
 
-        windows_data = self._parse_json_response(response)
+        Built once per window list. Windows of one app share a class, so
+        class searches scan far fewer entries than there are windows, and
+        the first class containing a query still belongs to the first
+        window whose class contains it.
+        """
+        if self._class_index is None or self._class_index[0] is not windows:
+            index: Dict[str, WindowInfo] = {}
+            for window in windows:
+                index.setdefault(window.wm_class_ci, window)
+            self._class_index = (windows, index)
+        return self._class_index[1]
+
+    def _fetch_windows(self) -> List[WindowInfo]:
+        """Fetch the window list from the extension (one D-Bus List call)"""
+        windows_data = self._json_call("List")
         if not windows_data:
             return []
 
-        windows = []
-        for data in windows_data:
-            if current_workspace_only and not data.get('in_current_workspace', False):
-                continue
-
-            windows.append(WindowInfo(
-                id=data['id'],
-                wm_class=data.get('wm_class', ''),
-                wm_class_instance=data.get('wm_class_instance', ''),
-                title=data.get('title', ''),
-                pid=data.get('pid', 0),
-                x=data.get('x', 0),
-                y=data.get('y', 0),
-                width=data.get('width', 0),
-                height=data.get('height', 0),
-                workspace=data.get('workspace', 0),
-                monitor=data.get('monitor', 0),
-                frame_type=data.get('frame_type', 0),
-                window_type=data.get('window_type', 0),
-                focus=data.get('focus', False),
-                in_current_workspace=data.get('in_current_workspace', False),
-                maximized=data.get('maximized', 0)
-            ))
+        # One slot per entry up front
+        windows: List[WindowInfo] = [None] * len(windows_data)
+        for i, data in enumerate(windows_data):
+            windows[i] = WindowInfo.from_dict(data)
 
         return windows
 
@@ -211,6 +1164,10 @@ class WindowManager:
         """
         Find a window by wm_class or title
 
+        While the cached window list is fresh it is scanned; otherwise the
+        search runs inside the Shell when Eval is available (only the match
+        crosses the bus), falling back to a List call.
+
         Args:
             query: Search string (case-insensitive)
             match_title: Also search in window titles (slower)
@@ -224,26 +1181,66 @@ class WindowManager:
             >>> if editor:
             ...     wm.activate(editor.id)
         """
-        windows = self.list_windows()
+        if not self._cache_fresh():
+            found = self._find_server_side(self._SELECT_FIRST, query, match_title)
+            if found is not None:
+                return found[0] if found else None
+
+        windows = self._windows()
         query_lower = query.lower()
 
-        # First try wm_class (fast)
-        for window in windows:
-            if query_lower in window.wm_class.lower():
-                return window
+        # wm_class first: each distinct class is tested once, in list order
+        for wm_class, first in self._classes(windows).items():
+            if query_lower in wm_class:
+                return first
 
-        # Then try titles if enabled
         if match_title:
             for window in windows:
-                if query_lower in window.title.lower():
+                if query_lower in window.title_ci:
                     return window
-
         return None
 
+    def find_any(self, terms: List[str], match_title: bool = True) -> List[WindowInfo]:
+        """
+        Find the first window for each of several queries
+
+        Same matching rules as find_window(), but all terms are resolved
+        against a single window list.
+
+        Args:
+            terms: Search strings (case-insensitive)
+            match_title: Also search in window titles
+
+        Returns:
+            Matching WindowInfo objects in term order, without duplicates;
+            terms with no match are skipped
+
+        Example:
+            >>> wm.find_any(["text-editor", "terminal", "firefox"])
+        """
+        windows = self._windows()
+        classes = self._classes(windows)
+
+        found = []
+        seen = set()
+        for term in terms:
+            term_lower = term.lower()
+            window = next((w for c, w in classes.items() if term_lower in c), None)
+            if window is None and match_title:
+                window = next((w for w in windows if term_lower in w.title_ci), None)
+            if window is not None and window.id not in seen:
+                seen.add(window.id)
+                found.append(window)
+
+        return found
+
     def find_all_windows(self, query: str, match_title: bool = True) -> List[WindowInfo]:
         """
         Find all windows matching query
 
+        Filtered inside the Shell when Eval is available and the cached
+        window list is stale, like find_window().
+
         Args:
             query: Search string (case-insensitive)
             match_title: Also search in window titles
@@ -251,26 +1248,65 @@ class WindowManager:
         Returns:
             List of matching WindowInfo objects
         """
-        windows = self.list_windows()
+        if not self._cache_fresh():
+            found = self._find_server_side(self._SELECT_ALL, query, match_title)
+            if found is not None:
+                return found
+
+        return self.find_all_windows_matcher(self.build_matcher(query, match_title))
+
+    @staticmethod
+    def build_matcher(query: str, match_title: bool = True) -> Callable[[WindowInfo], bool]:
+        """
+        Precompile a find_all_windows() query
+
+        The query is lowercased once and tested against the cached
+        WindowInfo.wm_class_ci / title_ci, so reusing the matcher costs no
+        string work beyond the substring tests.
+
+        Args:
+            query: Search string (case-insensitive)
+            match_title: Also search in window titles
+
+        Returns:
+            A predicate taking a WindowInfo
+
+        Example:
+            >>> is_chrome = WindowManager.build_matcher("chrome")
+            >>> wm.close_all([w.id for w in wm.find_all_windows_matcher(is_chrome)])
+        """
         query_lower = query.lower()
-        matches = []
+        if match_title:
+            return lambda w: query_lower in w.wm_class_ci or query_lower in w.title_ci
+        return lambda w: query_lower in w.wm_class_ci
+
+    def find_all_windows_matcher(self, matcher: Callable[[WindowInfo], bool]) -> List[WindowInfo]:
+        """
+        Find all windows accepted by a predicate (e.g. from build_matcher())
 
-        for window in windows:
-            if (query_lower in window.wm_class.lower() or
-                (match_title and query_lower in window.title.lower())):
-                matches.append(window)
+        Always scans the (cached) window list; no server-side filtering.
 
-        return matches
+        Returns:
+            List of matching WindowInfo objects
+        """
+        return [w for w in self.list_windows() if matcher(w)]
 
     def get_focused_window(self) -> Optional[WindowInfo]:
         """
         Get currently focused window
 
+        Asks the Shell directly when Eval is available and the cached
+        window list is stale, like find_window().
+
         Returns:
             WindowInfo of focused window or None
         """
-        windows = self.list_windows()
-        for window in windows:
+        if not self._cache_fresh():
+            found = self._find_server_side(self._SELECT_FOCUSED)
+            if found is not None:
+                return found[0] if found else None
+
+        for window in self._windows():
             if window.focus:
                 return window
         return None
@@ -285,10 +1321,7 @@ class WindowManager:
         Returns:
             Dictionary with detailed window properties
         """
-        response = self._dbus_call("Details", window_id)
-        if not response:
-            return None
-        return self._parse_json_response(response)
+        return self._json_call("Details", window_id)
 
     def get_title(self, window_id: int) -> Optional[str]:
         """
@@ -300,57 +1333,75 @@ class WindowManager:
         Returns:
             Window title string or None
         """
-        response = self._dbus_call("GetTitle", window_id)
-        if not response:
+        result = self._dbus_call("GetTitle", window_id)
+        if not result:
             return None
-        # Response format: ('title',)
-        if response.startswith("('") and response.endswith("',)"):
-            return response[2:-3]
-        return None
+        return result[0]
 
     # ==================== Window State Management ====================
 
-    def activate(self, window_id: int) -> bool:
+    def activate(self, window_id: int, wait: bool = False, timeout: float = 1.0,
+                 await_ack: bool = True) -> bool:
         """
         Activate (focus) a window
 
         Args:
             window_id: Window ID
+            wait: Block until the window actually has focus
+            timeout: Maximum time to wait for focus in seconds
+            await_ack: Wait for the extension's reply; False sends the call
+                and returns at once (True then only means it was sent)
 
         Returns:
-            True if successful
-        """
-        response = self._dbus_call("Activate", window_id)
-        return response is not None
+            True if successful (with wait=True: the window has focus)
 
-    def maximize(self, window_id: int) -> bool:
+        Example:
+            >>> wm.activate(editor.id, wait=True)  # instead of activate() + sleep
+        """
+        if not self._call_and_invalidate("Activate", window_id, await_ack=await_ack):
+            return False
+        if not wait or self._batch is not None:
+            return True
+
+        # Window Calls emits no focus signal; poll until focus lands, which
+        # usually takes a few tens of milliseconds
+        deadline_ns = time.monotonic_ns() + int(timeout * 1_000_000_000)
+        while True:
+            windows = self._fetch_windows()
+            now_ns = time.monotonic_ns()
+            self._list_cache = (now_ns, windows)
+            for window in windows:
+                if window.focus:
+                    if window.id == window_id:
+                        return True
+                    break
+            if now_ns >= deadline_ns:
+                return False
+            time.sleep(self.FOCUS_POLL_INTERVAL)
+
+    def maximize(self, window_id: int, await_ack: bool = True) -> bool:
         """Maximize a window"""
-        response = self._dbus_call("Maximize", window_id)
-        return response is not None
+        return self._call_and_invalidate("Maximize", window_id, await_ack=await_ack)
 
-    def unmaximize(self, window_id: int) -> bool:
+    def unmaximize(self, window_id: int, await_ack: bool = True) -> bool:
         """Unmaximize a window"""
-        response = self._dbus_call("Unmaximize", window_id)
-        return response is not None
+        return self._call_and_invalidate("Unmaximize", window_id, await_ack=await_ack)
 
-    def minimize(self, window_id: int) -> bool:
+    def minimize(self, window_id: int, await_ack: bool = True) -> bool:
         """Minimize a window"""
-        response = self._dbus_call("Minimize", window_id)
-        return response is not None
+        return self._call_and_invalidate("Minimize", window_id, await_ack=await_ack)
 
-    def unminimize(self, window_id: int) -> bool:
+    def unminimize(self, window_id: int, await_ack: bool = True) -> bool:
         """Unminimize (restore) a window"""
-        response = self._dbus_call("Unminimize", window_id)
-        return response is not None
+        return self._call_and_invalidate("Unminimize", window_id, await_ack=await_ack)
 
-    def close(self, window_id: int) -> bool:
+    def close(self, window_id: int, await_ack: bool = True) -> bool:
         """Close a window"""
-        response = self._dbus_call("Close", window_id)
-        return response is not None
+        return self._call_and_invalidate("Close", window_id, await_ack=await_ack)
 
     # ==================== Window Positioning ====================
 
-    def move(self, window_id: int, x: int, y: int) -> bool:
+    def move(self, window_id: int, x: int, y: int, await_ack: bool = True) -> bool:
         """
         Move window to position
 
@@ -358,14 +1409,15 @@ class WindowManager:
             window_id: Window ID
             x: X coordinate (can be negative)
             y: Y coordinate (can be negative)
+            await_ack: Wait for the extension's reply; False sends the call
+                and returns at once (True then only means it was sent)
 
         Returns:
             True if successful
         """
-        response = self._dbus_call("Move", window_id, x, y)
-        return response is not None
+        return self._call_and_invalidate("Move", window_id, x, y, await_ack=await_ack)
 
-    def resize(self, window_id: int, width: int, height: int) -> bool:
+    def resize(self, window_id: int, width: int, height: int, await_ack: bool = True) -> bool:
         """
         Resize window
 
@@ -373,15 +1425,16 @@ class WindowManager:
             window_id: Window ID
             width: New width in pixels
             height: New height in pixels
+            await_ack: Wait for the extension's reply; False sends the call
+                and returns at once (True then only means it was sent)
 
         Returns:
             True if successful
         """
-        response = self._dbus_call("Resize", window_id, width, height)
-        return response is not None
+        return self._call_and_invalidate("Resize", window_id, width, height, await_ack=await_ack)
 
     def move_resize(self, window_id: int, x: int, y: int,
-                    width: int, height: int) -> bool:
+                    width: int, height: int, await_ack: bool = True) -> bool:
         """
         Move and resize window in one operation
 
@@ -391,12 +1444,14 @@ class WindowManager:
             y: Y coordinate
             width: Width in pixels
             height: Height in pixels
+            await_ack: Wait for the extension's reply; False sends the call
+                and returns at once (True then only means it was sent)
 
         Returns:
             True if successful
         """
-        response = self._dbus_call("MoveResize", window_id, x, y, width, height)
-        return response is not None
+        return self._call_and_invalidate("MoveResize", window_id, x, y, width, height,
+                                         await_ack=await_ack)
 
     def get_frame_rect(self, window_id: int) -> Optional[Dict]:
         """
@@ -408,10 +1463,30 @@ class WindowManager:
         Returns:
             Dictionary with x, y, width, height or None
         """
-        response = self._dbus_call("GetFrameRect", window_id)
-        if not response:
+        return self._json_call("GetFrameRect", window_id)
+
+    def get_frame_rect_xy(self, window_id: int) -> Optional[Tuple[int, int]]:
+        """
+        Get just the position of a window's frame
+
+        Cheaper than get_frame_rect() for hot loops (e.g. tracking a
+        window every frame): x and y are picked out of the reply text
+        without decoding the whole JSON object.
+
+        Args:
+            window_id: Window ID
+
+        Returns:
+            (x, y) or None
+        """
+        result = self._dbus_call("GetFrameRect", window_id)
+        if not result:
+            return None
+        x = _FRAME_X.search(result[0])
+        y = _FRAME_Y.search(result[0])
+        if x is None or y is None:
             return None
-        return self._parse_json_response(response)
+        return int(x.group(1)), int(y.group(1))
 
     def get_frame_bounds(self, window_id: int) -> Optional[Dict]:
         """
@@ -423,39 +1498,173 @@ class WindowManager:
         Returns:
             Dictionary with frame bounds or None
         """
-        response = self._dbus_call("GetFrameBounds", window_id)
-        if not response:
-            return None
-        return self._parse_json_response(response)
+        return self._json_call("GetFrameBounds", window_id)
 
     # ==================== Workspace Management ====================
 
-    def move_to_workspace(self, window_id: int, workspace_num: int) -> bool:
+    def move_to_workspace(self, window_id: int, workspace_num: int,
+                          await_ack: bool = True) -> bool:
         """
         Move window to different workspace
 
         Args:
             window_id: Window ID
             workspace_num: Target workspace number (0-indexed)
+            await_ack: Wait for the extension's reply; False sends the call
+                and returns at once (True then only means it was sent)
 
         Returns:
             True if successful
         """
-        response = self._dbus_call("MoveToWorkspace", window_id, workspace_num)
-        return response is not None
+        return self._call_and_invalidate("MoveToWorkspace", window_id, workspace_num,
+                                         await_ack=await_ack)
+
+
+def _async_twin(method, mutates: bool = False):
+    """
+    Coroutine version of a WindowManager method, run on the worker threads
+
+    Args:
+        mutates: The method changes windows; the other workers' cached
+            window lists are dropped after it runs
+    """
+    @wraps(method)
+    async def twin(self, *args, **kwargs):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(self._run, method, mutates, args, kwargs)
+        )
+    return twin
+
+
+class AsyncWindowManager:
+    """
+    asyncio front end for WindowManager
+
+    Every query and window operation has an ``async`` twin with the same
+    arguments. Calls run on a small thread pool, so independent calls
+    awaited together with asyncio.gather() are in flight at the same time
+    instead of one after another.
+
+    WindowManager is not thread-safe, so each worker thread has its own
+    (with its own window list cache and a private GLib main context); they
+    share the process's session bus connection. A window operation drops
+    every worker's cached list, so a later query never sees the state from
+    before it.
+
+    Example:
+        >>> async with AsyncWindowManager() as awm:
+        ...     editor, focused = await asyncio.gather(
+        ...         awm.find_window("Text Editor"), awm.get_focused_window())
+        ...     await awm.activate(editor.id)
+    """
+
+    def __init__(self, max_workers: int = 4, **kwargs):
+        """
+        Initialize AsyncWindowManager
+
+        Args:
+            max_workers: Calls that can be in flight at once
+            **kwargs: Arguments for each worker's WindowManager
+                (timeout, cache_ttl)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._wm_kwargs = kwargs
+        self._local = threading.local()
+        # Every worker's WindowManager, for invalidation
+        self._managers: List[WindowManager] = []
+        self._managers_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="open-alo-wm",
+                                            initializer=self._init_worker)
+
+    def _init_worker(self) -> None:
+        """Set up a worker thread: its own WindowManager and main context"""
+        # Replies to concurrent calls (batch(), apply()) are dispatched to
+        # the thread-default context; with a private one per thread,
+        # workers never contend for the global default context
+        gio = _gio()
+        if gio is not None:
+            gio[1].MainContext.new().push_thread_default()
+
+        wm = WindowManager(**self._wm_kwargs)
+        self._local.wm = wm
+        with self._managers_lock:
+            self._managers.append(wm)
+
+    def _run(self, method, mutates: bool, args: tuple, kwargs: dict):
+        """Run ``method`` on this worker's WindowManager"""
+        try:
+            return method(self._local.wm, *args, **kwargs)
+        finally:
+            if mutates:
+                with self._managers_lock:
+                    managers = list(self._managers)
+                for wm in managers:
+                    wm.invalidate()
+
+    async def __aenter__(self) -> "AsyncWindowManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.shutdown()
+        return False
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (after calls already submitted finish)"""
+        self._executor.shutdown(wait=True)
+
+    list_windows = _async_twin(WindowManager.list_windows)
+    find_window = _async_twin(WindowManager.find_window)
+    find_any = _async_twin(WindowManager.find_any)
+    find_all_windows = _async_twin(WindowManager.find_all_windows)
+    find_all_windows_matcher = _async_twin(WindowManager.find_all_windows_matcher)
+    get_focused_window = _async_twin(WindowManager.get_focused_window)
+    get_details = _async_twin(WindowManager.get_details)
+    get_title = _async_twin(WindowManager.get_title)
+    activate = _async_twin(WindowManager.activate, mutates=True)
+    maximize = _async_twin(WindowManager.maximize, mutates=True)
+    unmaximize = _async_twin(WindowManager.unmaximize, mutates=True)
+    minimize = _async_twin(WindowManager.minimize, mutates=True)
+    unminimize = _async_twin(WindowManager.unminimize, mutates=True)
+    close = _async_twin(WindowManager.close, mutates=True)
+    move = _async_twin(WindowManager.move, mutates=True)
+    resize = _async_twin(WindowManager.resize, mutates=True)
+    move_resize = _async_twin(WindowManager.move_resize, mutates=True)
+    get_frame_rect = _async_twin(WindowManager.get_frame_rect)
+    get_frame_rect_xy = _async_twin(WindowManager.get_frame_rect_xy)
+    get_frame_bounds = _async_twin(WindowManager.get_frame_bounds)
+    move_to_workspace = _async_twin(WindowManager.move_to_workspace, mutates=True)
+    apply = _async_twin(WindowManager.apply, mutates=True)
+    tile = _async_twin(WindowManager.tile, mutates=True)
+    close_all = _async_twin(WindowManager.close_all, mutates=True)
 
 
 # ==================== Convenience Functions ====================
 
+@lru_cache(maxsize=1)
+def _get_wm(timeout: int = 5) -> WindowManager:
+    """WindowManager shared by the convenience functions (one bus connection, one extension check)"""
+    return WindowManager(timeout)
+
+
+def reset_wm_cache() -> None:
+    """Forget the shared WindowManager; the next convenience call creates a new one"""
+    _get_wm.cache_clear()
+
+
 def list_windows(current_workspace_only: bool = False) -> List[WindowInfo]:
     """Convenience function to list windows"""
-    wm = WindowManager()
+    wm = _get_wm()
     return wm.list_windows(current_workspace_only)
 
 
 def find_window(query: str, match_title: bool = True) -> Optional[WindowInfo]:
     """Convenience function to find a window"""
-    wm = WindowManager()
+    wm = _get_wm()
     return wm.find_window(query, match_title)
 
 
@@ -474,7 +1683,7 @@ def activate_window(query_or_id, **kwargs) -> bool:
         >>> activate_window("Text Editor")
         >>> activate_window(1290274482)
     """
-    wm = WindowManager()
+    wm = _get_wm()
 
     if isinstance(query_or_id, int):
         return wm.activate(query_or_id)
@@ -487,5 +1696,5 @@ def activate_window(query_or_id, **kwargs) -> bool:
 
 def get_focused_window() -> Optional[WindowInfo]:
     """Convenience function to get focused window"""
-    wm = WindowManager()
+    wm = _get_wm()
     return wm.get_focused_window()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Checks for the pure-Python helpers of open_alo_core
+
+Reply parsing, argument formatting, WindowInfo mapping, key names and
+pixel repacking. No PyGObject, portal or GNOME Shell session is needed.
+
+Run with pytest, or directly:
+    python tests/test_helpers.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from open_alo_core.types import Point, Rect, contains_any, normalize_key
+from open_alo_core.window_manager import WindowInfo, _format_arg, _loads, _parse_gdbus_reply
+from open_alo_core.wayland._pixels import bgrx_to_rgb
+
+
+# ==================== gdbus reply parsing ====================
+
+def test_parse_gdbus_reply_plain():
+    assert _parse_gdbus_reply(b"('[{\"id\": 1}]',)\n") == ('[{"id": 1}]',)
+    assert _parse_gdbus_reply(b'("it\'s",)') == ("it's",)
+
+
+def test_parse_gdbus_reply_escapes():
+    # GVariant text escapes quotes, backslashes and non-ASCII like Python
+    assert _parse_gdbus_reply(b"('a\\\\b \\'q\\'',)") == ("a\\b 'q'",)
+    assert _parse_gdbus_reply(b"('caf\\u00e9',)") == ("café",)
+
+
+def test_parse_gdbus_reply_no_value():
+    assert _parse_gdbus_reply(b"()") == ()
+    assert _parse_gdbus_reply(b"") == ()
+    assert _parse_gdbus_reply(b"(true, 'x')") == ()
+
+
+def test_parse_gdbus_reply_null_title():
+    reply = _parse_gdbus_reply(b"('[{\"id\": 7, \"wm_class\": null, \"title\": null}]',)")
+    window = WindowInfo.from_dict(_loads(reply[0])[0])
+    assert window.id == 7
+    assert window.wm_class == "" and window.title == ""
+    assert window.title_ci == ""
+
+
+# ==================== gdbus argument formatting ====================
+
+def test_format_arg_typed_integers():
+    assert _format_arg(5, 'u') == "uint32 5"
+    assert _format_arg(-3, 'i') == "int32 -3"
+    assert _format_arg(2 ** 40, 't') == f"uint64 {2 ** 40}"
+
+
+def test_format_arg_string_quoting():
+    assert _format_arg("it's a \\ test", 's') == "'it\\'s a \\\\ test'"
+
+
+# ==================== WindowInfo ====================
+
+def test_from_dict_field_mapping():
+    data = {
+        'id': 42, 'wm_class': 'Firefox', 'wm_class_instance': 'Navigator',
+        'title': 'Mozilla Firefox', 'pid': 1234, 'x': 10, 'y': 20,
+        'width': 800, 'height': 600, 'workspace': 1, 'monitor': 0,
+        'frame_type': 0, 'window_type': 0, 'focus': True,
+        'in_current_workspace': True, 'maximized': 3,
+    }
+    window = WindowInfo.from_dict(data)
+    for name, value in data.items():
+        assert getattr(window, name) == value, name
+    assert window.wm_class_ci == 'firefox'
+    assert window.title_ci == 'mozilla firefox'
+
+
+def test_from_dict_defaults():
+    window = WindowInfo.from_dict({'id': 1})
+    assert (window.wm_class, window.title, window.pid) == ('', '', 0)
+    assert window.focus is False and window.in_current_workspace is False
+
+
+def test_from_dict_interns_class():
+    a = WindowInfo.from_dict({'id': 1, 'wm_class': ''.join(['gnome-', 'terminal'])})
+    b = WindowInfo.from_dict({'id': 2, 'wm_class': ''.join(['gnome-', 'terminal'])})
+    assert a.wm_class is b.wm_class
+
+
+# ==================== Key names ====================
+
+def test_normalize_key_aliases():
+    assert normalize_key("enter") == "Return"
+    assert normalize_key("CTRL") == "Control"
+    assert normalize_key("Esc") == "Escape"
+    assert normalize_key("cmd") == "Super"
+
+
+def test_normalize_key_passthrough():
+    assert normalize_key("Return") == "Return"
+    assert normalize_key("a") == "a"
+    assert normalize_key("F5") == "F5"
+
+
+# ==================== Geometry ====================
+
+def test_contains_any():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return  # optional: open-alo-core[numpy]
+    rects = [Rect(0, 0, 100, 100), Rect(50, 50, 10, 10), Rect(200, 0, 5, 5)]
+    assert contains_any(rects, Point(55, 55)).tolist() == [True, True, False]
+    assert contains_any(rects, Point(100, 100)).tolist() == [True, False, False]
+
+
+# ==================== Pixels ====================
+
+def test_bgrx_to_rgb_byte_order():
+    # Two pixels: B=1 G=2 R=3, then B=4 G=5 R=6 (x bytes ignored)
+    assert bgrx_to_rgb(bytes([1, 2, 3, 0xFF, 4, 5, 6, 0xFF]), 2, 1, 8) == bytes([3, 2, 1, 6, 5, 4])
+
+
+def test_bgrx_to_rgb_padded_stride():
+    # 1x2 frame, rows padded to 8 bytes
+    data = bytes([1, 2, 3, 0, 9, 9, 9, 9,
+                  4, 5, 6, 0, 9, 9, 9, 9])
+    assert bgrx_to_rgb(memoryview(data), 1, 2, 8) == bytes([3, 2, 1, 6, 5, 4])
+
+
+if __name__ == "__main__":
+    failed = 0
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            try:
+                test()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failed += 1
+                print(f"❌ {name}: {e}")
+    sys.exit(1 if failed else 0)
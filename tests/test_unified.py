@@ -108,7 +108,7 @@ try:
         print("   Testing screenshot capture...")
         screenshot = remote.capture_screenshot()
         if screenshot:
-            test_file = Path("/tmp/unified_test_screenshot.png")
+            test_file = Path("/tmp/unified_test_screenshot.jpg")
             test_file.write_bytes(screenshot)
             print(f"   ✅ Screenshot saved: {test_file}")
             print(f"   Size: {len(screenshot):,} bytes")
@@ -129,7 +129,7 @@ try:
             time.sleep(0.2)
 
         if frame:
-            frame_file = Path("/tmp/unified_test_frame.png")
+            frame_file = Path("/tmp/unified_test_frame.jpg")
             frame_file.write_bytes(frame)
             print(f"   ✅ Frame captured: {frame_file}")
             print(f"   Size: {len(frame):,} bytes")
@@ -191,6 +191,6 @@ print("     - Keyboard control")
 print("     - Clean shutdown")
 print()
 print("Files created:")
-print("  - /tmp/unified_test_screenshot.png")
-print("  - /tmp/unified_test_frame.png")
+print("  - /tmp/unified_test_screenshot.jpg")
+print("  - /tmp/unified_test_frame.jpg")
 print()